@@ -0,0 +1,75 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark tests for the input pipeline cost of sample weighting."""
+
+import time
+
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+from keras.engine import data_adapter
+
+
+class ClassWeightBenchmark(tf.test.Benchmark):
+  """Tracks the `DataHandler` cost of `class_weight` and `sample_weight`."""
+
+  def _benchmark_weighting(self, name, class_weight=False, sample_weight=False,
+                           num_samples=64000, batch_size=32, num_iters=3):
+    x = np.random.random((num_samples, 16)).astype('float32')
+    y = np.random.randint(0, 4, (num_samples,))
+    kwargs = {}
+    if class_weight:
+      kwargs['class_weight'] = {0: 1., 1: 2., 2: 0.5, 3: 3.}
+    if sample_weight:
+      kwargs['sample_weight'] = np.random.random(num_samples)
+
+    wall_times = []
+    for _ in range(num_iters):
+      # The setup of the `DataHandler` is timed as well, since it processes
+      # the weights of all the samples.
+      start = time.time()
+      data_handler = data_adapter.DataHandler(
+          x, y, batch_size=batch_size, **kwargs)
+      for _, iterator in data_handler.enumerate_epochs():
+        for _ in data_handler.steps():
+          next(iterator)
+      wall_times.append(time.time() - start)
+
+    wall_time = min(wall_times)
+    self.report_benchmark(
+        iters=num_iters,
+        wall_time=wall_time,
+        metrics=[{
+            'name': 'batches_per_second',
+            'value': data_handler.inferred_steps / wall_time
+        }],
+        name=name)
+
+  def benchmark_no_weighting(self):
+    self._benchmark_weighting('no_weighting')
+
+  def benchmark_class_weight(self):
+    self._benchmark_weighting('class_weight', class_weight=True)
+
+  def benchmark_sample_weight(self):
+    self._benchmark_weighting('sample_weight', sample_weight=True)
+
+  def benchmark_class_and_sample_weight(self):
+    self._benchmark_weighting(
+        'class_and_sample_weight', class_weight=True, sample_weight=True)
+
+
+if __name__ == '__main__':
+  tf.test.main()
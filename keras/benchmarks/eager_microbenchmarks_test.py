@@ -101,6 +101,46 @@ class MicroBenchmarksBase(tf.test.Benchmark):
 
     self._run(fn, 10000)
 
+  def benchmark_layers_call_overhead_fast_inference(self):
+
+    class OnlyOverheadLayer(tf.keras.layers.Layer):
+
+      def call(self, x):
+        return x
+
+    layer = OnlyOverheadLayer()
+    x = tf.convert_to_tensor([[1.]])
+
+    def fn():
+      layer(x)  # pylint: disable=not-callable
+
+    tf.keras.layers.enable_fast_inference_calls()
+    try:
+      self._run(fn, 10000)
+    finally:
+      tf.keras.layers.disable_fast_inference_calls()
+
+  def _deep_model_call_overhead(self, fast_inference_calls):
+    model_input = tf.keras.Input(shape=(8,))
+    model_output = model_input
+    for _ in range(20):
+      model_output = tf.keras.layers.Dense(8, activation="relu")(model_output)
+    model = tf.keras.Model(inputs=model_input, outputs=model_output)
+    model.fast_inference_calls = fast_inference_calls
+    x = tf.ones((1, 8))
+
+    def fn():
+      model(x)  # pylint: disable=not-callable
+
+    fn()
+    self._run(fn, 1000)
+
+  def benchmark_deep_model_call_overhead(self):
+    self._deep_model_call_overhead(fast_inference_calls=False)
+
+  def benchmark_deep_model_call_overhead_fast_inference(self):
+    self._deep_model_call_overhead(fast_inference_calls=True)
+
   def benchmark_op_layer_call_overhead(self):
     model_input = tf.keras.Input(shape=(1,))
     model_output = model_input
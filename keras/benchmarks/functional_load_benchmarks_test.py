@@ -0,0 +1,67 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark tests for reconstructing functional models from their config."""
+
+import time
+
+import tensorflow.compat.v2 as tf
+
+import keras
+
+
+class FunctionalLoadBenchmark(tf.test.Benchmark):
+  """Tracks `Model.from_config` time against the number of nodes."""
+
+  def _make_model(self, num_nodes):
+    # A residual chain: every block adds a branch node and a merge node, so
+    # that the reconstruction has to resolve nodes with several inbound nodes.
+    inputs = keras.Input(shape=(8,))
+    x = inputs
+    for _ in range(num_nodes // 2):
+      y = keras.layers.Activation('relu')(x)
+      x = keras.layers.Add()([x, y])
+    return keras.Model(inputs, x)
+
+  def _benchmark_from_config(self, num_nodes, num_iters=3):
+    config = self._make_model(num_nodes).get_config()
+    wall_times = []
+    for _ in range(num_iters):
+      start = time.time()
+      keras.Model.from_config(config)
+      wall_times.append(time.time() - start)
+      keras.backend.clear_session()
+
+    wall_time = min(wall_times)
+    self.report_benchmark(
+        iters=num_iters,
+        wall_time=wall_time,
+        metrics=[{
+            'name': 'nodes_per_second',
+            'value': num_nodes / wall_time
+        }],
+        name='functional_from_config_%d_nodes' % num_nodes)
+
+  def benchmark_from_config_100_nodes(self):
+    self._benchmark_from_config(100)
+
+  def benchmark_from_config_1000_nodes(self):
+    self._benchmark_from_config(1000)
+
+  def benchmark_from_config_5000_nodes(self):
+    self._benchmark_from_config(5000, num_iters=1)
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -0,0 +1,74 @@
+# Copyright 2022 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Benchmark tests for the augmentations of `ImageDataGenerator`."""
+
+import time
+
+import numpy as np
+import tensorflow.compat.v2 as tf
+
+from keras.preprocessing import image
+
+
+class ImageDataGeneratorBenchmark(tf.test.Benchmark):
+  """Compares the per-image and batched transforms of `ImageDataGenerator`."""
+
+  def _benchmark_flow(self, batch_transform, image_size, batch_size=32,
+                      num_batches=20):
+    generator = image.ImageDataGenerator(
+        rotation_range=20,
+        width_shift_range=0.1,
+        height_shift_range=0.1,
+        shear_range=10,
+        zoom_range=0.1,
+        horizontal_flip=True,
+        batch_transform=batch_transform)
+    x = np.random.random((batch_size * num_batches,) + image_size + (3,))
+    iterator = generator.flow(x, batch_size=batch_size, seed=1)
+    # Warm up.
+    next(iterator)
+
+    start = time.time()
+    for _ in range(num_batches):
+      next(iterator)
+    wall_time = time.time() - start
+
+    name = 'image_data_generator_%s_%dx%d' % (
+        'batched' if batch_transform else 'per_image',
+        image_size[0], image_size[1])
+    self.report_benchmark(
+        iters=num_batches,
+        wall_time=wall_time / num_batches,
+        metrics=[{
+            'name': 'images_per_second',
+            'value': batch_size * num_batches / wall_time
+        }],
+        name=name)
+
+  def benchmark_per_image_transform_64x64(self):
+    self._benchmark_flow(batch_transform=False, image_size=(64, 64))
+
+  def benchmark_batch_transform_64x64(self):
+    self._benchmark_flow(batch_transform=True, image_size=(64, 64))
+
+  def benchmark_per_image_transform_224x224(self):
+    self._benchmark_flow(batch_transform=False, image_size=(224, 224))
+
+  def benchmark_batch_transform_224x224(self):
+    self._benchmark_flow(batch_transform=True, image_size=(224, 224))
+
+
+if __name__ == '__main__':
+  tf.test.main()
@@ -14,9 +14,17 @@
 # ==============================================================================
 """Benchmark tests for Keras optimizers."""
 
+import timeit
+
 import tensorflow.compat.v2 as tf
 
 from keras.benchmarks import benchmark_util
+from keras.optimizers.optimizer_experimental import adadelta as adadelta_experimental
+from keras.optimizers.optimizer_experimental import adagrad as adagrad_experimental
+from keras.optimizers.optimizer_experimental import adam as adam_experimental
+from keras.optimizers.optimizer_experimental import adamw as adamw_experimental
+from keras.optimizers.optimizer_experimental import rmsprop as rmsprop_experimental
+from keras.optimizers.optimizer_experimental import sgd as sgd_experimental
 from keras.optimizers.optimizer_v2 import adam
 from tensorflow.python.platform.benchmark import ParameterizedBenchmark
 
@@ -79,5 +87,66 @@ class KerasOptimizerBenchmark(
         iters=num_iters, wall_time=wall_time, metrics=metrics, extras=extras)
 
 
+def many_variables_config(num_variables=1000, shape=(64,)):
+  """Many small variables, as found in deep models with per-layer biases."""
+  variables = [
+      tf.Variable(tf.random.normal(shape)) for _ in range(num_variables)
+  ]
+  grads = [tf.random.normal(shape) for _ in range(num_variables)]
+  return variables, grads
+
+
+class KerasExperimentalOptimizerStepTimeBenchmark(
+    tf.test.Benchmark, metaclass=ParameterizedBenchmark):
+  """Step time of the experimental optimizers, with and without `fused`."""
+
+  # The parameter of each benchmark test is a tuple, and the first one is
+  # the optimizer name.
+  _benchmark_parameters = [
+      (f"{name}_{'fused' if fused else 'unfused'}", optimizer_cls, fused, 20)
+      for name, optimizer_cls in [
+          ("Adam", adam_experimental.Adam),
+          ("AdamW", adamw_experimental.AdamW),
+          ("SGD", sgd_experimental.SGD),
+          ("RMSprop", rmsprop_experimental.RMSprop),
+          ("Adagrad", adagrad_experimental.Adagrad),
+          ("Adadelta", adadelta_experimental.Adadelta),
+      ]
+      for fused in (False, True)
+  ]
+
+  def benchmark_apply_gradients(self, optimizer_cls, fused, num_iters):
+    """Measures `apply_gradients` on 1000 small variables.
+
+    Args:
+      optimizer_cls: The experimental optimizer class to be benchmarked.
+      fused: Value of the `fused` argument of the optimizer.
+      num_iters: The number of iterations to run for performance measurement.
+    """
+    variables, grads = many_variables_config()
+    optimizer = optimizer_cls(fused=fused)
+
+    @tf.function
+    def train_step():
+      optimizer.apply_gradients(zip(grads, variables))
+
+    # Build the optimizer variables and trace the function.
+    train_step()
+    start_time = timeit.default_timer()
+    for _ in range(num_iters):
+      train_step()
+    step_time = (timeit.default_timer() - start_time) / num_iters
+
+    name = benchmark_util.get_benchmark_name(self._get_name())
+    extras = {
+        "implementation": name[0],
+        "model_name": "optimizers",
+        "parameters": "1000_variables",
+        "step_time": step_time,
+    }
+    self.report_benchmark(
+        iters=num_iters, wall_time=step_time, extras=extras)
+
+
 if __name__ == "__main__":
   tf.test.main()
@@ -17,13 +17,17 @@
 """Callbacks: utilities called at certain points during model training."""
 
 import collections
+import concurrent.futures
 import copy
 import csv
+import functools
+import io
 import json
 import os
 import re
 import sys
 import time
+import uuid
 
 
 from keras import backend
@@ -45,11 +49,20 @@ from tensorflow.python.util import deprecation  # pylint: disable=g-direct-tenso
 from tensorflow.python.util.tf_export import keras_export
 from tensorflow.tools.docs import doc_controls
 
+try:
+  import h5py
+except ImportError:
+  h5py = None
+
 try:
   import requests
 except ImportError:
   requests = None
 
+# `hdf5_format` depends on the engine, which depends on this module.
+hdf5_format = generic_utils.LazyLoader(
+    'hdf5_format', globals(), 'keras.saving.hdf5_format')
+
 
 # Note: `configure_callbacks` is only used in TF1.
 def configure_callbacks(callbacks,
@@ -188,6 +201,7 @@ class CallbackList:
                add_history=False,
                add_progbar=False,
                model=None,
+               batch_hook_interval=None,
                **params):
     """Container for `Callback` instances.
 
@@ -195,6 +209,12 @@ class CallbackList:
     to call them all at once via a single endpoint
     (e.g. `callback_list.on_epoch_end(...)`).
 
+    The batch hooks of each callback are called on every
+    `callback.batch_hook_frequency`-th batch, and at most every
+    `batch_hook_interval` seconds if set. Throttling batch hooks avoids
+    syncing `logs` to NumPy on every batch for models with cheap steps. See
+    `Callback` for how callbacks can receive the logs of skipped batches.
+
     Args:
       callbacks: List of `Callback` instances.
       add_history: Whether a `History` callback should be added, if one does not
@@ -202,9 +222,18 @@ class CallbackList:
       add_progbar: Whether a `ProgbarLogger` callback should be added, if one
         does not already exist in the `callbacks` list.
       model: The `Model` these callbacks are used with.
+      batch_hook_interval: Optional minimum number of seconds between two calls
+        of the batch hooks of a callback.
       **params: If provided, parameters will be passed to each `Callback` via
         `Callback.set_params`.
     """
+    if batch_hook_interval is not None and batch_hook_interval < 0:
+      raise ValueError('Expected `batch_hook_interval` to be a non-negative '
+                       f'number of seconds. Received: {batch_hook_interval}')
+    self._batch_hook_interval = batch_hook_interval
+    # Maps `(mode, id(callback))` to the `_BatchHookThrottle` selecting the
+    # batches the batch hooks of `callback` are called on in `mode`.
+    self._batch_hook_throttles = {}
     self.callbacks = tf.nest.flatten(callbacks) if callbacks else []
     self._add_default_callbacks(add_history, add_progbar)
 
@@ -231,6 +260,17 @@ class CallbackList:
         cb._implements_predict_batch_hooks() for cb in self.callbacks)
     # pylint: enable=protected-access
 
+    # Callbacks receiving the timings of each batch (see `StepProfiler`).
+    self._step_timing_callbacks = [
+        cb for cb in self.callbacks
+        if getattr(cb, '_records_step_timing', False)
+    ]
+    self._step_start_times = None
+    # The `DataHandler` of each mode, and its data wait and production times
+    # at the end of the last batch.
+    self._data_handlers = {}
+    self._data_times = {}
+
     self._disallow_batch_hooks_in_ps_strategy()
 
     # Performance check: Check batch hooks for slowness compared to batch time.
@@ -286,6 +326,12 @@ class CallbackList:
     for callback in self.callbacks:
       callback.set_model(model)
 
+  def _set_data_handler(self, mode, data_handler):
+    """Sets the `DataHandler` whose data times are reported in `mode`."""
+    self._data_handlers[mode] = data_handler
+    self._data_times[mode] = (data_handler.data_wait_time,
+                              data_handler.data_production_time)
+
   def _call_batch_hook(self, mode, hook, batch, logs=None):
     """Helper function for all batch_{begin | end} methods."""
     if not self.callbacks:
@@ -302,20 +348,29 @@ class CallbackList:
   def _call_batch_begin_hook(self, mode, batch, logs):
     """Helper function for `on_*_batch_begin` methods."""
     hook_name = 'on_{mode}_batch_begin'.format(mode=mode)
-    self._call_batch_hook_helper(hook_name, batch, logs)
+    if self._step_timing_callbacks:
+      begin_time = time.time()
+    self._call_batch_hook_helper(hook_name, batch, logs, mode=mode)
 
     if self._check_timing:
       self._batch_start_time = time.time()
+    if self._step_timing_callbacks:
+      self._step_start_times = (begin_time, time.time())
 
   def _call_batch_end_hook(self, mode, batch, logs):
     """Helper function for `on_*_batch_end` methods."""
     hook_name = 'on_{mode}_batch_end'.format(mode=mode)
+    if self._step_timing_callbacks:
+      end_hook_start_time = time.time()
 
     if self._check_timing and batch >= 1:
       batch_time = time.time() - self._batch_start_time
       self._batch_times.append(batch_time)
 
-    self._call_batch_hook_helper(hook_name, batch, logs)
+    self._call_batch_hook_helper(hook_name, batch, logs, mode=mode)
+
+    if self._step_timing_callbacks and self._step_start_times is not None:
+      self._record_step_timing(mode, batch, end_hook_start_time)
 
     if len(self._batch_times) >= self._num_batches_for_timing_check:
       end_hook_name = hook_name
@@ -345,21 +400,111 @@ class CallbackList:
       self._batch_times = []
       self._hook_times = {}
 
-  def _call_batch_hook_helper(self, hook_name, batch, logs):
+  def _record_step_timing(self, mode, batch, end_hook_start_time):
+    """Passes the timings of the batch that just ended to the callbacks."""
+    end_time = time.time()
+    begin_time, begin_hook_end_time = self._step_start_times
+    self._step_start_times = None
+
+    data_wait_time = None
+    data_production_time = None
+    data_handler = self._data_handlers.get(mode)
+    if data_handler is not None:
+      data_times = (data_handler.data_wait_time,
+                    data_handler.data_production_time)
+      data_wait_time, data_production_time = (
+          total - previous
+          for total, previous in zip(data_times, self._data_times[mode]))
+      self._data_times[mode] = data_times
+
+    timing = {
+        'step_time': end_time - begin_time,
+        'data_wait_time': data_wait_time,
+        'data_production_time': data_production_time,
+        'function_time': end_hook_start_time - begin_hook_end_time,
+        'callback_time': ((begin_hook_end_time - begin_time) +
+                          (end_time - end_hook_start_time)),
+    }
+    for callback in self._step_timing_callbacks:
+      callback._on_step_timing(mode, batch, timing)  # pylint: disable=protected-access
+
+  def _call_batch_hook_helper(self, hook_name, batch, logs,
+                              mode=ModeKeys.TRAIN):
     """Helper function for `on_*_batch_*` methods."""
     if self._check_timing:
       start_time = time.time()
 
-    logs = self._process_logs(logs, is_batch_hook=True)
+    is_end_hook = hook_name.endswith('_end')
+    # Logs are only processed if a hook is called with them.
+    processed_logs = None
     for callback in self.callbacks:
       hook = getattr(callback, hook_name)
-      hook(batch, logs)
+      throttle = self._get_batch_hook_throttle(mode, callback)
+      if throttle is None:
+        if processed_logs is None:
+          processed_logs = self._process_logs(logs, is_batch_hook=True)
+        hook(batch, processed_logs)
+      elif is_end_hook:
+        should_call, callback_logs = throttle.end_batch(batch, logs)
+        if should_call:
+          if callback_logs is logs:
+            if processed_logs is None:
+              processed_logs = self._process_logs(logs, is_batch_hook=True)
+            callback_logs = processed_logs
+          else:
+            callback_logs = self._process_logs(callback_logs,
+                                               is_batch_hook=True)
+          hook(batch, callback_logs)
+      elif throttle.begin_batch():
+        if processed_logs is None:
+          processed_logs = self._process_logs(logs, is_batch_hook=True)
+        hook(batch, processed_logs)
 
     if self._check_timing:
       if hook_name not in self._hook_times:
         self._hook_times[hook_name] = []
       self._hook_times[hook_name].append(time.time() - start_time)
 
+  def _get_batch_hook_throttle(self, mode, callback):
+    """Returns the `_BatchHookThrottle` of `callback`, or None if unneeded."""
+    frequency = getattr(callback, 'batch_hook_frequency', 1)
+    aggregate = getattr(callback, 'aggregate_batch_logs', False)
+    if frequency == 1 and not aggregate and not self._batch_hook_interval:
+      return None
+    key = (mode, id(callback))
+    throttle = self._batch_hook_throttles.get(key)
+    if throttle is None or not throttle.has_settings(frequency, aggregate):
+      if not isinstance(frequency, int) or frequency < 1:
+        raise ValueError(
+            'Expected `batch_hook_frequency` to be a positive integer. '
+            f'Received: {frequency} for callback {callback}')
+      throttle = _BatchHookThrottle(frequency, self._batch_hook_interval,
+                                    aggregate)
+      self._batch_hook_throttles[key] = throttle
+    return throttle
+
+  def _flush_batch_hooks(self, mode):
+    """Ends the current epoch of the throttling of batch hooks in `mode`.
+
+    Callbacks aggregating batch logs get the logs of the batches their
+    `on_{mode}_batch_end` hook has not been called with yet.
+
+    Args:
+      mode: One of `ModeKeys.TRAIN`, `ModeKeys.TEST` or `ModeKeys.PREDICT`.
+    """
+    if not self._batch_hook_throttles:
+      return
+    hook_name = 'on_{mode}_batch_end'.format(mode=mode)
+    for callback in self.callbacks:
+      throttle = self._batch_hook_throttles.get((mode, id(callback)))
+      if throttle is None:
+        continue
+      pending = throttle.end_epoch()
+      if pending is not None:
+        batch, logs = pending
+        hook = getattr(callback, hook_name)
+        hook(batch, self._process_logs(logs, is_batch_hook=True))
+
   def _call_begin_hook(self, mode):
     """Helper function for on_{train|test|predict}_begin methods."""
     if mode == ModeKeys.TRAIN:
@@ -411,6 +556,7 @@ class CallbackList:
           validation epoch if validation is performed. Validation result keys
           are prefixed with `val_`.
     """
+    self._flush_batch_hooks(ModeKeys.TRAIN)
     logs = self._process_logs(logs)
     for callback in self.callbacks:
       callback.on_epoch_end(epoch, logs)
@@ -521,6 +667,7 @@ class CallbackList:
         logs: Dict. Currently, no data is passed via this argument
           for this method, but that may change in the future.
     """
+    self._flush_batch_hooks(ModeKeys.TEST)
     logs = self._process_logs(logs)
     for callback in self.callbacks:
       callback.on_test_end(logs)
@@ -543,6 +690,7 @@ class CallbackList:
         logs: Dict. Currently, no data is passed via this argument
           for this method, but that may change in the future.
     """
+    self._flush_batch_hooks(ModeKeys.PREDICT)
     logs = self._process_logs(logs)
     for callback in self.callbacks:
       callback.on_predict_end(logs)
@@ -572,6 +720,77 @@ class CallbackList:
     # pylint: enable=protected-access
 
 
+class _BatchHookThrottle:
+  """Selects the batches on which the batch hooks of a callback are called.
+
+  Hooks are called on every `frequency`-th batch, and at most every `interval`
+  seconds if set. The begin and end hooks of a batch are either both called or
+  both skipped. When `aggregate` is True, the end hook is called with a dict
+  mapping each key of the logs to the list of its values over the batches
+  since the previous call.
+  """
+
+  def __init__(self, frequency, interval, aggregate):
+    self._frequency = frequency
+    self._interval = interval
+    self._aggregate = aggregate
+    self._num_batches = 0
+    self._last_call_time = None
+    # Whether the hooks of the current batch are called, once decided.
+    self._call_current_batch = None
+    self._last_batch = None
+    self._window = []
+
+  def _should_call(self):
+    if self._call_current_batch is None:
+      self._num_batches += 1
+      should_call = self._num_batches % self._frequency == 0
+      if should_call and self._interval:
+        now = time.time()
+        should_call = (self._last_call_time is None or
+                       now - self._last_call_time >= self._interval)
+        if should_call:
+          self._last_call_time = now
+      self._call_current_batch = should_call
+    return self._call_current_batch
+
+  def has_settings(self, frequency, aggregate):
+    return self._frequency == frequency and self._aggregate == aggregate
+
+  def begin_batch(self):
+    """Returns whether to call the begin hook of the current batch."""
+    return self._should_call()
+
+  def end_batch(self, batch, logs):
+    """Returns whether to call the end hook, and the logs to call it with."""
+    should_call = self._should_call()
+    self._call_current_batch = None
+    if not self._aggregate:
+      return should_call, logs
+    self._window.append(logs or {})
+    self._last_batch = batch
+    if not should_call:
+      return False, None
+    return True, self._pop_window()[1]
+
+  def end_epoch(self):
+    """Starts counting batches anew, returning `_pop_window()`."""
+    self._num_batches = 0
+    self._call_current_batch = None
+    return self._pop_window()
+
+  def _pop_window(self):
+    """Returns the last batch and the aggregated logs not passed yet, if any."""
+    if not self._window:
+      return None
+    logs = {}
+    for batch_logs in self._window:
+      for key, value in batch_logs.items():
+        logs.setdefault(key, []).append(value)
+    self._window = []
+    return self._last_batch, logs
+
+
 @keras_export('keras.callbacks.Callback')
 class Callback:
   """Abstract base class used to build new callbacks.
@@ -626,6 +845,15 @@ class Callback:
           (eg. verbosity, batch size, number of epochs...).
       model: Instance of `keras.models.Model`.
           Reference of the model being trained.
+      batch_hook_frequency: Integer, defaults to 1. The batch hooks of the
+          callback are only called on every `batch_hook_frequency`-th batch
+          of an epoch, skipping the others. Setting this avoids syncing the
+          batch `logs` to NumPy on every batch for models with cheap steps.
+      aggregate_batch_logs: Boolean, defaults to False. If True, the logs passed
+          to the `on_*_batch_end` hooks map each key to the list of its values
+          over the batches since the previous call of the hook, instead of its
+          value for the current batch only. The logs of the remaining batches
+          are passed at the end of the epoch, evaluation or prediction.
 
   The `logs` dictionary that callback methods
   take as argument will contain keys for quantities relevant to
@@ -635,6 +863,8 @@ class Callback:
   def __init__(self):
     self.validation_data = None  # pylint: disable=g-missing-from-attributes
     self.model = None
+    self.batch_hook_frequency = 1
+    self.aggregate_batch_logs = False
     # Whether this Callback should only run on the chief worker in a
     # Multi-Worker setting.
     # TODO(omalleyt): Make this attr public once solution is stable.
@@ -962,12 +1192,21 @@ class ProgbarLogger(Callback):
           Metrics in this list will be logged as-is.
           All others will be averaged over time (e.g. loss, etc).
           If not provided, defaults to the `Model`'s metrics.
+      interval: Minimum interval (in seconds) between two updates of the
+          progress bar. Batch logs are not fetched from the device for the
+          batches in between.
+      output_format: One of `"text"` or `"json"`. With `"json"`, progress is
+          written as one JSON object per line (see `tf.keras.utils.Progbar`).
 
   Raises:
-      ValueError: In case of invalid `count_mode`.
+      ValueError: In case of invalid `count_mode` or `output_format`.
   """
 
-  def __init__(self, count_mode='samples', stateful_metrics=None):
+  def __init__(self,
+               count_mode='samples',
+               stateful_metrics=None,
+               interval=0.05,
+               output_format='text'):
     super(ProgbarLogger, self).__init__()
     self._supports_tf_logs = True
     if count_mode == 'samples':
@@ -978,8 +1217,14 @@ class ProgbarLogger(Callback):
       raise ValueError(
           f'Unknown `count_mode`: {count_mode}. '
           'Expected values are ["samples", "steps"]')
+    if output_format not in ('text', 'json'):
+      raise ValueError(
+          f'Unknown `output_format`: {output_format}. '
+          'Expected values are ["text", "json"]')
     # Defaults to all Model's metrics except for loss.
     self.stateful_metrics = set(stateful_metrics) if stateful_metrics else set()
+    self.interval = interval
+    self.output_format = output_format
 
     self.seen = 0
     self.progbar = None
@@ -1073,7 +1318,9 @@ class ProgbarLogger(Callback):
           target=self.target,
           verbose=self.verbose,
           stateful_metrics=self.stateful_metrics,
-          unit_name='step' if self.use_steps else 'sample')
+          interval=self.interval,
+          unit_name='step' if self.use_steps else 'sample',
+          output_format=self.output_format)
 
     self.progbar._update_stateful_metrics(self.stateful_metrics)  # pylint: disable=protected-access
 
@@ -1102,7 +1349,12 @@ class ProgbarLogger(Callback):
       self.seen += add_seen
 
     if self.verbose == 1:
-      # Only block async when verbose = 1.
+      # Only block async when verbose = 1, and only when the progress bar is
+      # going to be rendered. Non-stateful values are always fetched, since the
+      # progress bar keeps a running average of them.
+      if (not self.progbar._should_render() and  # pylint: disable=protected-access
+          self.stateful_metrics.issuperset(logs)):
+        return
       logs = tf_utils.sync_to_numpy_or_python_type(logs)
       self.progbar.update(self.seen, list(logs.items()), finalize=False)
 
@@ -1260,6 +1512,16 @@ class ModelCheckpoint(Callback):
         to be monitored. Only applies if `save_best_value=True`. Only overwrites
         the model weights already saved if the performance of current
         model is better than this value.
+      save_async: if True, the model is serialized into host memory on the
+        training thread and written to `filepath` on a background thread, so
+        that training resumes before the write completes. Call `wait()` to
+        block until all pending writes have finished; this is done
+        automatically at the end of training. Errors raised while writing are
+        re-raised by the next save or by `wait()`.
+      max_pending_saves: Integer, the maximum number of checkpoints that may be
+        held in memory while waiting to be written when `save_async=True`.
+        Once this many writes are pending, the next save blocks until the
+        oldest one completes. Defaults to 1.
       **kwargs: Additional arguments for backwards compatibility. Possible key
         is `period`.
   """
@@ -1274,6 +1536,8 @@ class ModelCheckpoint(Callback):
                save_freq='epoch',
                options=None,
                initial_value_threshold=None,
+               save_async=False,
+               max_pending_saves=1,
                **kwargs):
     super(ModelCheckpoint, self).__init__()
     self._supports_tf_logs = True
@@ -1287,6 +1551,15 @@ class ModelCheckpoint(Callback):
     self._batches_seen_since_last_saving = 0
     self._last_batch_seen = 0
     self.best = initial_value_threshold
+    self.save_async = save_async
+    self.max_pending_saves = max_pending_saves
+    self._executor = None
+    self._pending_saves = collections.deque()
+
+    if not isinstance(max_pending_saves, int) or max_pending_saves < 1:
+      raise ValueError(
+          '`max_pending_saves` must be a positive integer. '
+          f'Received: max_pending_saves={max_pending_saves}')
 
     if save_weights_only:
       if options is None or isinstance(
@@ -1371,6 +1644,26 @@ class ModelCheckpoint(Callback):
           raise ValueError(
               f'Error loading file from {filepath_to_load}. Reason: {e}')
 
+  def on_train_end(self, logs=None):
+    self.wait()
+
+  def wait(self):
+    """Blocks until all pending asynchronous saves have been written.
+
+    Only has an effect when the callback was created with `save_async=True`.
+
+    Raises:
+        Any error raised while writing a pending checkpoint.
+    """
+    try:
+      self._collect_pending_saves(max_pending=0)
+    finally:
+      # After an error, still wait for the remaining writes to complete.
+      if self._executor is not None:
+        self._executor.shutdown()
+        self._executor = None
+      self._pending_saves.clear()
+
   def _implements_train_batch_hooks(self):
     # Only call batch hooks when saving on batch
     return self.save_freq != 'epoch'
@@ -1437,11 +1730,7 @@ class ModelCheckpoint(Callback):
                     f'from {self.best:.5f} to {current:.5f}, '
                     f'saving model to {filepath}')
               self.best = current
-              if self.save_weights_only:
-                self.model.save_weights(
-                    filepath, overwrite=True, options=self._options)
-              else:
-                self.model.save(filepath, overwrite=True, options=self._options)
+              self._save_to(filepath)
             else:
               if self.verbose > 0:
                 io_utils.print_msg(
@@ -1451,11 +1740,7 @@ class ModelCheckpoint(Callback):
           if self.verbose > 0:
             io_utils.print_msg(
                 f'\nEpoch {epoch + 1}: saving model to {filepath}')
-          if self.save_weights_only:
-            self.model.save_weights(
-                filepath, overwrite=True, options=self._options)
-          else:
-            self.model.save(filepath, overwrite=True, options=self._options)
+          self._save_to(filepath)
 
         self._maybe_remove_file()
       except IsADirectoryError as e:  # h5py 3.x
@@ -1471,6 +1756,68 @@ class ModelCheckpoint(Callback):
         # Re-throw the error for any other causes.
         raise e
 
+  def _save_to(self, filepath):
+    """Saves the model or its weights to `filepath`."""
+    if self.save_async:
+      self._save_to_async(filepath)
+    elif self.save_weights_only:
+      self.model.save_weights(filepath, overwrite=True, options=self._options)
+    else:
+      self.model.save(filepath, overwrite=True, options=self._options)
+
+  def _save_to_async(self, filepath):
+    """Serializes the model into memory and writes it in the background.
+
+    TensorFlow checkpoints and SavedModels are staged in the in-memory
+    `ram://` filesystem, HDF5 files in an in-memory `h5py.File`. Serializing
+    reads the current variable values, so it happens on the training thread;
+    only the write to `filepath` is deferred.
+
+    Args:
+        filepath: the path to save to.
+    """
+    # Bound the number of checkpoints held in memory.
+    self._collect_pending_saves(max_pending=self.max_pending_saves - 1)
+
+    if _is_hdf5_filepath(filepath):
+      if tf.io.gfile.isdir(filepath):
+        raise IsADirectoryError(filepath)
+      if h5py is None:
+        raise ImportError('`ModelCheckpoint` requires h5py when saving in '
+                          'hdf5, but h5py is not available. Try installing '
+                          'h5py package.')
+      buffer = io.BytesIO()
+      with h5py.File(buffer, 'w') as f:
+        if self.save_weights_only:
+          hdf5_format.save_weights_to_hdf5_group(f, self.model)
+        else:
+          self.model.save(f, overwrite=True, options=self._options)
+      write_fn = functools.partial(
+          _write_bytes, buffer.getvalue(), filepath)
+    else:
+      staging_dir = 'ram://{}'.format(uuid.uuid4())
+      staging_path = os.path.join(staging_dir, os.path.basename(filepath))
+      if self.save_weights_only:
+        self.model.save_weights(
+            staging_path, overwrite=True, options=self._options)
+      else:
+        self.model.save(staging_path, overwrite=True, options=self._options)
+      write_fn = functools.partial(
+          _move_dir_contents, staging_dir, os.path.dirname(filepath))
+    self._submit_async(write_fn)
+
+  def _submit_async(self, fn):
+    if self._executor is None:
+      self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+    self._pending_saves.append(self._executor.submit(fn))
+
+  def _collect_pending_saves(self, max_pending):
+    """Waits until at most `max_pending` saves are pending."""
+    while self._pending_saves and (len(self._pending_saves) > max_pending or
+                                   self._pending_saves[0].done()):
+      # Re-raises any error raised by the write.
+      self._pending_saves.popleft().result()
+
   def _get_file_path(self, epoch, batch, logs):
     """Returns the file path for checkpoint."""
     # pylint: disable=protected-access
@@ -1495,8 +1842,14 @@ class ModelCheckpoint(Callback):
     # Remove the checkpoint directory in multi-worker training where this worker
     # should not checkpoint. It is a dummy directory previously saved for sync
     # distributed training.
-    distributed_file_utils.remove_temp_dir_with_filepath(
+    remove_fn = functools.partial(
+        distributed_file_utils.remove_temp_dir_with_filepath,
         self._write_filepath, self.model.distribute_strategy)
+    if self._pending_saves:
+      # The directory may still be written to by a pending save.
+      self._submit_async(remove_fn)
+    else:
+      remove_fn()
 
   def _checkpoint_exists(self, filepath):
     """Returns whether the checkpoint `filepath` refers to exists."""
@@ -1599,6 +1952,34 @@ class ModelCheckpoint(Callback):
       return file_path_with_largest_file_name
 
 
+def _is_hdf5_filepath(filepath):
+  return filepath.endswith(('.h5', '.keras', '.hdf5'))
+
+
+def _write_bytes(data, filepath):
+  """Writes `data` to `filepath`, creating its directory if needed."""
+  dirpath = os.path.dirname(filepath)
+  if dirpath and not tf.io.gfile.exists(dirpath):
+    tf.io.gfile.makedirs(dirpath)
+  with tf.io.gfile.GFile(filepath, 'wb') as f:
+    f.write(data)
+
+
+def _move_dir_contents(src_dir, dst_dir):
+  """Copies the files under `src_dir` into `dst_dir`, then removes it."""
+  for root, _, filenames in tf.io.gfile.walk(src_dir):
+    relpath = os.path.relpath(root, src_dir)
+    target_dir = dst_dir if relpath == '.' else os.path.join(dst_dir, relpath)
+    if target_dir:
+      tf.io.gfile.makedirs(target_dir)
+    for filename in filenames:
+      tf.io.gfile.copy(
+          os.path.join(root, filename),
+          os.path.join(target_dir, filename),
+          overwrite=True)
+  tf.io.gfile.rmtree(src_dir)
+
+
 @keras_export('keras.callbacks.BackupAndRestore', v1=[])
 class BackupAndRestore(Callback):
   """Callback to back up and restore the training state.
@@ -2848,6 +3229,201 @@ class CSVLogger(Callback):
     self.writer = None
 
 
+@keras_export('keras.callbacks.experimental.StepProfiler', v1=[])
+class StepProfiler(Callback):
+  """Callback that records the time spent in each training step.
+
+  This is a lightweight alternative to profiling with the `TensorBoard`
+  callback, meant to tell whether training is limited by the input pipeline,
+  by the model or by the callbacks. For every training step (or every
+  execution, with `steps_per_execution > 1`), it records:
+
+  - `step_time`: The wall time of the step, from the start of the
+    `on_train_batch_begin` hooks to the end of the `on_train_batch_end` hooks.
+  - `data_wait_time`: The time the host was blocked waiting for input, as
+    reported by the `DataHandler` of `Model.fit` (see below).
+  - `data_production_time`: The wall time spent producing input batches in
+    Python (see below).
+  - `function_time`: The time spent in the train function, between the batch
+    hooks.
+  - `callback_time`: The time spent in the batch hooks of all callbacks.
+
+  The timings of the last `buffer_size` steps are kept in a ring buffer. At the
+  end of each epoch, their percentiles and a stall report naming the likely
+  bottleneck are printed.
+
+  The data wait time covers the creation of the dataset iterators. Waiting for
+  the next batch happens inside of the train function and is part of the
+  function time; to break the function time down further, use the
+  `TensorBoard` profiler. For Python generators and `keras.utils.Sequence`
+  inputs, the data production time is the time spent producing batches. It
+  is only reported: the batches are prefetched, so their production overlaps
+  with the train function, and it is not counted as time stalled on input.
+
+  Example:
+
+  >>> model = tf.keras.Sequential([tf.keras.layers.Dense(1)])
+  >>> model.compile(loss='mse')
+  >>> profiler = tf.keras.callbacks.experimental.StepProfiler(verbose=0)
+  >>> history = model.fit(np.ones((32, 2)), np.ones((32, 1)), batch_size=4,
+  ...                     epochs=2, callbacks=[profiler], verbose=0)
+  >>> profiler.recorded_steps
+  15
+  >>> sorted(profiler.summary()['step_time'])
+  ['mean', 'p50', 'p90', 'p99']
+
+  Args:
+    buffer_size: Number of most recent steps whose timings are kept.
+    percentiles: Iterable of the percentiles to report, between 0 and 100.
+    warmup_steps: Number of initial steps of each call to `fit` that are not
+      recorded, e.g. because they include tracing the train function.
+    stall_threshold: Fraction of the step time above which a step counts as
+      stalled on its input. The input pipeline or the callbacks are reported as
+      the bottleneck when the data wait time or the callback time are more than
+      this fraction of the total step time.
+    verbose: Verbosity mode, 0 or 1. With 1, the stall report is printed at
+      the end of each epoch.
+  """
+
+  def __init__(self,
+               buffer_size=1000,
+               percentiles=(50, 90, 99),
+               warmup_steps=1,
+               stall_threshold=0.3,
+               verbose=1):
+    super(StepProfiler, self).__init__()
+    if buffer_size < 1:
+      raise ValueError('Expected `buffer_size` to be a positive integer. '
+                       f'Received: buffer_size={buffer_size}')
+    percentiles = tuple(percentiles)
+    if any(p < 0 or p > 100 for p in percentiles):
+      raise ValueError('Expected `percentiles` to be between 0 and 100. '
+                       f'Received: percentiles={percentiles}')
+    self.buffer_size = buffer_size
+    self.percentiles = percentiles
+    self.warmup_steps = warmup_steps
+    self.stall_threshold = stall_threshold
+    self.verbose = verbose
+    self._supports_tf_logs = True
+    self._records_step_timing = True
+    self._reset()
+
+  def _reset(self):
+    # One row per step and one column per entry of `_STEP_TIMINGS`. Timings
+    # that are not measured are stored as NaN.
+    self._timings = np.zeros((self.buffer_size, len(_STEP_TIMINGS)))
+    self._num_steps = 0
+    self._warmup_steps_left = self.warmup_steps
+
+  @property
+  def recorded_steps(self):
+    """The number of steps currently held in the ring buffer."""
+    return min(self._num_steps, self.buffer_size)
+
+  def on_train_begin(self, logs=None):
+    self._reset()
+
+  def on_epoch_end(self, epoch, logs=None):
+    if self.verbose:
+      io_utils.print_msg(self.stall_report())
+
+  def _implements_train_batch_hooks(self):
+    return True
+
+  def _on_step_timing(self, mode, batch, timing):
+    """Records the timings of a batch, called by `CallbackList`."""
+    del batch
+    if mode != ModeKeys.TRAIN:
+      return
+    if self._warmup_steps_left > 0:
+      self._warmup_steps_left -= 1
+      return
+    row = self._timings[self._num_steps % self.buffer_size]
+    for i, name in enumerate(_STEP_TIMINGS):
+      value = timing[name]
+      row[i] = np.nan if value is None else value
+    self._num_steps += 1
+
+  def _recorded_timings(self):
+    return self._timings[:self.recorded_steps]
+
+  def summary(self):
+    """Returns statistics of the recorded step timings.
+
+    Returns:
+      A dict mapping each of `step_time`, `data_wait_time`, `function_time`,
+      `callback_time` and `data_production_time` to a dict with the `mean`
+      and the percentiles (e.g. `p90`) of that timing in seconds, or to None
+      if it was not measured. Empty if no step was recorded.
+    """
+    timings = self._recorded_timings()
+    if not len(timings):  # pylint: disable=g-explicit-length-test
+      return {}
+    summary = {}
+    for i, name in enumerate(_STEP_TIMINGS):
+      column = timings[:, i]
+      if np.isnan(column).all():
+        summary[name] = None
+        continue
+      stats = {'mean': float(np.nanmean(column))}
+      for p, value in zip(self.percentiles,
+                          np.nanpercentile(column, self.percentiles)):
+        stats['p%g' % p] = float(value)
+      summary[name] = stats
+    return summary
+
+  def stall_report(self):
+    """Returns a printable report of the step timings and the bottleneck."""
+    timings = self._recorded_timings()
+    num_steps = len(timings)
+    if not num_steps:
+      return 'StepProfiler: no steps recorded.'
+
+    summary = self.summary()
+    total_step_time = timings[:, 0].sum()
+    lines = ['StepProfiler: last %d steps' % num_steps]
+    fractions = {}
+    for i, name in enumerate(_STEP_TIMINGS):
+      stats = summary[name]
+      if stats is None:
+        lines.append('  %-22s not measured' % (name + ':'))
+        continue
+      info = ' - '.join('%s %s' % (key, _format_duration(value))
+                        for key, value in stats.items())
+      if i > 0 and total_step_time > 0:
+        fractions[name] = np.nansum(timings[:, i]) / total_step_time
+        info += ' (%.1f%% of step time)' % (100 * fractions[name])
+      lines.append('  %-22s %s' % (name + ':', info))
+
+    if 'data_wait_time' in fractions:
+      stalled_steps = np.sum(
+          timings[:, 1] > self.stall_threshold * timings[:, 0])
+      lines.append('  Steps stalled on input: %d/%d' %
+                   (stalled_steps, num_steps))
+    if fractions.get('data_wait_time', 0.) > self.stall_threshold:
+      bottleneck = 'the input pipeline'
+    elif fractions.get('callback_time', 0.) > self.stall_threshold:
+      bottleneck = 'the callbacks'
+    else:
+      bottleneck = 'the train function'
+    lines.append('  Likely bottleneck: %s.' % bottleneck)
+    return '\n'.join(lines)
+
+
+# The timings recorded by `StepProfiler`, in the order of its buffer columns.
+# The data production time overlaps with the others, and is only reported.
+_STEP_TIMINGS = ('step_time', 'data_wait_time', 'function_time',
+                 'callback_time', 'data_production_time')
+
+
+def _format_duration(seconds):
+  if seconds >= 1:
+    return '%.2fs' % seconds
+  if seconds >= 1e-3:
+    return '%.1fms' % (seconds * 1e3)
+  return '%.0fus' % (seconds * 1e6)
+
+
 @keras_export('keras.callbacks.LambdaCallback')
 class LambdaCallback(Callback):
   r"""Callback for creating simple, custom callbacks on-the-fly.
@@ -1245,6 +1245,93 @@ class KerasCallbacksTest(test_combinations.TestCase):
                                 'filepath.*'):
       model.fit(train_ds, epochs=1, callbacks=[callback])
 
+  @parameterized.named_parameters(
+      ('weights_tf', True, 'checkpoint.epoch{epoch:02d}'),
+      ('weights_h5', True, 'checkpoint.epoch{epoch:02d}.h5'),
+      ('model_tf', False, 'model.epoch{epoch:02d}'),
+      ('model_h5', False, 'model.epoch{epoch:02d}.h5'))
+  def test_ModelCheckpoint_save_async(self, save_weights_only, file_name):
+    (model, train_ds, _,
+     _) = self._get_dummy_resource_for_model_checkpoint_testing()
+    temp_dir = self.get_temp_dir()
+    self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+    filepath = os.path.join(temp_dir, 'ckpt', file_name)
+    callback = keras.callbacks.ModelCheckpoint(
+        filepath=filepath,
+        save_weights_only=save_weights_only,
+        save_async=True,
+        max_pending_saves=2)
+
+    model.fit(train_ds, epochs=3, callbacks=[callback])
+    # Pending saves are flushed at the end of training.
+    self.assertEmpty(callback._pending_saves)
+    self.assertIsNone(callback._executor)
+
+    for epoch in range(1, 4):
+      self.assertTrue(
+          callback._checkpoint_exists(filepath.format(epoch=epoch)))
+    last_filepath = filepath.format(epoch=3)
+    if save_weights_only:
+      restored = self._get_dummy_resource_for_model_checkpoint_testing()[0]
+      restored.load_weights(last_filepath)
+    else:
+      restored = keras.models.load_model(
+          last_filepath, custom_objects={'Bias': test_utils.Bias})
+    self.assertAllClose(model.get_weights(), restored.get_weights())
+
+  def test_ModelCheckpoint_save_async_save_best_only(self):
+    (model, train_ds, _,
+     _) = self._get_dummy_resource_for_model_checkpoint_testing()
+    temp_dir = self.get_temp_dir()
+    self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+    filepath = os.path.join(temp_dir, 'checkpoint.epoch{epoch:02d}.h5')
+    # The loss of the bias model is positive and decreases monotonically, so
+    # no epoch improves on a threshold of 0.
+    callback = keras.callbacks.ModelCheckpoint(
+        filepath=filepath,
+        monitor='loss',
+        mode='min',
+        save_best_only=True,
+        save_weights_only=True,
+        save_async=True,
+        initial_value_threshold=0.)
+    model.fit(train_ds, epochs=2, callbacks=[callback])
+    self.assertFalse(callback._checkpoint_exists(filepath.format(epoch=1)))
+    self.assertFalse(callback._checkpoint_exists(filepath.format(epoch=2)))
+
+    callback = keras.callbacks.ModelCheckpoint(
+        filepath=filepath,
+        monitor='loss',
+        mode='min',
+        save_best_only=True,
+        save_weights_only=True,
+        save_async=True)
+    model.fit(train_ds, epochs=2, callbacks=[callback])
+    self.assertTrue(callback._checkpoint_exists(filepath.format(epoch=1)))
+    self.assertTrue(callback._checkpoint_exists(filepath.format(epoch=2)))
+
+  def test_ModelCheckpoint_save_async_raises_write_errors(self):
+    (model, train_ds, _,
+     _) = self._get_dummy_resource_for_model_checkpoint_testing()
+    filepath = os.path.join(self.get_temp_dir(), 'checkpoint.h5')
+    callback = keras.callbacks.ModelCheckpoint(
+        filepath=filepath, save_weights_only=True, save_async=True)
+
+    def failing_write(*args):
+      del args
+      raise OSError('Disk is full.')
+
+    with tf.compat.v1.test.mock.patch.object(
+        keras.callbacks, '_write_bytes', failing_write):
+      with self.assertRaisesRegex(OSError, 'Disk is full.'):
+        model.fit(train_ds, epochs=1, callbacks=[callback])
+    self.assertEmpty(callback._pending_saves)
+
+  def test_ModelCheckpoint_invalid_max_pending_saves(self):
+    with self.assertRaisesRegex(ValueError, 'must be a positive integer'):
+      keras.callbacks.ModelCheckpoint(
+          filepath=self.get_temp_dir(), save_async=True, max_pending_saves=0)
+
   def test_ModelCheckpoint_nonblocking(self):
     filepath = self.get_temp_dir()
     # Should only cause a sync block when saving is actually performed.
@@ -1336,6 +1423,159 @@ class KerasCallbacksTest(test_combinations.TestCase):
       cb_list.on_epoch_end(0, logs)
     cb_list.on_train_end(logs)
 
+  def test_ProgbarLogger_verbose_1_only_syncs_when_rendering(self):
+    callback = keras.callbacks.ProgbarLogger(count_mode='steps', interval=3600)
+    model = keras.Sequential([keras.layers.Dense(1)])
+    cb_list = keras.callbacks.CallbackList([callback],
+                                           model=model,
+                                           epochs=1,
+                                           steps=10,
+                                           verbose=1)
+    callback.stateful_metrics = {'metric'}
+    logs = {'metric': tf.convert_to_tensor(1.)}
+
+    with mock.patch.object(
+        keras.callbacks.tf_utils,
+        'sync_to_numpy_or_python_type',
+        wraps=keras.callbacks.tf_utils.sync_to_numpy_or_python_type
+    ) as mock_sync, self.captureWritesToStream(sys.stdout):
+      cb_list.on_train_begin()
+      cb_list.on_epoch_begin(0)
+      for batch in range(10):
+        cb_list.on_train_batch_begin(batch)
+        cb_list.on_train_batch_end(batch, logs)
+      # Only the first batch is rendered within the interval.
+      self.assertEqual(mock_sync.call_count, 1)
+      cb_list.on_epoch_end(0, logs)
+      self.assertEqual(mock_sync.call_count, 2)
+      cb_list.on_train_end()
+
+    # Values that the progress bar averages are always fetched.
+    callback.stateful_metrics = set()
+    callback._reset_progbar()
+    with mock.patch.object(
+        keras.callbacks.tf_utils,
+        'sync_to_numpy_or_python_type',
+        wraps=keras.callbacks.tf_utils.sync_to_numpy_or_python_type
+    ) as mock_sync, self.captureWritesToStream(sys.stdout):
+      for batch in range(3):
+        callback.on_train_batch_end(batch, logs)
+      self.assertEqual(mock_sync.call_count, 3)
+
+  def test_ProgbarLogger_json_output(self):
+    model = keras.Sequential([keras.layers.Dense(1, input_shape=(2,))])
+    model.compile('sgd', 'mse')
+    callback = keras.callbacks.ProgbarLogger(
+        count_mode='steps', output_format='json')
+    x, y = np.ones((20, 2)), np.ones((20, 1))
+    with self.captureWritesToStream(sys.stdout) as printed:
+      model.fit(x, y, batch_size=5, epochs=1, callbacks=[callback])
+    records = [json.loads(line) for line in printed.contents().splitlines()]
+    self.assertTrue(records[-1]['final'])
+    self.assertEqual(records[-1]['step'], 4)
+    self.assertIn('loss', records[-1]['metrics'])
+
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_StepProfiler(self):
+    model = keras.Sequential([keras.layers.Dense(1, input_shape=(2,))])
+    model.compile('sgd', 'mse', run_eagerly=test_utils.should_run_eagerly())
+    profiler = keras.callbacks.StepProfiler(
+        buffer_size=8, percentiles=(50, 90), verbose=0)
+    model.fit(
+        np.ones((40, 2)),
+        np.ones((40, 1)),
+        batch_size=4,
+        epochs=2,
+        callbacks=[profiler],
+        verbose=0)
+
+    # 19 steps are recorded after the warmup step, the last 8 are kept.
+    self.assertEqual(profiler._num_steps, 19)
+    self.assertEqual(profiler.recorded_steps, 8)
+    summary = profiler.summary()
+    self.assertEqual(
+        set(summary),
+        {'step_time', 'data_wait_time', 'function_time', 'callback_time',
+         'data_production_time'})
+    for stats in summary.values():
+      self.assertEqual(set(stats), {'mean', 'p50', 'p90'})
+      self.assertGreaterEqual(stats['p90'], stats['p50'])
+    self.assertLessEqual(summary['function_time']['mean'],
+                         summary['step_time']['mean'])
+
+  def test_StepProfiler_reports_input_bottleneck(self):
+    profiler = keras.callbacks.StepProfiler(warmup_steps=0)
+    for batch in range(4):
+      profiler._on_step_timing('train', batch, {
+          'step_time': 0.1,
+          'data_wait_time': 0.05 if batch < 3 else 0.,
+          'function_time': 0.04,
+          'callback_time': 0.01,
+          'data_production_time': 0.,
+      })
+    report = profiler.stall_report()
+    self.assertIn('StepProfiler: last 4 steps', report)
+    self.assertIn('Steps stalled on input: 3/4', report)
+    self.assertIn('Likely bottleneck: the input pipeline.', report)
+
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_StepProfiler_production_time_is_not_wait(self):
+
+    def generator():
+      while True:
+        time.sleep(0.03)
+        yield np.ones((4, 2)), np.ones((4, 1))
+
+    class SlowCallback(keras.callbacks.Callback):
+
+      def on_train_batch_end(self, batch, logs=None):
+        time.sleep(0.05)
+
+    model = keras.Sequential([keras.layers.Dense(1, input_shape=(2,))])
+    model.compile('sgd', 'mse', run_eagerly=test_utils.should_run_eagerly())
+    profiler = keras.callbacks.StepProfiler()
+    with self.captureWritesToStream(sys.stdout) as printed:
+      model.fit(
+          generator(),
+          steps_per_epoch=5,
+          epochs=1,
+          callbacks=[SlowCallback(), profiler],
+          verbose=0)
+    # The batches are produced while the callbacks run, so the training does
+    # not wait for them.
+    self.assertIn('Steps stalled on input: 0/4', printed.contents())
+    self.assertIn('Likely bottleneck: the callbacks.', printed.contents())
+    summary = profiler.summary()
+    self.assertGreater(summary['data_production_time']['p50'], 0.02)
+    self.assertLess(summary['data_wait_time']['p50'], 0.01)
+
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_StepProfiler_reports_callback_bottleneck(self):
+
+    class SlowCallback(keras.callbacks.Callback):
+
+      def on_train_batch_end(self, batch, logs=None):
+        time.sleep(0.05)
+
+    model = keras.Sequential([keras.layers.Dense(1, input_shape=(2,))])
+    model.compile('sgd', 'mse', run_eagerly=test_utils.should_run_eagerly())
+    profiler = keras.callbacks.StepProfiler(verbose=0)
+    model.fit(
+        np.ones((20, 2)),
+        np.ones((20, 1)),
+        batch_size=4,
+        callbacks=[SlowCallback(), profiler],
+        verbose=0)
+    self.assertIn('Likely bottleneck: the callbacks.', profiler.stall_report())
+
+  def test_StepProfiler_without_steps(self):
+    profiler = keras.callbacks.StepProfiler()
+    self.assertEqual(profiler.summary(), {})
+    self.assertEqual(profiler.stall_report(),
+                     'StepProfiler: no steps recorded.')
+    with self.assertRaisesRegex(ValueError, 'percentiles'):
+      keras.callbacks.StepProfiler(percentiles=(50, 101))
+
   def test_EarlyStopping(self):
     with self.cached_session():
       np.random.seed(123)
@@ -2038,6 +2278,76 @@ class KerasCallbacksTest(test_combinations.TestCase):
     model.evaluate(x, y, batch_size=10, callbacks=[my_cb], verbose=0)
     model.predict(x, batch_size=10, callbacks=[my_cb], verbose=0)
 
+  def _get_batch_hooks_recorder(self):
+
+    class BatchHooksRecorder(keras.callbacks.Callback):
+
+      def __init__(self):
+        super().__init__()
+        self.begin_batches = []
+        self.end_batches = []
+        self.end_logs = []
+
+      def on_train_batch_begin(self, batch, logs=None):
+        self.begin_batches.append(batch)
+
+      def on_train_batch_end(self, batch, logs=None):
+        self.end_batches.append(batch)
+        self.end_logs.append(logs)
+
+    return BatchHooksRecorder()
+
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_batch_hook_frequency(self):
+    x, y = np.ones((20, 1)), np.ones((20, 1))
+    model = keras.Sequential([keras.layers.Dense(1)])
+    model.compile('sgd', 'mse', run_eagerly=test_utils.should_run_eagerly())
+
+    recorder = self._get_batch_hooks_recorder()
+    recorder.batch_hook_frequency = 3
+    model.fit(x, y, epochs=2, batch_size=2, callbacks=[recorder], verbose=0)
+    self.assertEqual(recorder.begin_batches, [2, 5, 8, 2, 5, 8])
+    self.assertEqual(recorder.end_batches, [2, 5, 8, 2, 5, 8])
+    self.assertIsInstance(recorder.end_logs[0]['loss'], float)
+
+    recorder.batch_hook_frequency = 0
+    with self.assertRaisesRegex(ValueError, 'batch_hook_frequency'):
+      model.fit(x, y, epochs=1, batch_size=2, callbacks=[recorder], verbose=0)
+
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_aggregate_batch_logs(self):
+    x, y = np.ones((20, 1)), np.ones((20, 1))
+    model = keras.Sequential([keras.layers.Dense(1)])
+    model.compile('sgd', 'mse', run_eagerly=test_utils.should_run_eagerly())
+
+    recorder = self._get_batch_hooks_recorder()
+    recorder.batch_hook_frequency = 4
+    recorder.aggregate_batch_logs = True
+    model.fit(x, y, epochs=1, batch_size=2, callbacks=[recorder], verbose=0)
+    # The logs of the last two batches are passed at the end of the epoch.
+    self.assertEqual(recorder.begin_batches, [3, 7])
+    self.assertEqual(recorder.end_batches, [3, 7, 9])
+    self.assertEqual([len(logs['loss']) for logs in recorder.end_logs],
+                     [4, 4, 2])
+    self.assertIsInstance(recorder.end_logs[0]['loss'][0], float)
+
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_batch_hook_interval(self):
+    x, y = np.ones((20, 1)), np.ones((20, 1))
+    model = keras.Sequential([keras.layers.Dense(1)])
+    model.compile('sgd', 'mse', run_eagerly=test_utils.should_run_eagerly())
+
+    recorder = self._get_batch_hooks_recorder()
+    callbacks = keras.callbacks.CallbackList(
+        [recorder], add_history=True, model=model, batch_hook_interval=3600)
+    model.fit(x, y, epochs=2, batch_size=2, callbacks=callbacks, verbose=0)
+    # Only the hooks of the first batch are called within the interval.
+    self.assertEqual(recorder.begin_batches, [0])
+    self.assertEqual(recorder.end_batches, [0])
+
+    with self.assertRaisesRegex(ValueError, 'batch_hook_interval'):
+      keras.callbacks.CallbackList([recorder], batch_hook_interval=-1)
+
   @test_combinations.run_all_keras_modes(always_skip_v1=True)
   def test_logs_conversion(self):
     assert_dict_equal = self.assertDictEqual
@@ -72,6 +72,10 @@ _TF_OP_LAYER_NAME_PREFIX = 'tf_op_layer_'
 _AUTOCAST_TYPES = (tf.Tensor, tf.SparseTensor,
                    tf.RaggedTensor)
 
+# Number of input signatures for which a layer caches the outcome of the
+# checks skipped by the fast inference path of `Layer.__call__`.
+_MAX_FAST_INFERENCE_SIGNATURES = 32
+
 keras_layers_gauge = tf.__internal__.monitoring.BoolGauge(
     '/tensorflow/api/keras/layers', 'keras layers usage', 'method')
 keras_models_gauge = tf.__internal__.monitoring.BoolGauge(
@@ -416,6 +420,10 @@ class Layer(tf.Module, version_utils.LayerVersionSelector):
     # the actual layer construction.
     self._outer_name_scope = tf.get_current_name_scope()
 
+    # Maps the signatures of calls eligible for the fast inference path to
+    # whether their inputs need to be cast. See `_fast_inference_call`.
+    self._fast_inference_call_cache = {}
+
   @tf.__internal__.tracking.no_automatic_dependency_tracking
   @generic_utils.default
   def build(self, input_shape):
@@ -864,6 +872,15 @@ class Layer(tf.Module, version_utils.LayerVersionSelector):
       raise RuntimeError(
           'You must call `super().__init__()` in the layer constructor.')
 
+    fast_inference_signature = None
+    if self._fast_inference_calls_enabled():
+      fast_inference_signature = self._get_fast_inference_call_signature(
+          args, kwargs)
+      should_cast = self._fast_inference_call_cache.get(
+          fast_inference_signature)
+      if should_cast is not None and self.built:
+        return self._fast_inference_call(args[0], should_cast)
+
     # `inputs` (the first arg in the method spec) is special cased in
     # layer call due to historical reasons.
     # This special casing currently takes the form of:
@@ -956,6 +973,9 @@ class Layer(tf.Module, version_utils.LayerVersionSelector):
           self._set_mask_metadata(inputs, outputs, input_masks, not eager)
         if self._saved_model_inputs_spec is None:
           self._set_save_spec(inputs, args, kwargs)
+        if fast_inference_signature is not None:
+          self._maybe_cache_fast_inference_call(fast_inference_signature,
+                                                input_list, outputs)
 
         return outputs
 
@@ -1616,6 +1636,152 @@ class Layer(tf.Module, version_utils.LayerVersionSelector):
         output_weights.append(weight)
     return backend.batch_get_value(output_weights)
 
+  def get_flat_weights(self, dtype=None):
+    """Returns the current weights of the layer as one flat NumPy buffer.
+
+    Unlike `get_weights`, which fetches one NumPy array per weight, this
+    concatenates all weight values into a single 1-D buffer in one call, which
+    is much cheaper when weights are exported frequently, e.g. for parameter
+    averaging. The value of the `i`-th weight is the slice
+    `buffer[offsets[i]:offsets[i + 1]]`, a zero-copy view that can be reshaped
+    to the weight's shape.
+
+    >>> layer = tf.keras.layers.Dense(2, kernel_initializer='ones')
+    >>> _ = layer(tf.ones((1, 3)))
+    >>> buffer, offsets = layer.get_flat_weights()
+    >>> buffer
+    array([1., 1., 1., 1., 1., 1., 0., 0.], dtype=float32)
+    >>> offsets
+    array([0, 6, 8])
+    >>> layer.set_flat_weights(buffer * 2.)
+    >>> layer.kernel.numpy()
+    array([[2., 2.],
+           [2., 2.],
+           [2., 2.]], dtype=float32)
+
+    Args:
+      dtype: Optional dtype of the buffer. All weight values are cast to it.
+        Defaults to the dtype of the weights, which must then all have the
+        same dtype.
+
+    Returns:
+      A tuple `(buffer, offsets)`, where `buffer` is a 1-D NumPy array holding
+      the values of `self.weights` flattened and concatenated in order, and
+      `offsets` a 1-D integer NumPy array with one more element than there
+      are weights, holding the start of each weight in `buffer` followed by
+      the size of `buffer`.
+
+    Raises:
+      ValueError: If the layer has weights that are not variables, or
+        weights of different dtypes and `dtype` is not passed.
+    """
+    variables = self._flat_weights_variables()
+    if dtype is not None:
+      dtype = tf.as_dtype(dtype)
+    else:
+      dtypes = set(tf.as_dtype(v.dtype) for v in variables)
+      if len(dtypes) > 1:
+        raise ValueError(
+            f'The weights of layer "{self.name}" have different dtypes '
+            f'{sorted(d.name for d in dtypes)}. Pass the `dtype` of the flat '
+            'buffer.')
+      dtype = dtypes.pop() if dtypes else tf.as_dtype(self.dtype)
+    offsets = np.cumsum(
+        [0] + [v.shape.num_elements() for v in variables], dtype=np.int64)
+    if not variables:
+      return np.zeros((0,), dtype=dtype.as_numpy_dtype), offsets
+    if tf.compat.v1.executing_eagerly_outside_functions():
+      buffer = self._get_flat_weights_function(variables, dtype)()
+      return buffer.numpy(), offsets
+    values = backend.batch_get_value(variables)
+    buffer = np.concatenate([np.reshape(value, [-1]) for value in values])
+    return buffer.astype(dtype.as_numpy_dtype, copy=False), offsets
+
+  def set_flat_weights(self, buffer):
+    """Sets the weights of the layer from one flat NumPy buffer.
+
+    This is the inverse of `get_flat_weights`: `buffer` holds the values of
+    `self.weights` flattened and concatenated in order. All weights are
+    assigned in one call.
+
+    Args:
+      buffer: A 1-D NumPy array (or tensor) with as many elements as the
+        weights of the layer. Its values are cast to the dtype of each weight.
+
+    Raises:
+      ValueError: If the layer has weights that are not variables, or if the
+        size of `buffer` does not match the weights of the layer.
+    """
+    variables = self._flat_weights_variables()
+    expected_size = sum(v.shape.num_elements() for v in variables)
+    buffer_shape = tuple(buffer.shape)
+    if buffer_shape != (expected_size,):
+      raise ValueError(
+          f'You called `set_flat_weights(buffer)` on layer "{self.name}" with '
+          f'a buffer of shape {buffer_shape}, but the layer was expecting a '
+          f'1-D buffer of {expected_size} elements.')
+
+    if tf.compat.v1.executing_eagerly_outside_functions():
+      if variables:
+        self._set_flat_weights_function(variables)(
+            tf.convert_to_tensor(buffer))
+    else:
+      buffer = np.asarray(buffer)
+      weight_value_tuples = []
+      start = 0
+      for v in variables:
+        end = start + v.shape.num_elements()
+        weight_value_tuples.append((v, buffer[start:end].reshape(v.shape)))
+        start = end
+      backend.batch_set_value(weight_value_tuples)
+
+    # Perform any layer defined finalization of the layer state.
+    for layer in self._flatten_layers():
+      layer.finalize_state()
+
+  def _flat_weights_variables(self):
+    """Returns the weights of the layer, checking they can be flattened."""
+    variables = self.weights
+    for v in variables:
+      if (isinstance(v, base_layer_utils.TrackableWeightHandler) or
+          not v.shape.is_fully_defined()):
+        raise ValueError(
+            f'Layer "{self.name}" has weights that cannot be flattened. Flat '
+            'weights are only supported for variables of fully defined '
+            f'shape. Received: {v}')
+    return variables
+
+  @tf.__internal__.tracking.no_automatic_dependency_tracking
+  def _get_flat_weights_function(self, variables, dtype):
+    """Returns a cached function concatenating `variables` into a buffer."""
+    key = (dtype, tuple(id(v) for v in variables))
+    cached = getattr(self, '_flat_weights_getter', None)
+    if cached is None or cached[0] != key:
+
+      def get_flat_weights():
+        return tf.concat(
+            [tf.reshape(tf.cast(v, dtype), [-1]) for v in variables], axis=0)
+
+      cached = (key, tf.function(get_flat_weights, autograph=False))
+      self._flat_weights_getter = cached
+    return cached[1]
+
+  @tf.__internal__.tracking.no_automatic_dependency_tracking
+  def _set_flat_weights_function(self, variables):
+    """Returns a cached function assigning a buffer to `variables`."""
+    key = tuple(id(v) for v in variables)
+    cached = getattr(self, '_flat_weights_setter', None)
+    if cached is None or cached[0] != key:
+      sizes = [v.shape.num_elements() for v in variables]
+
+      def set_flat_weights(buffer):
+        for v, value in zip(variables, tf.split(buffer, sizes)):
+          v.assign(tf.reshape(tf.cast(value, v.dtype), v.shape))
+
+      cached = (key, tf.function(set_flat_weights, autograph=False))
+      self._flat_weights_setter = cached
+    return cached[1]
+
   @doc_controls.do_not_generate_docs
   def finalize_state(self):
     """Finalizes the layers state after updating layer weights.
@@ -2016,10 +2182,15 @@ class Layer(tf.Module, version_utils.LayerVersionSelector):
   # already been available as individual attributes. _obj_reference_counts_dict
   # just contains a copy of them.
   _TF_MODULE_IGNORED_PROPERTIES = frozenset(itertools.chain(
-      ('_obj_reference_counts_dict',),
+      ('_obj_reference_counts_dict', '_fast_inference_call_cache'),
       tf.Module._TF_MODULE_IGNORED_PROPERTIES
   ))
 
+  # Whether `__call__` may take its fast inference path, or `None` to follow
+  # `tf.keras.layers.enable_fast_inference_calls`. Set for all the layers of a
+  # model by `Model.fast_inference_calls`.
+  _fast_inference_calls = None
+
   # When loading from a SavedModel, Layers typically can be revived into a
   # generic Layer wrapper. Sometimes, however, layers may implement methods
   # that go beyond this wrapper, as in the case of PreprocessingLayers'
@@ -2247,6 +2418,93 @@ class Layer(tf.Module, version_utils.LayerVersionSelector):
                                                 outputs)
       return outputs
 
+  def _fast_inference_calls_enabled(self):
+    if self._fast_inference_calls is None:
+      return base_layer_utils.FAST_INFERENCE_CALLS
+    return self._fast_inference_calls
+
+  def _get_fast_inference_call_signature(self, args, kwargs):
+    """Returns the signature of a call if the fast path may apply, else None.
+
+    The fast inference path only applies to eager calls on a tensor, or a flat
+    list or tuple of tensors, without masks or other arguments, outside of a
+    learning phase scope.
+
+    Args:
+      args: Positional arguments passed to `__call__`.
+      kwargs: Keyword arguments passed to `__call__`.
+
+    Returns:
+      A hashable signature made of the structure, dtypes and shapes of the
+      inputs, or `None`.
+    """
+    if len(args) != 1 or kwargs or not tf.executing_eagerly():
+      return None
+    inputs = args[0]
+    if isinstance(inputs, tf.Tensor):
+      input_list = (inputs,)
+    elif isinstance(inputs, (list, tuple)):
+      input_list = inputs
+    else:
+      return None
+    signature = [type(inputs)]
+    for x in input_list:
+      if (not isinstance(x, tf.Tensor) or
+          getattr(x, '_keras_mask', None) is not None):
+        return None
+      signature.append((x.dtype, tuple(x.shape)))
+    if backend.global_learning_phase_is_set():
+      return None
+    return tuple(signature)
+
+  def _maybe_cache_fast_inference_call(self, signature, input_list, outputs):
+    """Records the outcome of the checks of a call for the fast path."""
+    if self._activity_regularizer or any(
+        getattr(y, '_keras_mask', None) is not None
+        for y in tf.nest.flatten(outputs)):
+      return
+    if len(self._fast_inference_call_cache) >= _MAX_FAST_INFERENCE_SIGNATURES:
+      self._fast_inference_call_cache.clear()
+    compute_dtype_object = self._compute_dtype_object
+    self._fast_inference_call_cache[signature] = bool(
+        self._autocast and compute_dtype_object and
+        compute_dtype_object.is_floating and
+        any(map(self._should_cast_single_input, input_list)))
+
+  def _fast_inference_call(self, inputs, should_cast):
+    """Calls the layer, skipping the checks cached for the inputs' signature.
+
+    Unlike `__call__`, this does not check the inputs against `input_spec`,
+    enter the name scope of the layer, propagate masks or inject argument info
+    in tracebacks. The outcome of these steps was cached by
+    `_maybe_cache_fast_inference_call` for inputs of the same signature.
+
+    Args:
+      inputs: Input tensor, or flat list or tuple of input tensors.
+      should_cast: Whether the inputs need to be cast to the compute dtype.
+
+    Returns:
+      Output tensor(s).
+    """
+    call_context = base_layer_utils.call_context()
+    training_mode = call_context.training
+    kwargs = {}
+    if self._expects_training_arg:
+      if training_mode is None:
+        training_mode = self._default_training_arg
+      kwargs['training'] = training_mode
+
+    if not call_context.in_call:
+      self._clear_losses()
+
+    with call_context.enter(
+        layer=self, inputs=inputs, build_graph=False, training=training_mode):
+      if should_cast:
+        inputs = self._maybe_cast_inputs(inputs)
+      with autocast_variable.enable_auto_cast_variables(
+          self._compute_dtype_object):
+        return self.call(inputs, **kwargs)
+
   def _set_training_mode(self, args, kwargs, call_context):
     training_mode = None
     if self._expects_training_arg:
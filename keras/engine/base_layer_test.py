@@ -26,6 +26,7 @@ from keras import layers
 from keras import regularizers
 from keras.testing_infra import test_utils
 from keras.engine import base_layer
+from keras.engine import base_layer_utils
 from keras.engine import input_layer
 from keras.engine import sequential
 from keras.engine import training as training_lib
@@ -607,6 +608,128 @@ class BaseLayerTest(test_combinations.TestCase):
                      initializer=lambda *a, **k: 2 * ['abc'])
     layer.set_weights(layer.get_weights())
 
+  @test_combinations.generate(
+      test_combinations.combine(mode=['graph', 'eager']))
+  def test_set_flat_weights_and_get_flat_weights(self):
+    layer = layers.Dense(2)
+    layer.build((None, 10))
+    kernel = np.random.random((10, 2)).astype('float32')
+    bias = np.random.random((2,)).astype('float32')
+    layer.set_flat_weights(np.concatenate([kernel.ravel(), bias]))
+    buffer, offsets = layer.get_flat_weights()
+    self.assertEqual(buffer.dtype, np.float32)
+    self.assertAllEqual(offsets, [0, 20, 22])
+    self.assertAllClose(buffer[offsets[0]:offsets[1]].reshape(10, 2), kernel)
+    self.assertAllClose(buffer[offsets[1]:offsets[2]], bias)
+    self.assertAllClose(layer.get_weights(), [kernel, bias])
+
+    buffer, _ = layer.get_flat_weights(dtype='float64')
+    self.assertEqual(buffer.dtype, np.float64)
+    layer.set_flat_weights(buffer * 2)
+    self.assertAllClose(layer.get_weights(), [kernel * 2, bias * 2])
+
+    with self.assertRaisesRegex(ValueError,
+                                'was expecting a 1-D buffer of 22 elements'):
+      layer.set_flat_weights(np.zeros((21,)))
+
+  @test_combinations.generate(
+      test_combinations.combine(mode=['graph', 'eager']))
+  def test_flat_weights_mixed_dtypes(self):
+    layer = layers.Layer()
+    layer.add_weight(name='float', shape=(2,), dtype=tf.float32)
+    layer.add_weight(name='int', shape=(3,), dtype=tf.int64,
+                     initializer='ones')
+    with self.assertRaisesRegex(ValueError, 'have different dtypes'):
+      layer.get_flat_weights()
+    buffer, offsets = layer.get_flat_weights(dtype='float64')
+    self.assertAllEqual(offsets, [0, 2, 5])
+    self.assertAllClose(buffer[2:], [1, 1, 1])
+    layer.set_flat_weights(np.arange(5, dtype='float64'))
+    self.assertAllEqual(layer.get_weights()[1], [2, 3, 4])
+    self.assertEqual(layer.get_weights()[1].dtype, np.int64)
+
+  @test_combinations.generate(
+      test_combinations.combine(mode=['graph', 'eager']))
+  def test_flat_weights_tracks_new_weights(self):
+    layer = layers.Layer()
+    layer.add_weight(name='a', shape=(2,), initializer='ones')
+    self.assertAllClose(layer.get_flat_weights()[0], [1, 1])
+    layer.add_weight(name='b', shape=(1,), initializer='zeros')
+    self.assertAllClose(layer.get_flat_weights()[0], [1, 1, 0])
+    layer.set_flat_weights(np.array([3., 4., 5.]))
+    weights = layer.get_weights()
+    self.assertAllClose(weights[0], [3, 4])
+    self.assertAllClose(weights[1], [5])
+
+  @test_combinations.generate(test_combinations.combine(mode=['eager']))
+  def test_fast_inference_calls(self):
+    inputs = input_layer.Input(shape=(2,))
+    model = training_lib.Model(inputs, layers.Dense(3)(layers.Dense(4)(inputs)))
+    model.fast_inference_calls = True
+    self.assertTrue(model.fast_inference_calls)
+    self.assertTrue(all(layer._fast_inference_calls for layer in model.layers))
+    x = tf.ones((1, 2))
+    expected = model(x)
+
+    with tf.compat.v1.test.mock.patch.object(
+        base_layer.Layer, '_fast_inference_call',
+        autospec=True, side_effect=base_layer.Layer._fast_inference_call
+    ) as fast_call:
+      self.assertAllClose(model(x), expected)
+      # The model and both of its layers take the fast path.
+      self.assertEqual(fast_call.call_count, 3)
+      # New signatures take the regular path first.
+      model(tf.ones((2, 2)))
+      self.assertEqual(fast_call.call_count, 3)
+      model(tf.ones((2, 2)))
+      self.assertEqual(fast_call.call_count, 6)
+      # Calls with other arguments take the regular path, but not the calls
+      # of the layers of the model.
+      self.assertAllClose(model(x, training=False), expected)
+      self.assertEqual(fast_call.call_count, 8)
+
+      model.fast_inference_calls = False
+      model(x)
+      self.assertEqual(fast_call.call_count, 8)
+
+  @test_combinations.generate(test_combinations.combine(mode=['eager']))
+  def test_fast_inference_calls_cast_inputs(self):
+    layer = layers.Dense(2, kernel_initializer='ones')
+    layer._fast_inference_calls = True
+    x = tf.ones((1, 2), 'float64')
+    layer(x)
+    # The inputs need to be cast.
+    self.assertEqual(list(layer._fast_inference_call_cache.values()), [True])
+    outputs = layer(x)
+    self.assertEqual(outputs.dtype, tf.float32)
+    self.assertAllClose(outputs, [[2., 2.]])
+
+  @test_combinations.generate(test_combinations.combine(mode=['eager']))
+  def test_fast_inference_calls_enabled_globally(self):
+    layer = layers.Dense(2)
+    x = tf.ones((1, 2))
+    layer(x)
+    base_layer_utils.enable_fast_inference_calls()
+    try:
+      layer(x)
+      self.assertLen(layer._fast_inference_call_cache, 1)
+    finally:
+      base_layer_utils.disable_fast_inference_calls()
+
+  @test_combinations.generate(test_combinations.combine(mode=['eager']))
+  def test_fast_inference_calls_skip_layers_producing_masks(self):
+    model = sequential.Sequential(
+        [layers.Embedding(3, 2, mask_zero=True), layers.LSTM(2)])
+    model.fast_inference_calls = True
+    x = tf.constant([[1, 2, 0]])
+    expected = model(x)
+    self.assertAllClose(model(x), expected)
+    self.assertAllClose(model(tf.constant([[1, 0, 0]])),
+                        model.layers[1](model.layers[0](
+                            tf.constant([[1, 0, 0]]))))
+    self.assertEmpty(model.layers[0]._fast_inference_call_cache)
+    self.assertEmpty(model.layers[1]._fast_inference_call_cache)
+
   def test_get_config_error(self):
 
     class MyLayer(base_layer.Layer):
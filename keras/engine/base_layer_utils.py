@@ -769,6 +769,55 @@ def v2_dtype_behavior_enabled():
   return V2_DTYPE_BEHAVIOR
 
 
+FAST_INFERENCE_CALLS = False
+
+
+@keras_export('keras.layers.enable_fast_inference_calls', v1=[])
+def enable_fast_inference_calls():
+  """Enables the fast inference path of `Layer.__call__` for all layers.
+
+  Calling a layer eagerly checks its inputs against the layer's `input_spec`,
+  casts them to the layer's compute dtype, enters the layer's name scope and
+  propagates masks, among other things. For deep models called eagerly on
+  small inputs, e.g. when serving a model, these steps can take a significant
+  share of the time of a call.
+
+  With fast inference calls enabled, the outcome of these steps is cached the
+  first time a built layer is eagerly called on inputs of a given structure,
+  shape and dtype, and later calls on such inputs skip them. The fast path is
+  only taken for calls on a tensor, or a flat list or tuple of tensors,
+  without masks and without other arguments; other calls are unchanged.
+
+  Note that the fast path does not enter the name scope of the layer, and
+  that it is not taken by layers with an activity regularizer or producing
+  masks.
+
+  To only enable fast inference calls for the layers of a given model, set
+  `model.fast_inference_calls = True` instead.
+
+  >>> tf.keras.layers.enable_fast_inference_calls()
+  >>> model = tf.keras.Sequential([tf.keras.layers.Dense(4)])
+  >>> model(tf.ones((1, 2))).shape  # Takes the regular path, filling caches.
+  TensorShape([1, 4])
+  >>> model(tf.ones((1, 2))).shape  # Takes the fast path.
+  TensorShape([1, 4])
+  >>> tf.keras.layers.disable_fast_inference_calls()
+  """
+  global FAST_INFERENCE_CALLS
+  FAST_INFERENCE_CALLS = True
+
+
+@keras_export('keras.layers.disable_fast_inference_calls', v1=[])
+def disable_fast_inference_calls():
+  """Disables the fast inference path of `Layer.__call__` for all layers.
+
+  See `tf.keras.layers.enable_fast_inference_calls`. Layers of models with
+  `fast_inference_calls` set to `True` still take the fast path.
+  """
+  global FAST_INFERENCE_CALLS
+  FAST_INFERENCE_CALLS = False
+
+
 class TrackableWeightHandler:
   """Keras wrapper for handling tracking.Trackable object saving and restoring.
 
@@ -237,6 +237,10 @@ class Layer(base_layer.Layer):
     # a list with one element.
     self._preserve_input_structure_in_config = False
 
+    # V1 layers do not take the fast inference path of `base_layer.Layer`, but
+    # share the code invalidating its cache.
+    self._fast_inference_call_cache = {}
+
   @tf.__internal__.tracking.no_automatic_dependency_tracking
   @generic_utils.default
   def build(self, input_shape):
@@ -15,6 +15,10 @@
 """Contains the base ProcessingLayer and a subclass that uses Combiners."""
 
 import abc
+import concurrent.futures
+import functools
+import itertools
+import threading
 
 from keras.engine import data_adapter
 from keras.engine.base_layer import Layer
@@ -252,6 +256,85 @@ class PreprocessingLayer(Layer, metaclass=abc.ABCMeta):
     self.finalize_state()
     self._is_adapted = True
 
+  def _adapt_in_shards(self, data, batch_size, steps, num_shards):
+    """Fits the state of the layer to data on `num_shards` parallel threads.
+
+    Each thread reads batches from `data` and accumulates them into a shard of
+    the state of its own, so that threads never wait on each other beyond
+    reading the next batch. The shards are then merged into the state of the
+    layer before `finalize_state` is called.
+
+    Layers with a mergeable state support this by implementing
+    `_make_shard_state`, `_update_shard_state` and `_merge_shard_state`.
+
+    Args:
+      data: The data to train on, see `adapt`.
+      batch_size: Number of samples per state update, see `adapt`.
+      steps: Total number of batches of samples, see `adapt`.
+      num_shards: Number of threads, and of state shards.
+    """
+    _disallow_inside_tf_function('adapt')
+    if not version_utils.should_use_v2():
+      raise RuntimeError('`adapt` is only supported in tensorflow v2.')  # pylint: disable=g-doc-exception
+    if not isinstance(num_shards, int) or num_shards < 1:
+      raise ValueError('`num_shards` must be a positive integer. '
+                       f'Received: num_shards={num_shards}')
+    if not self._is_compiled:
+      self.compile()  # Compile with defaults.
+    if self.built:
+      self.reset_state()
+    data_handler = data_adapter.DataHandler(
+        data,
+        batch_size=batch_size,
+        steps_per_epoch=steps,
+        epochs=1,
+        steps_per_execution=self._steps_per_execution,
+        distribute=False)
+    shards = []
+    lock = threading.Lock()
+
+    def adapt_shard(batches):
+      update_fn = None
+      while True:
+        with lock:
+          data = next(batches, None)
+          if data is None:
+            return
+          if update_fn is None:
+            # Shards are created once the layer is built.
+            self._adapt_maybe_build(data)
+            shard = self._make_shard_state()
+            shards.append(shard)
+            update_fn = functools.partial(self._update_shard_state, shard)
+            if not self._run_eagerly:
+              update_fn = tf.function(update_fn)
+        update_fn(data)
+
+    for _, iterator in data_handler.enumerate_epochs():
+      batches = itertools.islice(iterator, data_handler.inferred_steps)
+      with concurrent.futures.ThreadPoolExecutor(num_shards) as executor:
+        futures = [
+            executor.submit(adapt_shard, batches) for _ in range(num_shards)
+        ]
+        for future in futures:
+          future.result()
+    for shard in shards:
+      self._merge_shard_state(shard)
+    self.finalize_state()
+    self._is_adapted = True
+
+  def _make_shard_state(self):
+    """Returns an empty shard of the state of the built layer."""
+    raise NotImplementedError
+
+  def _update_shard_state(self, shard, data):
+    """Accumulates a mini-batch of inputs into a shard of the state."""
+    raise NotImplementedError
+
+  def _merge_shard_state(self, shard):
+    """Merges a shard into the state of the layer."""
+    raise NotImplementedError
+
   def _reset_state_wrapper(self):
     """Calls `reset_state` and sets `adapted` to `False`."""
     self._reset_state_impl()
@@ -17,11 +17,15 @@
 import tensorflow.compat.v2 as tf
 
 import abc
+import concurrent.futures
 import contextlib
 import functools
 import itertools
 import math
+import os
 import random
+import threading
+import time
 
 import numpy as np
 from tensorflow.python.eager import context
@@ -42,6 +46,15 @@ except ImportError:
 keras_data_adapter_gauge = tf.__internal__.monitoring.BoolGauge(
     "/tensorflow/api/keras/data_adapters", "keras data adapter usage", "method")
 
+# Marks the end of the Python generator wrapped by `GeneratorDataAdapter`.
+_END_OF_GENERATOR = object()
+
+# Number of contiguous blocks each batch is drawn from with `shuffle="block"`.
+_BLOCKS_PER_BATCH = 4
+
+# Number of batches in each window of samples shuffled by `MemmapDataAdapter`.
+_MEMMAP_SHUFFLE_WINDOW_BATCHES = 64
+
 
 class DataAdapter(object, metaclass=abc.ABCMeta):
   """Base class for input data adapter.
@@ -201,6 +214,16 @@ class DataAdapter(object, metaclass=abc.ABCMeta):
     """A hook called after each epoch."""
     pass
 
+  def get_data_production_time(self):
+    """Returns the seconds spent producing input batches in Python.
+
+    This is wall time, during which the batches may also be consumed: when
+    the batches are prefetched, their production overlaps with the training.
+    Only adapters that produce batches in Python can measure this time, the
+    others return 0.
+    """
+    return 0.
+
 
 class TensorLikeDataAdapter(DataAdapter):
   """Adapter that handles Tensor-like objects, e.g. EagerTensor and NumPy."""
@@ -220,7 +243,8 @@ class TensorLikeDataAdapter(DataAdapter):
         return True
       return False
 
-    return all(_is_tensor(v) for v in flat_inputs)
+    return (all(_is_tensor(v) for v in flat_inputs) and
+            not any(isinstance(v, np.memmap) for v in flat_inputs))
 
   def __init__(self,
                x,
@@ -233,7 +257,7 @@ class TensorLikeDataAdapter(DataAdapter):
                shuffle=False,
                **kwargs):
     super(TensorLikeDataAdapter, self).__init__(x, y, **kwargs)
-    x, y, sample_weights = _process_tensorlike((x, y, sample_weights))
+    x, y, sample_weights = self._process_inputs((x, y, sample_weights))
     sample_weight_modes = broadcast_sample_weight_modes(
         sample_weights, sample_weight_modes)
 
@@ -254,13 +278,33 @@ class TensorLikeDataAdapter(DataAdapter):
     self._size = int(math.ceil(num_samples / batch_size))
     self._batch_size = batch_size
 
-    num_full_batches = int(num_samples // batch_size)
     self._partial_batch_size = num_samples % batch_size
 
     if isinstance(shuffle, str):
       shuffle = shuffle.lower()
 
     self._shuffle = shuffle
+    indices_dataset = self._get_indices_dataset(num_samples, epochs)
+
+    dataset = self.slice_inputs(indices_dataset, inputs)
+
+    if shuffle == "batch":
+      def shuffle_batch(*batch):
+        return tf.nest.map_structure(tf.random.shuffle, batch)
+      dataset = dataset.map(shuffle_batch)
+
+    self._dataset = dataset
+
+  def _process_inputs(self, inputs):
+    """Converts the `(x, y, sample_weights)` inputs before slicing them."""
+    return _process_tensorlike(inputs)
+
+  def _get_indices_dataset(self, num_samples, epochs):
+    """Returns a Dataset of the (shuffled) batches of indices of all epochs."""
+    batch_size = self._batch_size
+    shuffle = self._shuffle
+    num_full_batches = int(num_samples // batch_size)
+
     # Vectorized version of shuffle.
     # This is a performance improvement over using `from_tensor_slices`.
     # The indices of the data are shuffled and batched, and these indices
@@ -281,7 +325,10 @@ class TensorLikeDataAdapter(DataAdapter):
       # than reusing the same range Tensor. (presumably because of buffer
       # forwarding.)
       indices = tf.range(num_samples, dtype=tf.int64)
-      if shuffle and shuffle != "batch":
+      if shuffle == "block":
+        indices = _shuffle_blocks(
+            num_samples, max(1, batch_size // _BLOCKS_PER_BATCH))
+      elif shuffle and shuffle != "batch":
         indices = tf.random.shuffle(indices)
       return indices
 
@@ -324,15 +371,7 @@ class TensorLikeDataAdapter(DataAdapter):
       return flat_dataset
 
     indices_dataset = indices_dataset.flat_map(slice_batch_indices)
-
-    dataset = self.slice_inputs(indices_dataset, inputs)
-
-    if shuffle == "batch":
-      def shuffle_batch(*batch):
-        return tf.nest.map_structure(tf.random.shuffle, batch)
-      dataset = dataset.map(shuffle_batch)
-
-    self._dataset = dataset
+    return indices_dataset
 
   def slice_inputs(self, indices_dataset, inputs):
     """Slice inputs into a Dataset of batches.
@@ -407,8 +446,17 @@ class GenericArrayLikeDataAdapter(TensorLikeDataAdapter):
 
   It also does not handle lists/tuples of scalars, because those are handled
   by the ListsOfScalarsDataAdapter.
+
+  The indices of each batch are sorted and coalesced into range reads (e.g.
+  `x[start:stop]`), which are run by a pool of `workers` threads (or up to 8
+  threads if `workers` is 1), and the batch is then put back in the requested
+  order. With `shuffle="block"`, each batch is drawn from a few contiguous
+  blocks of samples, which keeps the reads sequential on disk.
   """
 
+  # Whether to warn that Keras may not be optimized for the inputs.
+  _warn_array_like = True
+
   @staticmethod
   def can_handle(x, y=None):
     flat_inputs = tf.nest.flatten(x)
@@ -425,19 +473,26 @@ class GenericArrayLikeDataAdapter(TensorLikeDataAdapter):
       )
 
     if (not TensorLikeDataAdapter.can_handle(x, y) and
-        not CompositeTensorDataAdapter.can_handle(x, y)):
+        not CompositeTensorDataAdapter.can_handle(x, y) and
+        not MemmapDataAdapter.can_handle(x, y)):
       return all(_is_array_like(v) for v in flat_inputs)
     else:
       return False
 
-  def __init__(self, *args, **kwargs):
-    logging.warning(
-        "Keras is training/fitting/evaluating on array-like data. Keras may "
-        "not be optimized for this format, so if your input data format is "
-        "supported by TensorFlow I/O (https://github.com/tensorflow/io) we "
-        "recommend using that to load a Dataset instead.")
+  def __init__(self, *args, workers=1, **kwargs):
+    if self._warn_array_like:
+      logging.warning(
+          "Keras is training/fitting/evaluating on array-like data. Keras may "
+          "not be optimized for this format, so if your input data format is "
+          "supported by TensorFlow I/O (https://github.com/tensorflow/io) we "
+          "recommend using that to load a Dataset instead.")
 
-    super(GenericArrayLikeDataAdapter, self).__init__(*args, **kwargs)
+    if workers > 1:
+      self._num_read_threads = workers
+    else:
+      self._num_read_threads = min(8, os.cpu_count() or 1)
+    super(GenericArrayLikeDataAdapter, self).__init__(
+        *args, workers=workers, **kwargs)
 
   def slice_inputs(self, indices_dataset, inputs):
     """Slice inputs into a Dataset of batches.
@@ -460,32 +515,233 @@ class GenericArrayLikeDataAdapter(TensorLikeDataAdapter):
       shape[0] = None
       return tuple(shape)
 
-    flat_dtypes = [inp.dtype for inp in flat_inputs]
-    contiguous = True
-    if self._shuffle and self._shuffle != "batch":
-      contiguous = False
+    flat_dtypes = [self._get_batch_dtype(inp) for inp in flat_inputs]
+    reader = _ArrayLikeBatchReader(flat_inputs, self._num_read_threads,
+                                   flat_dtypes)
 
     def grab_batch(indices):
       """Grab a batch of data from the inputs."""
-      # This uses a py_function to avoid converting the array-like
+      # This uses a numpy_function to avoid converting the array-like
       # into a Tensor before slicing it, because converting the array-like
       # to a Tensor may force it into memory..
-      def py_method(ind):
-        def slice_array(data):
-          return training_utils.slice_arrays(data, ind.numpy(),
-                                             contiguous=contiguous)
-        return [slice_array(inp) for inp in flat_inputs]
-
-      flat_out = tf.py_function(py_method, [indices], flat_dtypes)
+      flat_out = tf.numpy_function(reader.read, [indices], flat_dtypes)
       for v, original_inp in zip(flat_out, flat_inputs):
         v.set_shape(dynamic_shape_like(original_inp))
       return tf.nest.pack_sequence_as(inputs, flat_out)
 
     dataset = indices_dataset.map(
-        grab_batch, num_parallel_calls=tf.data.AUTOTUNE)
+        grab_batch, num_parallel_calls=self._num_parallel_reads)
 
     return dataset
 
+  @property
+  def _num_parallel_reads(self):
+    return tf.data.AUTOTUNE
+
+  def _get_batch_dtype(self, inp):
+    return inp.dtype
+
+
+class MemmapDataAdapter(GenericArrayLikeDataAdapter):
+  """Adapter that handles `np.memmap` inputs without loading them in memory.
+
+  This adapter handles NumPy arrays and Tensors as long as at least one of them
+  is a `np.memmap` (e.g. created by `np.lib.format.open_memmap`), which makes
+  it possible to train on files much larger than memory. Batches are read
+  directly from the memmaps: a batch of consecutive samples is a view of the
+  file, and any other batch is gathered in parallel by a pool of `workers`
+  threads (or up to 8 threads if `workers` is 1).
+
+  With `shuffle=True`, samples are shuffled within windows of contiguous
+  samples and the windows are visited in a random order, so that the reads of
+  each batch stay close to each other on disk. At most `max_queue_size`
+  batches are read ahead of the training.
+  """
+
+  _warn_array_like = False
+
+  @staticmethod
+  def can_handle(x, y=None):
+    flat_inputs = tf.nest.flatten(x)
+    if y is not None:
+      flat_inputs += tf.nest.flatten(y)
+
+    return (any(isinstance(v, np.memmap) for v in flat_inputs) and
+            all(isinstance(v, (np.ndarray, tf.Tensor)) for v in flat_inputs))
+
+  def __init__(self, *args, workers=1, max_queue_size=10, **kwargs):
+    self._read_ahead = max(1, max_queue_size)
+    super(MemmapDataAdapter, self).__init__(
+        *args, workers=workers, max_queue_size=max_queue_size, **kwargs)
+
+  def _process_inputs(self, inputs):
+    # Unlike `_process_tensorlike`, keeps NumPy arrays as they are so that
+    # memmaps are not loaded in memory.
+    def _convert_single_tensor(x):
+      if tf.is_tensor(x):
+        return x.numpy()
+      return x
+
+    inputs = tf.nest.map_structure(_convert_single_tensor, inputs)
+    return tf.__internal__.nest.list_to_tuple(inputs)
+
+  def _get_indices_dataset(self, num_samples, epochs):
+    if not self._shuffle or self._shuffle in ("batch", "block"):
+      return super(MemmapDataAdapter, self)._get_indices_dataset(
+          num_samples, epochs)
+
+    batch_size = self._batch_size
+    window_size = batch_size * _MEMMAP_SHUFFLE_WINDOW_BATCHES
+    num_windows = int(math.ceil(num_samples / window_size))
+
+    def window_batches(window):
+      start = window * window_size
+      indices = tf.range(start, tf.minimum(start + window_size, num_samples))
+      indices = tf.random.shuffle(indices)
+      return tf.data.Dataset.from_tensor_slices(indices).batch(batch_size)
+
+    def epoch_batches(_):
+      # Only the last window can hold a partial batch, so that each epoch has
+      # the same batches as without shuffling.
+      windows = tf.data.Dataset.range(num_windows).shuffle(num_windows)
+      return windows.flat_map(window_batches)
+
+    return tf.data.Dataset.range(epochs).flat_map(epoch_batches)
+
+  @property
+  def _num_parallel_reads(self):
+    return self._read_ahead
+
+  def _get_batch_dtype(self, inp):
+    if issubclass(inp.dtype.type, np.floating):
+      return np.dtype(backend.floatx())
+    return inp.dtype
+
+
+def _shuffle_blocks(num_samples, block_size):
+  """Returns the indices of `num_samples` samples in shuffled blocks.
+
+  The samples are split into blocks of `block_size` consecutive indices, and
+  only the order of the blocks is shuffled.
+
+  Args:
+    num_samples: The number of samples.
+    block_size: The number of consecutive samples in each block.
+
+  Returns:
+    A 1D int64 Tensor with a permutation of `range(num_samples)`.
+  """
+  num_blocks = (num_samples + block_size - 1) // block_size
+  starts = tf.random.shuffle(tf.range(num_blocks, dtype=tf.int64)) * block_size
+  limits = tf.minimum(starts + block_size, num_samples)
+  return tf.ragged.range(starts, limits).flat_values
+
+
+def _coalesce_indices(sorted_indices):
+  """Splits sorted indices into runs of consecutive indices.
+
+  Args:
+    sorted_indices: A sorted 1D NumPy array of indices.
+
+  Returns:
+    A list of `(start, stop)` tuples, one per run.
+  """
+  if not len(sorted_indices):
+    return []
+  breaks = np.flatnonzero(np.diff(sorted_indices) != 1) + 1
+  run_starts = np.concatenate([[0], breaks])
+  run_ends = np.concatenate([breaks, [len(sorted_indices)]])
+  return [(int(sorted_indices[start]), int(sorted_indices[end - 1]) + 1)
+          for start, end in zip(run_starts, run_ends)]
+
+
+class _ArrayLikeBatchReader:
+  """Reads batches from array-likes with sorted, coalesced range reads.
+
+  Array-likes backed by files (e.g. h5py datasets) are much faster to read
+  with a few range reads than element by element, and h5py only supports
+  increasing indices. The reads of a batch are run in parallel on a pool of
+  threads, which is shared by all the batches.
+
+  NumPy arrays (including memmaps) support any indexing and are read directly:
+  a batch of consecutive samples is a view of the array, and any other batch is
+  gathered in place, with one chunk of the indices per thread of the pool.
+  """
+
+  def __init__(self, flat_inputs, num_threads, dtypes=None):
+    self._flat_inputs = flat_inputs
+    self._num_threads = num_threads
+    self._dtypes = [
+        None if dtype is None else tf.as_dtype(dtype).as_numpy_dtype
+        for dtype in (dtypes or [None] * len(flat_inputs))
+    ]
+    self._executor = None
+    self._executor_lock = threading.Lock()
+
+  def _get_executor(self):
+    with self._executor_lock:
+      if self._executor is None:
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._num_threads,
+            thread_name_prefix="keras_array_like_reader")
+      return self._executor
+
+  def read(self, indices):
+    """Returns the batch of each input at `indices`, in the order given."""
+    order = np.argsort(indices, kind="stable")
+    sorted_indices = indices[order]
+    is_sorted = np.array_equal(sorted_indices, indices)
+    runs = _coalesce_indices(sorted_indices) or [(0, 0)]
+    # Gathers from NumPy arrays are split in one chunk of indices per thread.
+    num_chunks = max(1, min(self._num_threads, len(indices)))
+    chunk_bounds = np.linspace(0, len(indices), num_chunks + 1).astype(int)
+
+    def read_range(data, start, stop):
+      return np.asarray(data[start:stop])
+
+    # The NumPy batches are gathered in place, the others are read in parts.
+    batches = []
+    jobs = []
+    num_jobs = []
+    for data in self._flat_inputs:
+      num_previous_jobs = len(jobs)
+      if not isinstance(data, np.ndarray):
+        batches.append(None)
+        jobs.extend(functools.partial(read_range, data, start, stop)
+                    for start, stop in runs)
+      elif is_sorted and len(runs) == 1:
+        batches.append(data[runs[0][0]:runs[0][1]])
+      else:
+        batch = np.empty((len(indices),) + data.shape[1:], data.dtype)
+        # The indices are valid, and `mode="clip"` avoids buffering `out`.
+        jobs.extend(
+            functools.partial(np.take, data, indices[start:stop], axis=0,
+                              out=batch[start:stop], mode="clip")
+            for start, stop in zip(chunk_bounds[:-1], chunk_bounds[1:]))
+        batches.append(batch)
+      num_jobs.append(len(jobs) - num_previous_jobs)
+
+    if len(jobs) > 1 and self._num_threads > 1:
+      results = iter(self._get_executor().map(lambda job: job(), jobs))
+    else:
+      results = iter([job() for job in jobs])
+
+    for i, dtype in enumerate(self._dtypes):
+      parts = list(itertools.islice(results, num_jobs[i]))
+      if batches[i] is None:
+        if len(parts) == 1:
+          batch = parts[0]
+        else:
+          batch = np.concatenate(parts)
+        if not is_sorted:
+          unsorted_batch = np.empty_like(batch)
+          unsorted_batch[order] = batch
+          batch = unsorted_batch
+        batches[i] = batch
+      if dtype is not None:
+        batches[i] = batches[i].astype(dtype, copy=False)
+    return batches
+
 
 class DatasetCreatorAdapter(DataAdapter):
   """Adapter that handles dataset functions."""
@@ -821,13 +1077,31 @@ class GeneratorDataAdapter(DataAdapter):
 
     output_signature = tf.nest.map_structure(_get_tensor_spec, peek)
 
+    self._data_production_time = 0.
+    # Batches may be produced by several threads of the `tf.data` pipeline,
+    # the time during which any of them is producing is only counted once.
+    self._data_production_time_lock = threading.Lock()
+    self._num_active_producers = 0
+    self._production_start_time = None
+    self._dataset = self._make_dataset(x, output_signature, workers,
+                                       use_multiprocessing, max_queue_size)
+
+  def _make_dataset(self, x, output_signature, workers, use_multiprocessing,
+                    max_queue_size):
+    """Creates the `tf.data.Dataset` of the batches produced from `x`."""
     # Note that dataset API takes a callable that creates a generator object,
     # rather than generator itself, which is why we define a function here.
     generator_fn = self._handle_multiprocessing(x, workers, use_multiprocessing,
                                                 max_queue_size)
 
     def wrapped_generator():
-      for data in generator_fn():
+      iterator = iter(generator_fn())
+      while True:
+        # Time spent producing the batch, or waiting for the workers to.
+        with self._time_data_production():
+          data = next(iterator, _END_OF_GENERATOR)
+        if data is _END_OF_GENERATOR:
+          return
         yield self._standardize_batch(data)
 
     dataset = tf.data.Dataset.from_generator(
@@ -836,7 +1110,7 @@ class GeneratorDataAdapter(DataAdapter):
     if workers == 1 and not use_multiprocessing:
       dataset = dataset.prefetch(1)
 
-    self._dataset = dataset
+    return dataset
 
   def _standardize_batch(self, data):
     """Standardizes a batch output by a generator."""
@@ -893,9 +1167,96 @@ class GeneratorDataAdapter(DataAdapter):
   def should_recreate_iterator(self):
     return False
 
+  def get_data_production_time(self):
+    with self._data_production_time_lock:
+      data_production_time = self._data_production_time
+      if self._num_active_producers:
+        data_production_time += time.time() - self._production_start_time
+    return data_production_time
+
+  @contextlib.contextmanager
+  def _time_data_production(self):
+    """Times the production of a batch, in wall time over all producers."""
+    with self._data_production_time_lock:
+      if not self._num_active_producers:
+        self._production_start_time = time.time()
+      self._num_active_producers += 1
+    try:
+      yield
+    finally:
+      with self._data_production_time_lock:
+        self._num_active_producers -= 1
+        if not self._num_active_producers:
+          self._data_production_time += (
+              time.time() - self._production_start_time)
+
+
+class GeneratorFactoryAdapter(GeneratorDataAdapter):
+  """Adapter that handles `keras.utils.experimental.GeneratorFactory`.
+
+  `workers` generators are created by the factory, and their batches are
+  interleaved by the `tf.data` pipeline, which runs each generator on its own
+  thread.
+  """
+
+  @staticmethod
+  def can_handle(x, y=None):
+    return isinstance(x, data_utils.GeneratorFactory)
+
+  def __init__(self, x, *args, use_multiprocessing=False, **kwargs):
+    if use_multiprocessing:
+      raise ValueError("`use_multiprocessing=True` is not supported when using "
+                       "`GeneratorFactory` as input. Its generators are run on "
+                       "`workers` threads.")
+    # The generator that is peeked at, reused as the first generator.
+    self._first_generator = None
+    super(GeneratorFactoryAdapter, self).__init__(x, *args, **kwargs)
+
+  def _peek_and_restore(self, x):
+    generator = x(0)
+    peek = next(generator)
+    self._first_generator = itertools.chain([peek], generator)
+    return peek, x
+
+  def _make_dataset(self, x, output_signature, workers, use_multiprocessing,
+                    max_queue_size):
+    num_generators = max(1, workers)
+
+    def generator_fn(index):
+      generator = None
+      if index == 0:
+        generator, self._first_generator = self._first_generator, None
+      if generator is None:
+        generator = x(int(index))
+      while True:
+        with self._time_data_production():
+          data = next(generator, _END_OF_GENERATOR)
+        if data is _END_OF_GENERATOR:
+          return
+        yield self._standardize_batch(data)
+
+    def make_generator_dataset(index):
+      return tf.data.Dataset.from_generator(
+          generator_fn, args=(index,), output_signature=output_signature)
+
+    dataset = tf.data.Dataset.range(num_generators).interleave(
+        make_generator_dataset,
+        cycle_length=num_generators,
+        num_parallel_calls=num_generators,
+        deterministic=False)
+    dataset = _with_producer_threads(dataset, num_generators)
+    return dataset.prefetch(max_queue_size)
+
 
 class KerasSequenceAdapter(GeneratorDataAdapter):
-  """Adapter that handles `keras.utils.Sequence`."""
+  """Adapter that handles `keras.utils.Sequence`.
+
+  With `workers > 1` and `use_multiprocessing=False`, the batches are produced
+  by `workers` threads of the `tf.data` pipeline, each of which gets the
+  batches of one shard of the indices of the `Sequence`. The shards are
+  interleaved in order, so the batches come in the same order as with a
+  single worker.
+  """
 
   @staticmethod
   def can_handle(x, y=None):
@@ -935,6 +1296,41 @@ class KerasSequenceAdapter(GeneratorDataAdapter):
   def _peek_and_restore(x):
     return x[0], x
 
+  def _make_dataset(self, x, output_signature, workers, use_multiprocessing,
+                    max_queue_size):
+    if workers <= 1 or use_multiprocessing:
+      return super(KerasSequenceAdapter, self)._make_dataset(
+          x, output_signature, workers, use_multiprocessing, max_queue_size)
+
+    def shard_generator(order, shard_index):
+      for i in order[shard_index::workers]:
+        with self._time_data_production():
+          data = x[int(i)]
+        yield self._standardize_batch(data)
+
+    def make_shards(order):
+      return tf.data.Dataset.range(workers).map(
+          lambda shard_index: (order, shard_index))
+
+    def make_shard_dataset(order, shard_index):
+      return tf.data.Dataset.from_generator(
+          shard_generator, args=(order, shard_index),
+          output_signature=output_signature)
+
+    # The order of the batches is drawn once per epoch, as a single element
+    # shared by all the shards.
+    order = tf.data.Dataset.range(self._size)
+    if self._shuffle_sequence:
+      order = order.shuffle(self._size)
+    order = order.batch(self._size)
+    # Taking a batch from each shard in turn restores the order of the batches.
+    dataset = order.flat_map(make_shards).interleave(
+        make_shard_dataset,
+        cycle_length=workers,
+        num_parallel_calls=workers)
+    dataset = _with_producer_threads(dataset, workers)
+    return dataset.prefetch(max_queue_size)
+
   def _handle_multiprocessing(self, x, workers, use_multiprocessing,
                               max_queue_size):
     if workers > 1 or (workers > 0 and use_multiprocessing):
@@ -969,10 +1365,22 @@ class KerasSequenceAdapter(GeneratorDataAdapter):
     self._keras_sequence.on_epoch_end()
 
 
+def _with_producer_threads(dataset, num_producers):
+  """Lets `num_producers` Python producers of `dataset` run in parallel."""
+  # The default thread pool of `tf.data` has one thread per core, but Python
+  # producers are often blocked on I/O, so there can be more of them.
+  if num_producers > (os.cpu_count() or 1):
+    options = tf.data.Options()
+    options.threading.private_threadpool_size = num_producers
+    dataset = dataset.with_options(options)
+  return dataset
+
+
 ALL_ADAPTER_CLS = [
     ListsOfScalarsDataAdapter, TensorLikeDataAdapter,
-    GenericArrayLikeDataAdapter, DatasetAdapter, GeneratorDataAdapter,
-    KerasSequenceAdapter, CompositeTensorDataAdapter, DatasetCreatorAdapter
+    GenericArrayLikeDataAdapter, MemmapDataAdapter, DatasetAdapter,
+    GeneratorDataAdapter, GeneratorFactoryAdapter, KerasSequenceAdapter,
+    CompositeTensorDataAdapter, DatasetCreatorAdapter
 ]
 
 
@@ -1165,6 +1573,7 @@ class DataHandler:
     self._current_step = 0
     self._step_increment = self._steps_per_execution.numpy().item() - 1
     self._insufficient_data = False
+    self._iterator_creation_time = 0.
 
     self._configure_dataset_and_inferred_steps(strategy, x, steps_per_epoch,
                                                class_weight, distribute)
@@ -1188,15 +1597,21 @@ class DataHandler:
   def enumerate_epochs(self):
     """Yields `(epoch, tf.data.Iterator)`."""
     with self._truncate_execution_to_epoch():
-      data_iterator = iter(self._dataset)
+      data_iterator = self._create_iterator()
       for epoch in range(self._initial_epoch, self._epochs):
         if self._insufficient_data:  # Set by `catch_stop_iteration`.
           break
         if self._adapter.should_recreate_iterator():
-          data_iterator = iter(self._dataset)
+          data_iterator = self._create_iterator()
         yield epoch, data_iterator
         self._adapter.on_epoch_end()
 
+  def _create_iterator(self):
+    start_time = time.time()
+    data_iterator = iter(self._dataset)
+    self._iterator_creation_time += time.time() - start_time
+    return data_iterator
+
   @contextlib.contextmanager
   def _truncate_execution_to_epoch(self):
     """Truncates steps per execution to at most one epoch."""
@@ -1283,6 +1698,28 @@ class DataHandler:
     """
     return self._inferred_steps
 
+  @property
+  def data_wait_time(self):
+    """The seconds the host was blocked waiting for input so far.
+
+    This is the time spent creating iterators (e.g. filling shuffle buffers).
+    Waiting for the next batch happens inside of the `tf.function`s, where it
+    cannot be timed from Python, and is not included.
+    """
+    return self._iterator_creation_time
+
+  @property
+  def data_production_time(self):
+    """The seconds spent producing batches in Python so far.
+
+    For Python generators and `keras.utils.Sequence` inputs, this is the wall
+    time during which batches were being produced, or waited for from the
+    workers producing them. The batches are prefetched, so this time overlaps
+    with the training and is not time spent waiting for input. It is 0 for
+    other inputs.
+    """
+    return self._adapter.get_data_production_time()
+
   @property
   def should_sync(self):
     # Catch OutOfRangeError for Datasets of unknown size.
@@ -1436,8 +1873,13 @@ def _make_class_weight_map_fn(class_weight):
       raise ValueError("`class_weight` not supported for "
                        "3+ dimensional targets.")
 
+    # The batches usually have a static number of columns, in which case the
+    # classes are computed without a `tf.cond`.
+    num_columns = y.shape[1] if y.shape.rank == 2 else 1
+    if num_columns is None:
+      num_columns = backend.shape(y)[1]
     y_classes = tf.__internal__.smart_cond.smart_cond(
-        y.shape.rank == 2 and backend.shape(y)[1] > 1,
+        num_columns > 1,
         lambda: backend.argmax(y, axis=1),
         lambda: tf.cast(backend.reshape(y, (-1,)), tf.int64))
 
@@ -1458,9 +1900,15 @@ def train_validation_split(arrays, validation_split):
 
   The last part of data will become validation data.
 
+  The subsets are views of the inputs whenever their type allows it, so that
+  the inputs are not copied: NumPy arrays (including memmaps) and pandas
+  objects are sliced in place, and SciPy sparse matrices are split into CSR
+  matrices that share the values of the input. Tensors are sliced, which copies
+  them.
+
   Args:
     arrays: Tensors to split. Allowed inputs are arbitrarily nested structures
-      of Tensors and NumPy arrays.
+      of Tensors, NumPy arrays, pandas objects and SciPy sparse matrices.
     validation_split: Float between 0 and 1. The proportion of the dataset to
       include in the validation split. The rest of the dataset will be included
       in the training split.
@@ -1470,14 +1918,16 @@ def train_validation_split(arrays, validation_split):
 
   def _can_split(t):
     tensor_types = _get_tensor_types()
-    return isinstance(t, tensor_types) or t is None
+    return (isinstance(t, tensor_types) or _is_scipy_sparse(t) or
+            isinstance(t, tf.SparseTensor) or t is None)
 
   flat_arrays = tf.nest.flatten(arrays)
   unsplitable = [type(t) for t in flat_arrays if not _can_split(t)]
   if unsplitable:
     raise ValueError(
-        "`validation_split` is only supported for Tensors or NumPy "
-        "arrays, found following types in the input: {}".format(unsplitable))
+        "`validation_split` is only supported for Tensors, NumPy arrays, "
+        "pandas objects or SciPy sparse matrices, found following types in the "
+        "input: {}".format(unsplitable))
 
   if all(t is None for t in flat_arrays):
     return arrays, arrays
@@ -1503,6 +1953,16 @@ def train_validation_split(arrays, validation_split):
   def _split(t, start, end):
     if t is None:
       return t
+    if pd is not None and isinstance(t, (pd.Series, pd.DataFrame)):
+      # Positional slicing, regardless of the index of `t`.
+      return t.iloc[start:end]
+    if _is_scipy_sparse(t):
+      return _scipy_sparse_row_slice(t, start, end)
+    if isinstance(t, tf.SparseTensor):
+      rank = t.dense_shape.shape[0]
+      return tf.sparse.slice(
+          t, [start] + [0] * (rank - 1),
+          tf.concat([[end - start], t.dense_shape[1:]], axis=0))
     return t[start:end]
 
   train_arrays = tf.nest.map_structure(
@@ -1688,5 +2148,30 @@ def _scipy_sparse_to_sparse_tensor(t):
   return tf.SparseTensor(indices, data, shape)
 
 
+def _scipy_sparse_row_slice(t, start, end):
+  """Returns the rows `start:end` of a SciPy sparse matrix as a CSR matrix.
+
+  Unlike `t[start:end]`, the values and column indices of the result are views
+  of the ones of `t` (or of its CSR conversion if `t` is not a CSR matrix),
+  unless SciPy prunes them because they are much smaller than `t`.
+
+  Args:
+    t: A SciPy sparse matrix.
+    start: Index of the first row.
+    end: Index after the last row.
+
+  Returns:
+    A `scipy.sparse.csr_matrix`.
+  """
+  from scipy import sparse  # pylint: disable=g-import-not-at-top
+
+  t = t.tocsr()
+  value_start, value_end = t.indptr[start], t.indptr[end]
+  return sparse.csr_matrix(
+      (t.data[value_start:value_end], t.indices[value_start:value_end],
+       t.indptr[start:end + 1] - value_start),
+      shape=(end - start,) + t.shape[1:], copy=False)
+
+
 def _is_distributed_dataset(ds):
   return isinstance(ds, tf.distribute.DistributedDataset)
@@ -17,6 +17,8 @@
 import tensorflow.compat.v2 as tf
 
 import math
+import os
+import time
 
 from absl.testing import parameterized
 import numpy as np
@@ -602,6 +604,85 @@ class GenericArrayLikeDataAdapterTest(DataAdapterTestBase):
     # Check that each elements appears, and only once.
     self.assertAllClose(x, np.sort(second_epoch_data))
 
+  def _assert_contiguous_blocks(self, indices, num_samples, block_size):
+    # Check that each elements appears, and only once.
+    self.assertAllEqual(np.sort(indices), np.arange(num_samples))
+    position = 0
+    while position < len(indices):
+      start = indices[position]
+      self.assertEqual(start % block_size, 0)
+      # Only the last block of samples can be partial.
+      size = min(block_size, num_samples - start)
+      self.assertAllEqual(indices[position:position + size],
+                          np.arange(start, start + size))
+      position += size
+
+  def test_shuffle_blocks(self):
+    indices = data_adapter._shuffle_blocks(51, 4).numpy()
+    self._assert_contiguous_blocks(indices, 51, 4)
+    self.assertNotAllClose(indices, np.arange(51))
+
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_block_shuffle_correctness(self):
+    num_samples = 51
+    batch_size = 8
+    block_size = batch_size // data_adapter._BLOCKS_PER_BATCH
+    x = DummyArrayLike(np.arange(num_samples))
+    adapter = self.adapter_cls(
+        x, batch_size=batch_size, shuffle='block', epochs=2)
+    ds_iter = iter(adapter.get_dataset())
+
+    epochs_data = []
+    for _ in range(2):
+      epoch_data = np.concatenate(
+          [next(ds_iter).numpy() for _ in range(adapter.get_size())])
+      # The final block, of sample 50 only, is partial.
+      self._assert_contiguous_blocks(epoch_data, num_samples, block_size)
+      # Check that shuffling occurred.
+      self.assertNotAllClose(epoch_data, np.arange(num_samples))
+      epochs_data.append(epoch_data)
+    # Check that shuffling is different across epochs.
+    self.assertNotAllClose(epochs_data[0], epochs_data[1])
+
+  def test_coalesce_indices(self):
+    self.assertEqual(
+        data_adapter._coalesce_indices(np.array([0, 1, 2, 5, 6, 9])),
+        [(0, 3), (5, 7), (9, 10)])
+    self.assertEqual(
+        data_adapter._coalesce_indices(np.array([1, 3, 5])),
+        [(1, 2), (3, 4), (5, 6)])
+    self.assertEqual(data_adapter._coalesce_indices(np.array([4])), [(4, 5)])
+    self.assertEqual(
+        data_adapter._coalesce_indices(np.array([], dtype=np.int64)), [])
+
+  def test_reads_are_coalesced(self):
+    reads = []
+
+    class RecordingArrayLike(DummyArrayLike):
+
+      def __getitem__(self, key):
+        reads.append(key)
+        return super(RecordingArrayLike, self).__getitem__(key)
+
+    data = np.arange(20).reshape((10, 2))
+    reader = data_adapter._ArrayLikeBatchReader(
+        [RecordingArrayLike(data)], num_threads=1)
+    indices = np.array([7, 1, 2, 8, 0])
+    batch, = reader.read(indices)
+    # The unsorted indices come back in the requested order.
+    self.assertAllEqual(batch, data[indices])
+    self.assertCountEqual(reads, [slice(0, 3), slice(7, 9)])
+
+    # Reads on several threads give the same batch.
+    threaded_reader = data_adapter._ArrayLikeBatchReader(
+        [RecordingArrayLike(data)], num_threads=4)
+    threaded_batch, = threaded_reader.read(indices)
+    self.assertAllEqual(threaded_batch, batch)
+    self.assertIsNotNone(threaded_reader._executor)
+
+    empty_batch, = reader.read(np.array([], dtype=np.int64))
+    self.assertEqual(empty_batch.shape, (0, 2))
+
   @parameterized.named_parameters(
       ('batch_size_5', 5, None, 5),
       ('batch_size_50', 50, 4, 50),  # Sanity check: batch_size takes precedence
@@ -633,6 +714,113 @@ class GenericArrayLikeDataAdapterTest(DataAdapterTestBase):
     self.assertEqual(adapter.partial_batch_size(), partial_batch_size or None)
 
 
+class MemmapDataAdapterTest(DataAdapterTestBase):
+
+  def setUp(self):
+    super(MemmapDataAdapterTest, self).setUp()
+    self.adapter_cls = data_adapter.MemmapDataAdapter
+    self.memmap_input = np.lib.format.open_memmap(
+        os.path.join(self.get_temp_dir(), 'input.npy'), mode='w+',
+        dtype='float64', shape=(50, 10))
+    self.memmap_input[:] = self.numpy_input
+
+  def test_can_handle(self):
+    self.assertTrue(self.adapter_cls.can_handle(self.memmap_input))
+    self.assertTrue(
+        self.adapter_cls.can_handle(self.memmap_input, self.numpy_target))
+    self.assertTrue(
+        self.adapter_cls.can_handle(self.memmap_input, self.tensor_target))
+
+    self.assertFalse(self.adapter_cls.can_handle(self.numpy_input))
+    self.assertFalse(self.adapter_cls.can_handle(self.tensor_input))
+    self.assertFalse(
+        self.adapter_cls.can_handle(self.memmap_input, self.arraylike_target))
+
+    # Adapters are mutually exclusive.
+    self.assertIs(
+        data_adapter.select_data_adapter(self.memmap_input, self.numpy_target),
+        self.adapter_cls)
+
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_training(self):
+    self.model.compile(loss='sparse_categorical_crossentropy', optimizer='sgd',
+                       run_eagerly=test_utils.should_run_eagerly())
+    self.model.fit(self.memmap_input, self.numpy_target, batch_size=5)
+    self.model.fit(self.memmap_input, self.numpy_target, shuffle=True,
+                   batch_size=5, workers=2, max_queue_size=2)
+    self.model.evaluate(self.memmap_input, self.numpy_target, batch_size=5)
+    self.model.predict(self.memmap_input, batch_size=5)
+
+  def test_no_array_like_warning(self):
+    with tf.compat.v1.test.mock.patch.object(
+        data_adapter.logging, 'warning') as mock_log:
+      adapter = self.adapter_cls(
+          self.memmap_input, self.numpy_target, batch_size=5, workers=3)
+      mock_log.assert_not_called()
+      data_adapter.GenericArrayLikeDataAdapter(
+          self.arraylike_input, self.arraylike_target, batch_size=5)
+      mock_log.assert_called_once()
+    self.assertEqual(adapter._num_read_threads, 3)
+
+  def test_batches_are_not_loaded_in_memory(self):
+    x = np.lib.format.open_memmap(
+        os.path.join(self.get_temp_dir(), 'x.npy'), mode='w+',
+        dtype='float32', shape=(10, 1))
+    x[:] = np.arange(10).reshape(10, 1)
+    adapter = self.adapter_cls(x, batch_size=5)
+    batch = next(iter(adapter.get_dataset()))
+    self.assertAllClose(batch, x[:5])
+    # Batches of consecutive samples are views of the memmap.
+    reader = data_adapter._ArrayLikeBatchReader([x], num_threads=1)
+    self.assertTrue(np.shares_memory(reader.read(np.arange(5))[0], x))
+    self.assertAllClose(reader.read(np.array([3, 1]))[0], [[3], [1]])
+
+  def test_gathers_use_read_threads(self):
+    x = np.lib.format.open_memmap(
+        os.path.join(self.get_temp_dir(), 'x.npy'), mode='w+',
+        dtype='int64', shape=(100, 2))
+    x[:] = np.arange(200).reshape(100, 2)
+    indices = np.random.permutation(100)[:37]
+    reader = data_adapter._ArrayLikeBatchReader(
+        [x, np.arange(100)], num_threads=4)
+    batch, target = reader.read(indices)
+    self.assertAllEqual(batch, x[indices])
+    self.assertAllEqual(target, indices)
+    self.assertIsNotNone(reader._executor)
+    # A single thread gathers the batch without the pool.
+    reader = data_adapter._ArrayLikeBatchReader([x], num_threads=1)
+    self.assertAllEqual(reader.read(indices)[0], x[indices])
+    self.assertIsNone(reader._executor)
+
+  def test_window_shuffle_correctness(self):
+    num_samples = 1000
+    batch_size = 8
+    x = np.lib.format.open_memmap(
+        os.path.join(self.get_temp_dir(), 'x.npy'), mode='w+',
+        dtype='int64', shape=(num_samples,))
+    x[:] = np.arange(num_samples)
+    adapter = self.adapter_cls(
+        x, batch_size=batch_size, shuffle=True, epochs=2)
+    self.assertEqual(adapter.get_size(), 125)
+
+    window_size = batch_size * data_adapter._MEMMAP_SHUFFLE_WINDOW_BATCHES
+    ds_iter = iter(adapter.get_dataset())
+    epochs_data = []
+    for _ in range(2):
+      batches = [next(ds_iter).numpy() for _ in range(adapter.get_size())]
+      for batch in batches:
+        # Each batch is drawn from a single window of samples.
+        self.assertLen(set(batch // window_size), 1)
+      epoch_data = np.concatenate(batches)
+      # Check that shuffling occurred.
+      self.assertNotAllClose(x, epoch_data)
+      # Check that each elements appears, and only once.
+      self.assertAllClose(x, np.sort(epoch_data))
+      epochs_data.append(epoch_data)
+    # Check that shuffling is different across epochs.
+    self.assertNotAllClose(epochs_data[0], epochs_data[1])
+
+
 class DatasetAdapterTest(DataAdapterTestBase):
 
   def setUp(self):
@@ -761,6 +949,48 @@ class GeneratorDataAdapterTest(DataAdapterTestBase):
     self.assertEqual(out, 0)
 
 
+class GeneratorFactoryAdapterTest(DataAdapterTestBase):
+
+  def setUp(self):
+    super(GeneratorFactoryAdapterTest, self).setUp()
+    self.adapter_cls = data_adapter.GeneratorFactoryAdapter
+
+    def generator_fn(index):
+      for i in range(5):
+        yield (np.full((self.batch_size, 10), index * 10 + i),
+               np.ones(self.batch_size))
+    self.factory_input = data_utils.GeneratorFactory(generator_fn)
+
+  def test_can_handle(self):
+    self.assertTrue(self.adapter_cls.can_handle(self.factory_input))
+    self.assertFalse(self.adapter_cls.can_handle(self.generator_input))
+    self.assertFalse(self.adapter_cls.can_handle(self.sequence_input))
+    self.assertIs(data_adapter.select_data_adapter(self.factory_input, None),
+                  self.adapter_cls)
+
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_training(self):
+    self.model.compile(loss='sparse_categorical_crossentropy', optimizer='sgd',
+                       run_eagerly=test_utils.should_run_eagerly())
+    history = self.model.fit(self.factory_input, workers=3)
+    self.assertLen(history.history['loss'], 1)
+    self.model.evaluate(self.factory_input, workers=3)
+    self.assertLen(self.model.predict(self.factory_input, workers=3), 75)
+
+  def test_interleaves_generators(self):
+    adapter = self.adapter_cls(self.factory_input, workers=3)
+    values = [int(x[0, 0]) for x, _ in adapter.get_dataset()]
+    self.assertCountEqual(
+        values, [index * 10 + i for index in range(3) for i in range(5)])
+    # The generator that was peeked at is not consumed twice.
+    self.assertCountEqual(
+        [int(x[0, 0]) for x, _ in adapter.get_dataset()], values)
+
+  def test_multiprocessing_not_supported(self):
+    with self.assertRaisesRegex(ValueError, 'is not supported'):
+      self.adapter_cls(self.factory_input, workers=2, use_multiprocessing=True)
+
+
 class KerasSequenceAdapterTest(DataAdapterTestBase):
 
   def setUp(self):
@@ -795,6 +1025,34 @@ class KerasSequenceAdapterTest(DataAdapterTestBase):
     self.model.fit(self.sequence_input, workers=1, use_multiprocessing=True,
                    max_queue_size=10, steps_per_epoch=10)
 
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_training_with_threads(self):
+    self.model.compile(loss='sparse_categorical_crossentropy', optimizer='sgd',
+                       run_eagerly=test_utils.should_run_eagerly())
+    self.model.fit(self.sequence_input, workers=3, epochs=2)
+
+  def test_threads_keep_order(self):
+
+    class IndexSequence(data_utils.Sequence):
+
+      def __getitem__(self, item):
+        return np.full((2, 1), item)
+
+      def __len__(self):
+        return 11
+
+    adapter = self.adapter_cls(IndexSequence(), workers=3)
+    self.assertEqual(
+        [int(x[0, 0]) for x in adapter.get_dataset()], list(range(11)))
+
+    adapter = self.adapter_cls(IndexSequence(), workers=3, shuffle=True)
+    epoch_orders = [[int(x[0, 0]) for x in adapter.get_dataset()]
+                    for _ in range(2)]
+    for order in epoch_orders:
+      self.assertCountEqual(order, range(11))
+    # Each epoch has its own order, shared by all the workers.
+    self.assertNotEqual(epoch_orders[0], epoch_orders[1])
+
   def test_size(self):
     adapter = self.adapter_cls(self.sequence_input)
     self.assertEqual(adapter.get_size(), 10)
@@ -989,6 +1247,71 @@ class DataHandlerTest(test_combinations.TestCase):
     self.assertEqual(returned_data, [[([0],), ([1],),
                                       ([2],)], [([0],), ([1],), ([2],)]])
 
+  def _consume_data_production_time(self, x, **kwargs):
+    data_handler = data_adapter.DataHandler(x, epochs=1, **kwargs)
+    self.assertEqual(data_handler.data_production_time, 0.)
+    for _, iterator in data_handler.enumerate_epochs():
+      with data_handler.catch_stop_iteration():
+        for _ in data_handler.steps():
+          next(iterator)
+    return data_handler.data_production_time
+
+  def test_generator_data_production_time(self):
+
+    def generator():
+      for step in range(4):
+        time.sleep(0.02)
+        yield (tf.convert_to_tensor([step]),)
+
+    # The first batch is peeked when the adapter is created.
+    production_time = self._consume_data_production_time(generator())
+    self.assertGreaterEqual(production_time, 0.06)
+
+  def test_parallel_data_production_time(self):
+
+    def generator_fn(index):
+      for step in range(2):
+        time.sleep(0.02)
+        yield (np.array([index * 2 + step]),)
+
+    # Only the first batch of the first generator is peeked, and the two
+    # generators run concurrently.
+    production_time = self._consume_data_production_time(
+        data_utils.GeneratorFactory(generator_fn), workers=2)
+    self.assertGreaterEqual(production_time, 0.04)
+
+    class SleepSequence(data_utils.Sequence):
+
+      def __getitem__(self, item):
+        time.sleep(0.02)
+        return np.array([item])
+
+      def __len__(self):
+        return 4
+
+    production_time = self._consume_data_production_time(
+        SleepSequence(), workers=2)
+    self.assertGreaterEqual(production_time, 0.04)
+
+  def test_parallel_data_production_time_is_wall_time(self):
+
+    class SleepSequence(data_utils.Sequence):
+
+      def __getitem__(self, item):
+        time.sleep(0.05)
+        return np.array([item])
+
+      def __len__(self):
+        return 16
+
+    start_time = time.time()
+    production_time = self._consume_data_production_time(
+        SleepSequence(), workers=4)
+    elapsed_time = time.time() - start_time
+    # The 4 workers sleep at the same time, which is only counted once.
+    self.assertGreaterEqual(production_time, 0.2)
+    self.assertLessEqual(production_time, elapsed_time)
+
   def test_composite_tensor(self):
     st = tf.SparseTensor(
         indices=[[0, 0], [1, 0], [2, 0]], values=[0, 1, 2], dense_shape=[3, 1])
@@ -1037,6 +1360,37 @@ class DataHandlerTest(test_combinations.TestCase):
     self.assertEqual(returned_data, [[([0],), ([1],),
                                       ([2],)], [([0],), ([1],), ([2],)]])
 
+  @parameterized.named_parameters(
+      ('sparse', 'sparse'), ('one_hot', 'one_hot'),
+      ('one_hot_unknown_shape', 'one_hot_unknown_shape'))
+  def test_class_weight_with_sample_weight(self, target_format):
+    x = np.ones((4, 1))
+    classes = np.array([0, 2, 1, 2])
+    sw = np.array([1., 2., 3., 4.])
+    class_weight = {0: 0.5, 1: 1., 2: 1.5}
+    if target_format == 'sparse':
+      y = classes
+    else:
+      y = np.eye(3)[classes]
+    if target_format == 'one_hot_unknown_shape':
+      # The number of columns of the targets is only known at runtime.
+      def generator():
+        yield x, y, sw
+      dataset = tf.data.Dataset.from_generator(
+          generator, output_signature=(
+              tf.TensorSpec((None, 1), tf.float64),
+              tf.TensorSpec((None, None), tf.float64),
+              tf.TensorSpec((None,), tf.float64)))
+      data_handler = data_adapter.DataHandler(
+          dataset, steps_per_epoch=1, class_weight=class_weight)
+    else:
+      data_handler = data_adapter.DataHandler(
+          x, y, sample_weight=sw, batch_size=4, class_weight=class_weight)
+
+    for _, iterator in data_handler.enumerate_epochs():
+      _, _, returned_sw = next(iterator)
+    self.assertAllClose(returned_sw, [0.5, 3., 3., 6.])
+
   def test_class_weight_user_errors(self):
     with self.assertRaisesRegex(ValueError, 'to be a dict with keys'):
       data_adapter.DataHandler(
@@ -1110,6 +1464,73 @@ class TestValidationSplit(test_combinations.TestCase):
     self.assertEqual(val_y.numpy().tolist(), [8])
     self.assertEqual(val_sw.numpy().tolist(), [16])
 
+  def test_validation_split_views(self):
+    x = np.arange(20.).reshape((10, 2))
+    memmap_x = np.lib.format.open_memmap(
+        os.path.join(self.get_temp_dir(), 'x.npy'), mode='w+',
+        dtype='float32', shape=(10, 2))
+    (train_x, train_memmap_x), (val_x, val_memmap_x) = (
+        data_adapter.train_validation_split(
+            (x, memmap_x), validation_split=0.2))
+
+    self.assertTrue(np.shares_memory(train_x, x))
+    self.assertTrue(np.shares_memory(val_x, x))
+    self.assertAllEqual(val_x, x[8:])
+    self.assertIsInstance(train_memmap_x, np.memmap)
+    self.assertIsInstance(val_memmap_x, np.memmap)
+
+  def test_validation_split_pandas(self):
+    try:
+      import pandas as pd  # pylint: disable=g-import-not-at-top
+    except ImportError:
+      self.skipTest('Skipping test because pandas is not installed.')
+    x = np.arange(20.).reshape((10, 2))
+    df = pd.DataFrame(x, index=list('abcdefghij'))
+    series = pd.Series(np.arange(10), index=np.arange(10)[::-1])
+    (train_df, train_series), (val_df, val_series) = (
+        data_adapter.train_validation_split(
+            (df, series), validation_split=0.2))
+
+    self.assertAllEqual(train_df.values, x[:8])
+    self.assertAllEqual(val_series.values, [8, 9])
+    self.assertTrue(np.shares_memory(train_df.values, x))
+    self.assertTrue(np.shares_memory(val_series.values, series.values))
+
+  def test_validation_split_sparse(self):
+    try:
+      import scipy.sparse  # pylint: disable=g-import-not-at-top
+    except ImportError:
+      self.skipTest('Skipping test because scipy is not installed.')
+    x = np.eye(10, 4) + np.eye(10, 4, k=-4)
+    csr_x = scipy.sparse.csr_matrix(x)
+    (train_csr_x, train_coo_x, train_sparse_x), (
+        val_csr_x, val_coo_x, val_sparse_x) = (
+            data_adapter.train_validation_split(
+                (csr_x, csr_x.tocoo(), tf.sparse.from_dense(x)),
+                validation_split=0.2))
+
+    self.assertAllEqual(train_csr_x.toarray(), x[:8])
+    self.assertAllEqual(val_csr_x.toarray(), x[8:])
+    self.assertTrue(np.shares_memory(train_csr_x.data, csr_x.data))
+    self.assertAllEqual(train_coo_x.toarray(), x[:8])
+    self.assertAllEqual(val_coo_x.toarray(), x[8:])
+    self.assertAllEqual(tf.sparse.to_dense(train_sparse_x), x[:8])
+    self.assertAllEqual(tf.sparse.to_dense(val_sparse_x), x[8:])
+
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_validation_split_sparse_training(self):
+    try:
+      import scipy.sparse  # pylint: disable=g-import-not-at-top
+    except ImportError:
+      self.skipTest('Skipping test because scipy is not installed.')
+    x = scipy.sparse.random(50, 10, density=0.2, format='csr')
+    y = np.ones((50, 1))
+    model = keras.models.Sequential([keras.layers.Dense(1, input_shape=(10,))])
+    model.compile(loss='mse', optimizer='sgd',
+                  run_eagerly=test_utils.should_run_eagerly())
+    history = model.fit(x, y, batch_size=5, validation_split=0.2)
+    self.assertIn('val_loss', history.history)
+
   def test_validation_split_user_error(self):
     with self.assertRaisesRegex(ValueError, 'is only supported for Tensors'):
       data_adapter.train_validation_split(
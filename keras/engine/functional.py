@@ -18,6 +18,7 @@
 
 import collections
 import copy
+import heapq
 import itertools
 import warnings
 from keras import backend
@@ -31,6 +32,7 @@ from keras.engine import training as training_lib
 from keras.engine import training_utils
 from keras.saving.saved_model import network_serialization
 from keras.utils import generic_utils
+from keras.utils import object_identity
 from keras.utils import tf_inspect
 from keras.utils import tf_utils
 import tensorflow.compat.v2 as tf
@@ -234,7 +236,8 @@ class Functional(training_lib.Model):
     self._self_tracked_trackables = layers
     self._layer_call_argspecs = {}
     for layer in self._self_tracked_trackables:
-      self._layer_call_argspecs[layer] = tf_inspect.getfullargspec(layer.call)
+      # Reuse the argspec cached when the layer was called.
+      self._layer_call_argspecs[layer] = layer._call_full_argspec
 
     # Build self.input_names and self.output_names.
     self._set_output_names()
@@ -255,6 +258,7 @@ class Functional(training_lib.Model):
         self._feed_inputs.append(layer.input)
 
     self._compute_tensor_usage_count()
+    self._compile_execution_plan()
     self._set_save_spec(self._nested_inputs)
     tf_utils.assert_no_legacy_layers(self.layers)
 
@@ -563,39 +567,28 @@ class Functional(training_lib.Model):
     for input_t, mask in zip(inputs, masks):
       input_t._keras_mask = mask
 
-    # Dictionary mapping reference tensors to computed tensors.
-    tensor_dict = {}
-    tensor_usage_count = self._tensor_usage_count
-    for x, y in zip(self.inputs, inputs):
-      y = self._conform_to_reference_input(y, ref_input=x)
-      x_id = str(id(x))
-      tensor_dict[x_id] = [y] * tensor_usage_count[x_id]
-
-    nodes_by_depth = self._nodes_by_depth
-    depth_keys = list(nodes_by_depth.keys())
-    depth_keys.sort(reverse=True)
-
-    for depth in depth_keys:
-      nodes = nodes_by_depth[depth]
-      for node in nodes:
-        if node.is_input:
-          continue  # Input tensors already exist.
-
-        if any(t_id not in tensor_dict for t_id in node.flat_input_ids):
-          continue  # Node is not computable, try skipping.
-
-        args, kwargs = node.map_arguments(tensor_dict)
-        outputs = node.layer(*args, **kwargs)
-
-        # Update tensor_dict.
-        for x_id, y in zip(node.flat_output_ids, tf.nest.flatten(outputs)):
-          tensor_dict[x_id] = [y] * tensor_usage_count[x_id]
+    # Computed tensors, indexed by the slots of the execution plan.
+    num_slots, steps, output_slots = self._execution_plan
+    computed = [None] * num_slots
+    for i, (x, y) in enumerate(zip(self.inputs, inputs)):
+      if not _conforms_to_reference_input(y, x):
+        y = self._conform_to_reference_input(y, ref_input=x)
+      computed[i] = y
+
+    for node, input_slots, node_output_slots, released_slots in steps:
+      args, kwargs = node.map_keras_inputs(
+          [computed[slot] for slot in input_slots])
+      outputs = node.layer(*args, **kwargs)
+      for slot, y in zip(node_output_slots, tf.nest.flatten(outputs)):
+        computed[slot] = y
+      # Release tensors that are no longer needed.
+      for slot in released_slots:
+        computed[slot] = None
 
     output_tensors = []
-    for x in self.outputs:
-      x_id = str(id(x))
-      assert x_id in tensor_dict, 'Could not compute output ' + str(x)
-      output_tensors.append(tensor_dict[x_id].pop())
+    for x, slot in zip(self.outputs, output_slots):
+      assert slot is not None, 'Could not compute output ' + str(x)
+      output_tensors.append(computed[slot])
 
     return tf.nest.pack_sequence_as(self._nested_outputs, output_tensors)
 
@@ -813,6 +806,7 @@ class Functional(training_lib.Model):
     self._handle_deferred_layer_dependencies(deferred_layers)
 
     self._compute_tensor_usage_count()
+    self._compile_execution_plan()
 
   def _compute_tensor_usage_count(self):
     """Compute the #. of tensor usages for all the output tensors of layers.
@@ -845,6 +839,54 @@ class Functional(training_lib.Model):
 
     self._tensor_usage_count = tensor_usage_count
 
+  @tf.__internal__.tracking.no_automatic_dependency_tracking
+  def _compile_execution_plan(self):
+    """Precomputes the steps `_run_internal_graph` runs to call the model.
+
+    Each tensor computed when calling the model is assigned an integer slot,
+    the inputs taking the first slots in the order of `self.inputs`. The plan
+    is saved as `self._execution_plan`, a tuple of:
+      - The number of slots.
+      - The steps, one per computable node, in the order they must be run.
+        Each step is a tuple of the node, the slots of its `keras_inputs`,
+        the slots of its flattened outputs, and the slots that are no longer
+        needed once the node is computed. Releasing those saves memory in
+        eager computation, like `self._tensor_usage_count` does.
+      - The slots of `self.outputs` (`None` for outputs not computable from
+        `self.inputs`).
+    """
+    slots = {str(id(x)): i for i, x in enumerate(self.inputs)}
+    steps = []
+    last_use = {}  # Slot -> index of the last step using it.
+    depth_keys = list(self._nodes_by_depth.keys())
+    depth_keys.sort(reverse=True)
+    for depth in depth_keys:
+      for node in self._nodes_by_depth[depth]:
+        if node.is_input:
+          continue  # Input tensors already exist.
+        if any(t_id not in slots for t_id in node.flat_input_ids):
+          continue  # Node is not computable.
+        input_slots = tuple(slots[t_id] for t_id in node.flat_input_ids)
+        for slot in input_slots:
+          last_use[slot] = len(steps)
+        output_slots = []
+        for t_id in node.flat_output_ids:
+          slots[t_id] = len(slots)
+          output_slots.append(slots[t_id])
+          last_use[slots[t_id]] = len(steps)  # Unless used by a later node.
+        steps.append((node, input_slots, tuple(output_slots)))
+
+    model_output_slots = tuple(slots.get(str(id(x))) for x in self.outputs)
+    released_slots = collections.defaultdict(list)
+    for slot, step_index in last_use.items():
+      if slot not in model_output_slots:
+        released_slots[step_index].append(slot)
+    steps = tuple(step + (tuple(released_slots[i]),)
+                  for i, step in enumerate(steps))
+    self._execution_plan = (len(slots), steps, model_output_slots)
+    # The outcome of the checks of previous calls may no longer hold.
+    self._fast_inference_call_cache.clear()
+
   def _assert_weights_created(self):
     # Override the implementation in Model.
     # The Functional model should always have weight created already.
@@ -906,8 +948,14 @@ def _map_graph_network(inputs, outputs):
   # "depth" is number of layers between output Node and the Node.
   # Nodes are ordered from inputs -> outputs.
   nodes_in_decreasing_depth, layer_indices = _build_map(outputs)
+  # Index the nodes of each layer once, rather than searching
+  # `layer._inbound_nodes` for every node of shared layers.
+  node_indices = {}
+  for layer in layer_indices:
+    for i, node in enumerate(layer._inbound_nodes):
+      node_indices[node] = i
   network_nodes = {
-      _make_node_key(node.layer.name, node.layer._inbound_nodes.index(node))
+      _make_node_key(node.layer.name, node_indices[node])
       for node in nodes_in_decreasing_depth
   }
 
@@ -997,11 +1045,11 @@ def _map_graph_network(inputs, outputs):
 
   # Ensure name unicity, which will be crucial for serialization
   # (since serialized nodes refer to layers by their name).
-  all_names = [layer.name for layer in layers]
-  for name in all_names:
-    if all_names.count(name) != 1:
+  name_counts = collections.Counter(layer.name for layer in layers)
+  for layer in layers:
+    if name_counts[layer.name] != 1:
       raise ValueError(
-          f'The name "{name}" is used {all_names.count(name)} '
+          f'The name "{layer.name}" is used {name_counts[layer.name]} '
           'times in the model. All layer names should be unique.')
   return network_nodes, nodes_by_depth, layers, layers_by_depth
 
@@ -1039,33 +1087,48 @@ def _build_map(outputs):
 
 def _build_map_helper(tensor, finished_nodes, nodes_in_progress,
                       nodes_in_decreasing_depth, layer_indices):
-  """Recursive helper for `_build_map`."""
-  layer, node_index, _ = tensor._keras_history  # pylint: disable=protected-access
-  node = layer._inbound_nodes[node_index]  # pylint: disable=protected-access
-
-  # Don't repeat work for shared subgraphs
-  if node in finished_nodes:
-    return
+  """Iterative depth-first helper for `_build_map`.
 
-  # Prevent cycles.
-  if node in nodes_in_progress:
-    raise ValueError(f'Tensor {tensor} from layer "{layer.name}" '
-                     'is part of a cycle.')
+  The traversal is iterative rather than recursive so that it does not run
+  into the recursion limit on deep graphs.
+  """
+  # Stack of the nodes in progress, each with an iterator over the tensors
+  # still to be visited before the node is finished.
+  stack = []
 
-  # Store the traversal order for layer sorting.
-  if layer not in layer_indices:
-    layer_indices[layer] = len(layer_indices)
+  def start_visit(tensor):
+    layer, node_index, _ = tensor._keras_history  # pylint: disable=protected-access
+    node = layer._inbound_nodes[node_index]  # pylint: disable=protected-access
 
-  # Propagate to all previous tensors connected to this node.
-  nodes_in_progress.add(node)
-  if not node.is_input:
-    for tensor in node.keras_inputs:
-      _build_map_helper(tensor, finished_nodes, nodes_in_progress,
-                        nodes_in_decreasing_depth, layer_indices)
+    # Don't repeat work for shared subgraphs
+    if node in finished_nodes:
+      return
 
-  finished_nodes.add(node)
-  nodes_in_progress.remove(node)
-  nodes_in_decreasing_depth.append(node)
+    # Prevent cycles.
+    if node in nodes_in_progress:
+      raise ValueError(f'Tensor {tensor} from layer "{layer.name}" '
+                       'is part of a cycle.')
+
+    # Store the traversal order for layer sorting.
+    if layer not in layer_indices:
+      layer_indices[layer] = len(layer_indices)
+
+    # Propagate to all previous tensors connected to this node.
+    nodes_in_progress.add(node)
+    inbound_tensors = () if node.is_input else node.keras_inputs
+    stack.append((node, iter(inbound_tensors)))
+
+  start_visit(tensor)
+  while stack:
+    node, inbound_tensors = stack[-1]
+    for tensor in inbound_tensors:
+      start_visit(tensor)
+      break
+    else:
+      stack.pop()
+      finished_nodes.add(node)
+      nodes_in_progress.remove(node)
+      nodes_in_decreasing_depth.append(node)
 
 
 def _map_subgraph_network(inputs, outputs):
@@ -1085,6 +1148,25 @@ def _map_subgraph_network(inputs, outputs):
   return tf.nest.flatten([nodes for nodes in nodes_by_depth.values()]), layers
 
 
+def _conforms_to_reference_input(tensor, ref_input):
+  """Returns whether `_conform_to_reference_input` would return `tensor` as is.
+
+  This is a cheap check letting `_run_internal_graph` skip the conversion
+  when the inputs already match the `keras.Input`s, which is the common case.
+  """
+  if not isinstance(tensor, tf.Tensor) or tensor.dtype != ref_input.dtype:
+    return False
+  t_shape = tensor.shape
+  ref_shape = ref_input.shape
+  if t_shape.rank is None or t_shape.rank != ref_shape.rank:
+    return False
+  if tf.executing_eagerly():
+    return True
+  # Traced tensors get shape hints from, or warn about, the reference shape.
+  return all(ref_dim is None or t_dim == ref_dim
+             for t_dim, ref_dim in zip(t_shape.as_list(), ref_shape.as_list()))
+
+
 def _should_skip_first_node(layer):
   """Returns True if the first layer node should not be saved or loaded."""
   # Networks that are constructed with an Input layer/shape start with a
@@ -1102,8 +1184,9 @@ def _should_skip_first_node(layer):
 def connect_ancillary_layers(model, created_layers):
   """Adds layers that are not connected to the outputs to the model."""
   # Layers not connected to outputs, such as those added in `add_loss`.
+  model_layers = object_identity.ObjectIdentitySet(model.layers)
   ancillary_layers = [
-      layer for layer in created_layers.values() if layer not in model.layers
+      layer for layer in created_layers.values() if layer not in model_layers
   ]
   if ancillary_layers:
     relevant_nodes = tf.nest.flatten([
@@ -1275,27 +1358,78 @@ def reconstruct_from_config(config, custom_objects=None, created_layers=None):
       # (e.g. a model such as A(B(A(B(x)))))
       unprocessed_nodes[layer].append(node_data)
 
+  def get_node_dependencies(node_data):
+    """Returns the keys of the unprocessed nodes a node takes inputs from."""
+    dependencies = set()
+    for input_data in tf.nest.flatten(node_data):
+      input_data = input_data.as_list()
+      if len(input_data) not in (3, 4):
+        raise ValueError('Improperly formatted model config.')
+      if input_data[0] != node_module._CONSTANT_VALUE:
+        dependencies.add((input_data[0], input_data[1]))
+      if len(input_data) == 4:
+        kwargs = tf_utils.convert_inner_node_data(input_data[3], wrap=True)
+        for t in tf.nest.flatten(kwargs):
+          if isinstance(t, tf_utils.ListWrapper):
+            t = t.as_list()
+            dependencies.add((t[0], t[1]))
+    # Input layers need no processing (see `get_node_index`).
+    return {(layer_name, node_index)
+            for layer_name, node_index in dependencies
+            if not isinstance(created_layers[layer_name],
+                              input_layer_module.InputLayer)}
+
   # First, we create all layers and enqueue nodes to be processed
   for layer_data in config['layers']:
     process_layer(layer_data)
-  # Then we process nodes in order of layer depth.
-  # Nodes that cannot yet be processed (if the inbound node
-  # does not yet exist) are re-enqueued, and the process
-  # is repeated until all nodes are processed.
-  while unprocessed_nodes:
-    for layer_data in config['layers']:
-      layer = created_layers[layer_data['name']]
-      if layer in unprocessed_nodes:
-        layer_nodes = unprocessed_nodes.pop(layer)
-        while layer_nodes:
-          node_data = layer_nodes[0]
-          if process_node(layer, node_data):
-            layer_nodes.pop(0)
-          else:
-            # If a node can't be processed, stop processing the nodes of
-            # the current layer to maintain node ordering.
-            unprocessed_nodes[layer] = layer_nodes
-            break
+
+  # Then we process all nodes in a single topological pass. Nodes are keyed by
+  # the config name of their layer and their config node index, as in the node
+  # data of the nodes they feed into. A node is processed once all the nodes it
+  # takes inputs from have been. Among the nodes ready to be processed, nodes
+  # are processed in the order of their layers in the config, so that a config
+  # listing the layers in topological order is processed in that order.
+  node_args = {}  # Key -> (sort key, layer, node data).
+  dependents = collections.defaultdict(list)  # Key -> keys of dependents.
+  num_pending_dependencies = {}
+  ready_nodes = []  # Heap of (sort key, key).
+  for layer_position, layer_data in enumerate(config['layers']):
+    layer_name = layer_data['name']
+    layer = created_layers[layer_name]
+    first_node_index = node_count_by_layer[layer]
+    for node_position, node_data in enumerate(
+        unprocessed_nodes.pop(layer, [])):
+      key = (layer_name, first_node_index + node_position)
+      sort_key = (layer_position, node_position)
+      node_args[key] = (sort_key, layer, node_data)
+      dependencies = get_node_dependencies(node_data)
+      if node_position:
+        # Maintain the node ordering of shared layers.
+        dependencies.add((layer_name, key[1] - 1))
+      num_pending_dependencies[key] = len(dependencies)
+      for dependency in dependencies:
+        dependents[dependency].append(key)
+      if not dependencies:
+        ready_nodes.append((sort_key, key))
+
+  heapq.heapify(ready_nodes)
+  while ready_nodes:
+    _, key = heapq.heappop(ready_nodes)
+    _, layer, node_data = node_args.pop(key)
+    if not process_node(layer, node_data):
+      raise ValueError('Improperly formatted model config: could not process '
+                       f'node {key[1]} of layer "{key[0]}".')
+    for dependent in dependents.pop(key, ()):
+      num_pending_dependencies[dependent] -= 1
+      if not num_pending_dependencies[dependent]:
+        heapq.heappush(ready_nodes, (node_args[dependent][0], dependent))
+
+  if node_args:
+    unprocessed_layer_names = sorted(set(name for name, _ in node_args))
+    raise ValueError(
+        'Improperly formatted model config: the inputs of the layers '
+        f'{unprocessed_layer_names} could not be resolved. Check that the '
+        'config does not contain cycles or refer to missing nodes.')
 
   input_tensors = []
   output_tensors = []
@@ -788,6 +788,74 @@ class NetworkConstructionTest(test_combinations.TestCase):
     output_val_2 = m2.predict(x_val)
     self.assertAllClose(output_val, output_val_2, atol=1e-6)
 
+  def test_from_config_with_layers_out_of_topological_order(self):
+    x = input_layer_lib.Input(shape=(5,))
+    a = layers.Dense(5, name='A')
+    b = layers.Dense(5, name='B')
+    m = training_lib.Model(x, layers.add([a(b(a(x))), x]))
+    config = m.get_config()
+    config['layers'] = config['layers'][::-1]
+
+    m2 = models.Model.from_config(config)
+    m2.set_weights(m.get_weights())
+    x_val = np.random.random((10, 5))
+    self.assertAllClose(m(x_val), m2(x_val), atol=1e-6)
+
+  def test_from_config_with_unresolvable_nodes(self):
+    x = input_layer_lib.Input(shape=(5,))
+    m = training_lib.Model(x, layers.Dense(5, name='A')(x))
+    config = m.get_config()
+    # Make the node of `A` take its own output as input.
+    config['layers'][1]['inbound_nodes'] = [[['A', 0, 0, {}]]]
+
+    with self.assertRaisesRegex(ValueError, 'could not be resolved'):
+      models.Model.from_config(config)
+
+  def test_execution_plan(self):
+    x = input_layer_lib.Input(shape=(2,))
+    a = layers.Dense(2)(x)
+    b = layers.Dense(2)(a)
+    c = layers.add([a, b])
+    m = training_lib.Model(x, [b, c])
+
+    num_slots, steps, output_slots = m._execution_plan
+    self.assertEqual(num_slots, 4)
+    self.assertEqual([step[1:] for step in steps],
+                     [((0,), (1,), (0,)),
+                      ((1,), (2,), ()),
+                      ((1, 2), (3,), (1,))])
+    self.assertEqual(output_slots, (2, 3))
+
+    # The plan is updated when layers are added.
+    s = sequential.Sequential([layers.Dense(2, input_shape=(2,))])
+    s.add(layers.Dense(3))
+    self.assertLen(s._execution_plan[1], 2)
+    self.assertEqual(s(np.ones((1, 2))).shape, (1, 3))
+
+  def test_matching_inputs_are_not_conformed(self):
+    x = input_layer_lib.Input(shape=(2,))
+    m = training_lib.Model(x, layers.Dense(2)(x))
+
+    with tf.compat.v1.test.mock.patch.object(
+        m, '_conform_to_reference_input',
+        wraps=m._conform_to_reference_input) as conform:
+      m(np.ones((1, 2), 'float32'))
+      conform.assert_not_called()
+      m(np.ones((1, 2), 'int32'))
+      conform.assert_called_once()
+
+  def test_deep_model_config_round_trip(self):
+    # Deeper than the Python recursion limit.
+    x = input_layer_lib.Input(shape=(2,))
+    y = x
+    for _ in range(1500):
+      y = layers.Activation('linear')(y)
+    m = training_lib.Model(x, y)
+
+    m2 = models.Model.from_config(m.get_config())
+    self.assertLen(m2.layers, 1501)
+    self.assertAllClose(m2(np.ones((1, 2))), np.ones((1, 2)))
+
   @test_combinations.generate(test_combinations.keras_mode_combinations())
   def test_layer_sharing_at_heterogenous_depth_with_concat(self):
     input_shape = (16, 9, 3)
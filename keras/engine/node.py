@@ -168,6 +168,26 @@ class Node:
                                            flat_arguments)
       return args, kwargs
 
+  def map_keras_inputs(self, flat_inputs):
+    """Maps Keras Tensors to the computed Tensors in `flat_inputs`.
+
+    Args:
+      flat_inputs: List of the computed Tensors, in the order of
+        `keras_inputs`.
+
+    Returns:
+      The `args` and `kwargs` to call the layer of this node with.
+    """
+    if self._single_positional_tensor_passed:
+      # Performance optimization for most common case.
+      return (flat_inputs[0],), {}
+    flat_arguments = copy.copy(self._flat_arguments)
+    for (_, kt_index), tensor in zip(self._keras_inputs_ids_and_indices,
+                                     flat_inputs):
+      flat_arguments[kt_index] = tensor
+    return tf.nest.pack_sequence_as((self.call_args, self.call_kwargs),
+                                    flat_arguments)
+
   def serialize(self, make_node_key, node_conversion_map):
     """Serializes `Node` for Functional API's `get_config`."""
     # Serialization still special-cases first argument.
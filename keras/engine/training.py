@@ -47,6 +47,7 @@ from keras.utils import tf_utils
 from keras.utils import traceback_utils
 from keras.utils import version_utils
 from keras.utils.mode_keys import ModeKeys
+import numpy as np
 import tensorflow.compat.v2 as tf
 
 from tensorflow.python.eager import context
@@ -798,6 +799,29 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
   def run_eagerly(self, value):
     self._run_eagerly = value
 
+  @property
+  def fast_inference_calls(self):
+    """Settable attribute indicating whether layers take a fast call path.
+
+    When `True`, the model and its layers take a fast path when called eagerly
+    on inputs with the same structure, shapes and dtypes as a previous call,
+    skipping checks whose outcome is cached. This reduces the overhead of
+    eager calls, e.g. when serving the model. See
+    `tf.keras.layers.enable_fast_inference_calls` for details.
+
+    Setting this attribute applies to the layers the model contains at that
+    time. When `None` (the default), the global setting applies.
+
+    Returns:
+      Boolean or `None`, whether the model's layers take the fast path.
+    """
+    return self._fast_inference_calls
+
+  @fast_inference_calls.setter
+  def fast_inference_calls(self, value):
+    for layer in self._flatten_layers():
+      layer._fast_inference_calls = value  # pylint: disable=protected-access
+
   def _validate_target_and_loss(self, y, loss):
     """Raises error if target or loss is not found.
 
@@ -1109,6 +1133,9 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
             per-replica batching and sharding logic for the `Dataset`.
             See `tf.keras.utils.experimental.DatasetCreator` doc for more
             information.
+          - A `tf.keras.utils.experimental.GeneratorFactory`, which wraps a
+            callable that creates generators like the ones above, so that
+            `workers` generators produce the batches in parallel.
           A more detailed description of unpacking behavior for iterator types
           (Dataset, generator, Sequence) is given below. If using
           `tf.distribute.experimental.ParameterServerStrategy`, only
@@ -1160,7 +1187,9 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
             the loss and any model metrics
             on this data at the end of each epoch.
             The validation data is selected from the last samples
-            in the `x` and `y` data provided, before shuffling. This argument is
+            in the `x` and `y` data provided, before shuffling. For NumPy
+            arrays and pandas objects, the training and validation data are
+            views of the inputs, which are not copied. This argument is
             not supported when `x` is a dataset, generator or
             `keras.utils.Sequence` instance.
             If both `validation_data` and `validation_split` are provided,
@@ -1183,11 +1212,16 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
             `validation_data` is not yet supported with
             `tf.distribute.experimental.ParameterServerStrategy`.
         shuffle: Boolean (whether to shuffle the training data
-            before each epoch) or str (for 'batch'). This argument is ignored
-            when `x` is a generator or an object of tf.data.Dataset.
-            'batch' is a special option for dealing
+            before each epoch) or str (for 'batch' or 'block'). This argument
+            is ignored when `x` is a generator or an object of
+            tf.data.Dataset. 'batch' is a special option for dealing
             with the limitations of HDF5 data; it shuffles in batch-sized
-            chunks. Has no effect when `steps_per_epoch` is not `None`.
+            chunks. 'block' shuffles the order of small blocks of contiguous
+            samples, so that each batch of an array-like input (e.g. HDF5 data
+            or a memmap) is read from a few sequential ranges. With
+            `shuffle=True`, `np.memmap` inputs are shuffled within windows of
+            contiguous samples visited in random order. Has no effect
+            when `steps_per_epoch` is not `None`.
         class_weight: Optional dictionary mapping class indices (integers)
             to a weight (float) value, used for weighting the loss function
             (during training only).
@@ -1249,11 +1283,16 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
             validation at the end of the 1st, 2nd, and 10th epochs.
         max_queue_size: Integer. Used for generator or `keras.utils.Sequence`
             input only. Maximum size for the generator queue.
-            If unspecified, `max_queue_size` will default to 10.
+            If unspecified, `max_queue_size` will default to 10. For
+            `np.memmap` inputs, the maximum number of batches read ahead.
         workers: Integer. Used for generator or `keras.utils.Sequence` input
             only. Maximum number of processes to spin up
             when using process-based threading. If unspecified, `workers`
-            will default to 1.
+            will default to 1. With `use_multiprocessing=False`, the number
+            of threads producing the batches of a `keras.utils.Sequence`, or
+            the number of generators of a `GeneratorFactory`. For array-like
+            inputs (e.g. HDF5 data or `np.memmap`), the number of threads
+            reading the batches.
         use_multiprocessing: Boolean. Used for generator or
             `keras.utils.Sequence` input only. If `True`, use process-based
             threading. If unspecified, `use_multiprocessing` will default to
@@ -1309,7 +1348,7 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
 
     if validation_split and validation_data is None:
       # Create the validation data using the training data. Only supported for
-      # `Tensor` and `NumPy` input.
+      # `Tensor`, `NumPy`, pandas and sparse input.
       (x, y, sample_weight), validation_data = (
           data_adapter.train_validation_split(
               (x, y, sample_weight), validation_split=validation_split))
@@ -1351,6 +1390,7 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
             verbose=verbose,
             epochs=epochs,
             steps=data_handler.inferred_steps)
+      callbacks._set_data_handler(ModeKeys.TRAIN, data_handler)  # pylint: disable=protected-access
 
       self.stop_training = False
       self.train_function = self.make_train_function()
@@ -1707,6 +1747,7 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
             verbose=verbose,
             epochs=1,
             steps=data_handler.inferred_steps)
+      callbacks._set_data_handler(ModeKeys.TEST, data_handler)  # pylint: disable=protected-access
 
       logs = {}
       self.test_function = self.make_test_function()
@@ -1836,7 +1877,8 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
               callbacks=None,
               max_queue_size=10,
               workers=1,
-              use_multiprocessing=False):
+              use_multiprocessing=False,
+              out=None):
     """Generates output predictions for the input samples.
 
     Computation is done in batches. This method is designed for batch processing
@@ -1906,6 +1948,20 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
             `False`. Note that because this implementation relies on
             multiprocessing, you should not pass non-picklable arguments to
             the generator as they can't be passed easily to children processes.
+        out: `None`, `"preallocate"`, or a NumPy array (or a nested structure
+            of NumPy arrays matching the model outputs). Controls where the
+            predictions are gathered. By default (`None`), the outputs of each
+            batch are kept and concatenated once prediction is done, which
+            temporarily requires about twice the memory of the final result.
+            With `"preallocate"`, the result arrays are allocated once, from
+            the number of samples of the input, and each batch is written
+            into them as soon as it is computed; this requires the number of
+            samples to be known (e.g. NumPy inputs). If a NumPy array, such as
+            a `np.memmap` obtained with `np.lib.format.open_memmap`, is passed,
+            predictions are written into it directly. In both cases, the
+            returned arrays are views of the filled rows of the buffers. Only
+            dense outputs are supported by these modes. To avoid holding the
+            predictions in memory at all, see `Model.predict_iter`.
 
     See the discussion of `Unpacking behavior for iterator-like inputs` for
     `Model.fit`. Note that Model.predict uses the same interpretation rules as
@@ -1926,7 +1982,107 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
     version_utils.disallow_legacy_graph('Model', 'predict')
     self._check_call_args('predict')
     _disallow_inside_tf_function('predict')
+    if isinstance(out, str) and out != 'preallocate':
+      raise ValueError('`out` must be `None`, "preallocate", or a NumPy array '
+                       f'(or structure of arrays). Received: out={out}')
+
+    writer = None
+    outputs = None
+    batch_outputs = None
+    for data_handler, batch_outputs in self._predict_batches(
+        x,
+        batch_size=batch_size,
+        verbose=verbose,
+        steps=steps,
+        callbacks=callbacks,
+        max_queue_size=max_queue_size,
+        workers=workers,
+        use_multiprocessing=use_multiprocessing):
+      if out is not None:
+        if writer is None:
+          writer = _PredictOutputWriter(out, data_handler._samples)  # pylint: disable=protected-access
+        writer.write(batch_outputs)
+      elif outputs is None:
+        outputs = tf.nest.map_structure(lambda batch_output: [batch_output],
+                                        batch_outputs)
+      else:
+        tf.__internal__.nest.map_structure_up_to(
+            batch_outputs,
+            lambda output, batch_output: output.append(batch_output),
+            outputs, batch_outputs)
+
+    if writer is not None:
+      return writer.result()
+    all_outputs = tf.__internal__.nest.map_structure_up_to(
+        batch_outputs, concat, outputs)
+    return tf_utils.sync_to_numpy_or_python_type(all_outputs)
+
+  @traceback_utils.filter_traceback
+  def predict_iter(self,
+                   x,
+                   batch_size=None,
+                   verbose='auto',
+                   steps=None,
+                   callbacks=None,
+                   max_queue_size=10,
+                   workers=1,
+                   use_multiprocessing=False):
+    """Yields output predictions batch by batch.
+
+    This is the streaming counterpart of `Model.predict`: it runs the same
+    prediction loop (including callbacks and progress bar), but instead of
+    gathering every batch and concatenating them at the end, it yields the
+    NumPy outputs of each batch as soon as they are computed. This keeps
+    host memory bounded by the size of a single batch, which makes it
+    suitable for inference jobs whose outputs do not fit in memory.
+
+    Example:
+
+    ```python
+    for batch_predictions in model.predict_iter(x, batch_size=256):
+      write_to_disk(batch_predictions)
+    ```
+
+    Args:
+        x: Input samples. See `Model.predict`.
+        batch_size: Integer or `None`. See `Model.predict`.
+        verbose: `"auto"`, 0, 1, or 2. See `Model.predict`.
+        steps: Total number of steps (batches of samples) before declaring the
+          prediction round finished. See `Model.predict`.
+        callbacks: List of `keras.callbacks.Callback` instances. See
+          `Model.predict`.
+        max_queue_size: Integer. See `Model.predict`.
+        workers: Integer. See `Model.predict`.
+        use_multiprocessing: Boolean. See `Model.predict`.
+
+    Yields:
+        Numpy array(s) of predictions for one batch (or one execution, when
+        `steps_per_execution` is greater than 1).
+
+    Raises:
+        RuntimeError: If `model.predict_iter` is wrapped in a `tf.function`.
+        ValueError: In case of mismatch between the provided
+            input data and the model's expectations.
+    """
+    base_layer.keras_api_gauge.get_cell('predict').set(True)
+    version_utils.disallow_legacy_graph('Model', 'predict_iter')
+    self._check_call_args('predict_iter')
+    _disallow_inside_tf_function('predict_iter')
+
+    for _, batch_outputs in self._predict_batches(
+        x,
+        batch_size=batch_size,
+        verbose=verbose,
+        steps=steps,
+        callbacks=callbacks,
+        max_queue_size=max_queue_size,
+        workers=workers,
+        use_multiprocessing=use_multiprocessing):
+      yield tf_utils.sync_to_numpy_or_python_type(batch_outputs)
 
+  def _predict_batches(self, x, batch_size, verbose, steps, callbacks,
+                       max_queue_size, workers, use_multiprocessing):
+    """Runs the prediction loop, yielding `(data_handler, batch_outputs)`."""
     # TODO(yashkatariya): Cache model on the coordinator for faster prediction.
     # If running under PSS, then swap it with OneDeviceStrategy so that
     # execution will run on the coordinator.
@@ -1941,87 +2097,96 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
     if self._cluster_coordinator:
       self._cluster_coordinator = None
 
-    verbose = _get_verbosity(verbose, self.distribute_strategy)
-    outputs = None
-    with self.distribute_strategy.scope():
-      # Creates a `tf.data.Dataset` and handles batch and epoch iteration.
-      dataset_types = (tf.compat.v1.data.Dataset, tf.data.Dataset)
-      if (self._in_multi_worker_mode() or _is_tpu_multi_host(
-          self.distribute_strategy)) and isinstance(x, dataset_types):
-        try:
-          options = tf.data.Options()
-          data_option = tf.data.experimental.AutoShardPolicy.DATA
-          options.experimental_distribute.auto_shard_policy = data_option
-          x = x.with_options(options)
-        except ValueError:
-          warnings.warn(
-              'Using Model.predict with MultiWorkerMirroredStrategy or '
-              'TPUStrategy and AutoShardPolicy.FILE might lead to out-of-order '
-              'result. Consider setting it to AutoShardPolicy.DATA.',
-              stacklevel=2)
-
-      data_handler = data_adapter.get_data_handler(
-          x=x,
-          batch_size=batch_size,
-          steps_per_epoch=steps,
-          initial_epoch=0,
-          epochs=1,
-          max_queue_size=max_queue_size,
-          workers=workers,
-          use_multiprocessing=use_multiprocessing,
-          model=self,
-          steps_per_execution=self._steps_per_execution)
+    try:
+      verbose = _get_verbosity(verbose, self.distribute_strategy)
+      with self.distribute_strategy.scope():
+        # Creates a `tf.data.Dataset` and handles batch and epoch iteration.
+        dataset_types = (tf.compat.v1.data.Dataset, tf.data.Dataset)
+        if (self._in_multi_worker_mode() or _is_tpu_multi_host(
+            self.distribute_strategy)) and isinstance(x, dataset_types):
+          try:
+            options = tf.data.Options()
+            data_option = tf.data.experimental.AutoShardPolicy.DATA
+            options.experimental_distribute.auto_shard_policy = data_option
+            x = x.with_options(options)
+          except ValueError:
+            warnings.warn(
+                'Using Model.predict with MultiWorkerMirroredStrategy or '
+                'TPUStrategy and AutoShardPolicy.FILE might lead to '
+                'out-of-order result. Consider setting it to '
+                'AutoShardPolicy.DATA.',
+                stacklevel=2)
 
-      # Container that configures and calls `tf.keras.Callback`s.
-      if not isinstance(callbacks, callbacks_module.CallbackList):
-        callbacks = callbacks_module.CallbackList(
-            callbacks,
-            add_history=True,
-            add_progbar=verbose != 0,
-            model=self,
-            verbose=verbose,
+        data_handler = data_adapter.get_data_handler(
+            x=x,
+            batch_size=batch_size,
+            steps_per_epoch=steps,
+            initial_epoch=0,
             epochs=1,
-            steps=data_handler.inferred_steps)
+            max_queue_size=max_queue_size,
+            workers=workers,
+            use_multiprocessing=use_multiprocessing,
+            model=self,
+            steps_per_execution=self._steps_per_execution)
 
-      self.predict_function = self.make_predict_function()
-      self._predict_counter.assign(0)
-      callbacks.on_predict_begin()
-      batch_outputs = None
-      for _, iterator in data_handler.enumerate_epochs():  # Single epoch.
-        with data_handler.catch_stop_iteration():
-          for step in data_handler.steps():
-            callbacks.on_predict_batch_begin(step)
-            tmp_batch_outputs = self.predict_function(iterator)
-            if data_handler.should_sync:
-              context.async_wait()
-            batch_outputs = tmp_batch_outputs  # No error, now safe to assign.
-            if outputs is None:
-              outputs = tf.nest.map_structure(lambda batch_output: [batch_output],
-                                           batch_outputs)
-            else:
-              tf.__internal__.nest.map_structure_up_to(
-                  batch_outputs,
-                  lambda output, batch_output: output.append(batch_output),
-                  outputs, batch_outputs)
-            end_step = step + data_handler.step_increment
-            callbacks.on_predict_batch_end(end_step, {'outputs': batch_outputs})
-      if batch_outputs is None:
-        raise ValueError('Unexpected result of `predict_function` '
-                         '(Empty batch_outputs). Please use '
-                         '`Model.compile(..., run_eagerly=True)`, or '
-                         '`tf.config.run_functions_eagerly(True)` for more '
-                         'information of where went wrong, or file a '
-                         'issue/bug to `tf.keras`.')
+        # Container that configures and calls `tf.keras.Callback`s.
+        if not isinstance(callbacks, callbacks_module.CallbackList):
+          callbacks = callbacks_module.CallbackList(
+              callbacks,
+              add_history=True,
+              add_progbar=verbose != 0,
+              model=self,
+              verbose=verbose,
+              epochs=1,
+              steps=data_handler.inferred_steps)
+        callbacks._set_data_handler(ModeKeys.PREDICT, data_handler)  # pylint: disable=protected-access
+
+        self.predict_function = self.make_predict_function()
+        self._predict_counter.assign(0)
+        callbacks.on_predict_begin()
+
+      # The batches are yielded outside of the strategy scope, so that the
+      # code of the caller does not run under the strategy of the model.
+      epochs = data_handler.enumerate_epochs()
+      try:
+        with self.distribute_strategy.scope():
+          _, iterator = next(epochs)  # Single epoch.
+        batch_outputs = None
+        for step in data_handler.steps():
+          callbacks.on_predict_batch_begin(step)
+          tmp_batch_outputs = None
+          with self.distribute_strategy.scope():
+            with data_handler.catch_stop_iteration():
+              tmp_batch_outputs = self.predict_function(iterator)
+              if data_handler.should_sync:
+                context.async_wait()
+          if tmp_batch_outputs is None:  # The input ran out of data.
+            break
+          batch_outputs = tmp_batch_outputs  # No error, now safe to assign.
+          yield data_handler, batch_outputs
+          end_step = step + data_handler.step_increment
+          callbacks.on_predict_batch_end(end_step, {'outputs': batch_outputs})
+        next(epochs, None)  # Ends the epoch.
+        if batch_outputs is None:
+          raise ValueError('Unexpected result of `predict_function` '
+                           '(Empty batch_outputs). Please use '
+                           '`Model.compile(..., run_eagerly=True)`, or '
+                           '`tf.config.run_functions_eagerly(True)` for more '
+                           'information of where went wrong, or file a '
+                           'issue/bug to `tf.keras`.')
+      except GeneratorExit:
+        # The caller of `predict_iter` stopped iterating early.
+        callbacks.on_predict_end()
+        raise
+      finally:
+        epochs.close()
       callbacks.on_predict_end()
-    all_outputs = tf.__internal__.nest.map_structure_up_to(batch_outputs, concat, outputs)
-
-    # If originally PSS strategy was used, then replace it back since predict
-    # is running under `OneDeviceStrategy` after the swap and once its done
-    # we need to replace it back to PSS again.
-    if original_pss_strategy is not None:
-      self._distribution_strategy = original_pss_strategy
-
-    return tf_utils.sync_to_numpy_or_python_type(all_outputs)
+    finally:
+      # If originally PSS strategy was used, then replace it back since
+      # predict is running under `OneDeviceStrategy` after the swap and once
+      # its done we need to replace it back to PSS again.
+      if original_pss_strategy is not None:
+        self._distribution_strategy = original_pss_strategy
 
   def reset_metrics(self):
     """Resets the state of all the metrics in the model.
@@ -2341,6 +2506,22 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
     with self.distribute_strategy.scope():
       return super(Model, self).get_weights()
 
+  def get_flat_weights(self, dtype=None):
+    """Retrieves the weights of the model as one flat Numpy buffer.
+
+    See `Layer.get_flat_weights` for details.
+
+    Args:
+        dtype: Optional dtype of the buffer. Defaults to the dtype of the
+            weights, which must then all have the same dtype.
+
+    Returns:
+        A tuple `(buffer, offsets)` of a flat Numpy buffer holding all weight
+        values, and the offset of each weight in it.
+    """
+    with self.distribute_strategy.scope():
+      return super(Model, self).get_flat_weights(dtype=dtype)
+
   @traceback_utils.filter_traceback
   def save(self,
            filepath,
@@ -2401,7 +2582,10 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
                    filepath,
                    overwrite=True,
                    save_format=None,
-                   options=None):
+                   options=None,
+                   num_shards=None,
+                   chunks=None,
+                   compression=None):
     """Saves all layer weights.
 
     Either saves in HDF5 or in TensorFlow format based on the `save_format`
@@ -2417,6 +2601,13 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
           - For every weight in the layer, a dataset
               storing the weight value, named after the weight tensor.
 
+    With `num_shards`, the weight values are instead spread over `num_shards`
+    HDF5 files written concurrently next to `filepath`, e.g.
+    `weights-00000-of-00004.h5` for `weights.h5`. The file at `filepath` then
+    only holds links to the weight values in the shards; it is loaded with
+    `load_weights` like any other HDF5 weights file, as long as the shards are
+    kept next to it.
+
     When saving in TensorFlow format, all objects referenced by the network are
     saved in the same format as `tf.train.Checkpoint`, including any `Layer`
     instances or `Optimizer` instances assigned to object attributes. For
@@ -2456,10 +2647,19 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
             `None` defaults to 'tf'.
         options: Optional `tf.train.CheckpointOptions` object that specifies
             options for saving weights.
+        num_shards: Optional number of HDF5 files to spread the weight values
+            over. Only supported in HDF5 format.
+        chunks: Optional chunk shape of the HDF5 datasets, or `True` to let
+            h5py pick one. Only supported in HDF5 format.
+        compression: Optional name of the h5py compression filter used for
+            the HDF5 datasets, e.g. `'gzip'` or `'lzf'`. Only supported in HDF5
+            format.
 
     Raises:
         ImportError: If `h5py` is not available when attempting to save in HDF5
             format.
+        ValueError: If `num_shards`, `chunks` or `compression` are passed when
+            saving in TensorFlow format.
     """
     self._assert_weights_created()
     filepath = io_utils.path_to_string(filepath)
@@ -2484,6 +2684,13 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
           'save_weights got save_format="tf"/"tensorflow", but the '
           f'filepath ({filepath}) looks like an HDF5 file. '
           'Omit the ".h5"/".keras" when saving in TensorFlow format.')
+    if save_format == 'tf' and (num_shards is not None or chunks is not None or
+                                compression is not None):
+      raise ValueError(
+          '`num_shards`, `chunks` and `compression` are only supported when '
+          'saving weights in HDF5 format. Received: '
+          f'num_shards={num_shards}, chunks={chunks}, '
+          f'compression={compression}')
 
     if save_format == 'h5' and h5py is None:
       raise ImportError(
@@ -2498,9 +2705,13 @@ class Model(base_layer.Layer, version_utils.ModelVersionSelector):
       proceed = io_utils.ask_to_proceed_with_overwrite(check_filepath)
       if not proceed:
         return
-    if save_format == 'h5':
+    if save_format == 'h5' and num_shards is not None:
+      hdf5_format.save_weights_to_sharded_hdf5(
+          filepath, self, num_shards, chunks=chunks, compression=compression)
+    elif save_format == 'h5':
       with h5py.File(filepath, 'w') as f:
-        hdf5_format.save_weights_to_hdf5_group(f, self)
+        hdf5_format.save_weights_to_hdf5_group(
+            f, self, chunks=chunks, compression=compression)
     else:
       if tf.executing_eagerly():
         session = None
@@ -3260,6 +3471,63 @@ def concat(tensors, axis=0):
   return tf.concat(tensors, axis=axis)
 
 
+class _PredictOutputWriter:
+  """Writes the per-batch outputs of `Model.predict` into NumPy buffers.
+
+  Args:
+    out: Either `"preallocate"`, in which case the buffers are allocated from
+      the first batch of outputs and `num_samples`, or a (structure of) NumPy
+      array(s) to write into.
+    num_samples: The number of samples of the input, or `None` if unknown.
+  """
+
+  def __init__(self, out, num_samples):
+    if isinstance(out, str):
+      if num_samples is None:
+        raise ValueError(
+            '`out="preallocate"` requires the number of input samples to be '
+            'known, which is not the case for generator, `Sequence` or '
+            '`tf.data.Dataset` inputs. Pass a preallocated array as `out` '
+            'or use `Model.predict_iter` instead.')
+      out = None
+    self._out = out
+    self._num_samples = num_samples
+    self._offset = 0
+
+  def write(self, batch_outputs):
+    """Copies a batch of outputs into the buffers."""
+    for t in tf.nest.flatten(batch_outputs):
+      if isinstance(t, (tf.SparseTensor, tf.RaggedTensor)):
+        raise ValueError(
+            'Only dense outputs can be written to a preallocated buffer. '
+            f'Received an output of type {type(t).__name__}. Use `out=None` '
+            'or `Model.predict_iter` instead.')
+    batch_outputs = tf_utils.sync_to_numpy_or_python_type(batch_outputs)
+    if self._out is None:
+      self._out = tf.nest.map_structure(
+          lambda b: np.empty((self._num_samples,) + b.shape[1:], b.dtype),
+          batch_outputs)
+    flat_out = tf.nest.flatten(self._out)
+    flat_batch = tf.nest.flatten(batch_outputs)
+    if len(flat_out) != len(flat_batch):
+      raise ValueError(
+          f'`out` has {len(flat_out)} array(s) but the model produces '
+          f'{len(flat_batch)} output(s).')
+
+    end = self._offset + flat_batch[0].shape[0]
+    for dst, src in zip(flat_out, flat_batch):
+      if end > dst.shape[0]:
+        raise ValueError(
+            f'`out` buffer is too small: it has {dst.shape[0]} rows but at '
+            f'least {end} predictions were produced.')
+      dst[self._offset:end] = src
+    self._offset = end
+
+  def result(self):
+    """Returns views of the rows of the buffers written so far."""
+    return tf.nest.map_structure(lambda a: a[:self._offset], self._out)
+
+
 def _get_verbosity(verbose, distribute_strategy):
   """Find the right verbosity value for 'auto'."""
   if verbose == 1 and distribute_strategy._should_use_with_coordinator:  # pylint: disable=protected-access
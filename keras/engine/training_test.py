@@ -2063,6 +2063,79 @@ class TestExceptionsAndWarnings(test_combinations.TestCase):
                                 'Unexpected result of `predict_function`.*'):
       model.predict(np.array([]))
 
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_predict_preallocated_outputs(self):
+    inputs = layers_module.Input(shape=(2,))
+    outputs = [layers_module.Dense(4)(inputs), layers_module.Dense(1)(inputs)]
+    model = training_module.Model(inputs=inputs, outputs=outputs)
+    model.compile(loss='mse', run_eagerly=test_utils.should_run_eagerly())
+    x = np.random.random((25, 2)).astype('float32')
+    expected = model.predict(x, batch_size=4)
+
+    preallocated = model.predict(x, batch_size=4, out='preallocate')
+    self.assertLen(preallocated, 2)
+    for actual, expect in zip(preallocated, expected):
+      self.assertAllClose(actual, expect)
+
+    buffers = [np.zeros((30, 4), 'float32'), np.zeros((30, 1), 'float32')]
+    written = model.predict(x, batch_size=4, out=buffers)
+    for actual, buf, expect in zip(written, buffers, expected):
+      self.assertEqual(actual.shape[0], 25)
+      self.assertAllClose(actual, expect)
+      self.assertAllClose(buf[:25], expect)
+
+    with self.assertRaisesRegex(ValueError, 'buffer is too small'):
+      model.predict(x, batch_size=4, out=[np.zeros((10, 4)), np.zeros((10, 1))])
+    with self.assertRaisesRegex(ValueError, '`out` must be'):
+      model.predict(x, out='auto')
+
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_predict_iter(self):
+    inputs = layers_module.Input(shape=(2,))
+    outputs = layers_module.Dense(4)(inputs)
+    model = training_module.Model(inputs=inputs, outputs=outputs)
+    model.compile(loss='mse', run_eagerly=test_utils.should_run_eagerly())
+    x = np.random.random((10, 2)).astype('float32')
+
+    batches = list(model.predict_iter(x, batch_size=4))
+    self.assertEqual([b.shape[0] for b in batches], [4, 4, 2])
+    self.assertAllClose(np.concatenate(batches), model.predict(x, batch_size=4))
+
+  @test_combinations.run_all_keras_modes(always_skip_v1=True)
+  def test_predict_iter_early_exit(self):
+
+    class RecordingCallback(Callback):
+
+      def __init__(self):
+        super(RecordingCallback, self).__init__()
+        self.calls = []
+
+      def on_predict_batch_end(self, batch, logs=None):
+        self.calls.append('batch_end')
+
+      def on_predict_end(self, logs=None):
+        self.calls.append('end')
+
+    strategy = tf.distribute.OneDeviceStrategy('/cpu:0')
+    with strategy.scope():
+      inputs = layers_module.Input(shape=(2,))
+      outputs = layers_module.Dense(4)(inputs)
+      model = training_module.Model(inputs=inputs, outputs=outputs)
+      model.compile(loss='mse', run_eagerly=test_utils.should_run_eagerly())
+    x = np.random.random((10, 2)).astype('float32')
+
+    callback = RecordingCallback()
+    batches = model.predict_iter(x, batch_size=2, callbacks=[callback])
+    for step, batch in enumerate(batches):
+      # The code of the caller does not run under the model's strategy.
+      self.assertFalse(tf.distribute.has_strategy())
+      self.assertEqual(batch.shape, (2, 4))
+      if step == 1:
+        break
+    batches.close()
+    self.assertFalse(tf.distribute.has_strategy())
+    self.assertEqual(callback.calls, ['batch_end', 'end'])
+
   @test_combinations.run_all_keras_modes(always_skip_v1=True)
   def test_on_batch_error_inconsistent_batch_size(self):
     input_node1 = layers_module.Input(shape=(5,))
@@ -71,6 +71,11 @@ def handle_partial_sample_weights(outputs, sample_weights, sample_weight_modes,
     Tuple of sample weights, one sample weight for every output, and booleans
     describing the raw sample weights.
   """
+  if sample_weights is not None and not tf.nest.is_nested(sample_weights):
+    # A single sample weight, which is not iterated over as it may be a large
+    # array or Tensor.
+    return sample_weights, True, False
+
   any_sample_weight = sample_weights is not None and any(
       w is not None for w in sample_weights)
   partial_sample_weight = any_sample_weight and any(
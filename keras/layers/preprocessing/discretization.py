@@ -127,6 +127,14 @@ def get_bin_boundaries(summary, num_bins):
   return compress(summary, 1.0 / num_bins)[0, :-1]
 
 
+class _Summary:
+  """The adapt state of one shard of a `Discretization` layer."""
+
+  def __init__(self):
+    self.summary = tf.Variable(
+        [[], []], shape=(2, None), dtype=tf.float32, trainable=False)
+
+
 @keras_export("keras.layers.Discretization",
               "keras.layers.experimental.preprocessing.Discretization")
 class Discretization(base_preprocessing_layer.PreprocessingLayer):
@@ -274,8 +282,7 @@ class Discretization(base_preprocessing_layer.PreprocessingLayer):
         initializer=lambda shape, dtype: [[], []],  # pylint: disable=unused-arguments
         trainable=False)
 
-  # We override this method solely to generate a docstring.
-  def adapt(self, data, batch_size=None, steps=None):
+  def adapt(self, data, batch_size=None, steps=None, num_shards=None):
     """Computes bin boundaries from quantiles in a input dataset.
 
     Calling `adapt()` on a `Discretization` layer is an alternative to passing
@@ -317,10 +324,54 @@ class Discretization(base_preprocessing_layer.PreprocessingLayer):
           the input dataset is exhausted. When passing an infinitely
           repeating dataset, you must specify the `steps` argument. This
           argument is not supported with array inputs.
+      num_shards: Integer or `None`. If set, the quantiles are estimated on
+          `num_shards` parallel threads, each accumulating the batches it
+          reads into a summary of its own, and the summaries are merged at the
+          end of `adapt()`.
+    """
+    if num_shards is None:
+      super().adapt(data, batch_size=batch_size, steps=steps)
+    else:
+      self._adapt_in_shards(data, batch_size, steps, num_shards)
+
+  def get_adapt_state(self):
+    """Returns the quantile summary accumulated by `adapt()`.
+
+    Together with `merge_adapt_state()`, this lets the data be adapted on in
+    parts, e.g. in separate processes, and the parts be combined afterwards:
+    each part is adapted on a layer of its own, and the states of all the
+    parts are then merged into a built layer before calling
+    `finalize_state()`.
+
+    Returns:
+      A dict with the NumPy array of the summary under key `"summary"`, which
+      can be pickled or saved with `np.savez`.
     """
-    super().adapt(data, batch_size=batch_size, steps=steps)
+    self._check_adaptable("get_adapt_state")
+    return {"summary": self.summary.numpy()}
+
+  def merge_adapt_state(self, state):
+    """Merges a state returned by `get_adapt_state()` into the layer state.
+
+    The layer must be built. Call `finalize_state()` once all states are
+    merged to update the bin boundaries used by the layer.
+
+    Args:
+      state: A dict returned by `get_adapt_state()`.
+    """
+    self._check_adaptable("merge_adapt_state")
+    summary = tf.convert_to_tensor(state["summary"], tf.float32)
+    if summary.shape.rank != 2 or summary.shape[0] != 2:
+      raise ValueError("Expected a state with a summary of shape (2, None), "
+                       f"got a summary of shape {summary.shape}.")
+    self._merge_summary(self, summary)
 
   def update_state(self, data):
+    self._check_adaptable("update_state")
+    # The layer holds the state of an unsharded adapt.
+    self._update_shard_state(self, data)
+
+  def _check_adaptable(self, method_name):
     if self.input_bin_boundaries is not None:
       raise ValueError(
           "Cannot adapt a Discretization layer that has been initialized with "
@@ -328,13 +379,23 @@ class Discretization(base_preprocessing_layer.PreprocessingLayer):
           "`bin_boundaries={}`.".format(self.input_bin_boundaries))
 
     if not self.built:
-      raise RuntimeError("`build` must be called before `update_state`.")
+      raise RuntimeError(f"`build` must be called before `{method_name}`.")
+
+  def _make_shard_state(self):
+    self._check_adaptable("adapt")
+    return _Summary()
 
+  def _update_shard_state(self, shard, data):
     data = tf.convert_to_tensor(data)
     if data.dtype != tf.float32:
       data = tf.cast(data, tf.float32)
-    summary = summarize(data, self.epsilon)
-    self.summary.assign(merge_summaries(summary, self.summary, self.epsilon))
+    self._merge_summary(shard, summarize(data, self.epsilon))
+
+  def _merge_shard_state(self, shard):
+    self._merge_summary(self, shard.summary)
+
+  def _merge_summary(self, shard, summary):
+    shard.summary.assign(merge_summaries(summary, shard.summary, self.epsilon))
 
   def finalize_state(self):
     if self.input_bin_boundaries is not None or not self.built:
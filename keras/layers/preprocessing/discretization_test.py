@@ -15,6 +15,7 @@
 """Tests for Keras discretization preprocessing layer."""
 
 import os
+import pickle
 
 from absl.testing import parameterized
 import keras
@@ -301,6 +302,30 @@ class DiscretizationAdaptTest(test_combinations.TestCase,
     output_data = model.predict(test_data)
     self.assertAllClose(expected, output_data)
 
+  def test_sharded_adapt(self):
+    data = np.random.RandomState(1337).uniform(size=(3000, 1))
+    layer = discretization.Discretization(num_bins=4, epsilon=0.01)
+    layer.adapt(data, batch_size=100, num_shards=4)
+    self.assertTrue(layer.is_adapted)
+    self.assertAllClose(layer.bin_boundaries, [0.25, 0.5, 0.75], atol=0.03)
+
+  def test_merge_adapt_state(self):
+    data = np.random.RandomState(1337).uniform(size=(3000, 1))
+    states = []
+    for part in np.split(data, [500, 2000]):
+      layer = discretization.Discretization(num_bins=4, epsilon=0.01)
+      layer.adapt(part, batch_size=100)
+      states.append(pickle.loads(pickle.dumps(layer.get_adapt_state())))
+    layer = discretization.Discretization(num_bins=4, epsilon=0.01)
+    layer.build((None, 1))
+    for state in states:
+      layer.merge_adapt_state(state)
+    layer.finalize_state()
+    self.assertAllClose(layer.bin_boundaries, [0.25, 0.5, 0.75], atol=0.03)
+
+    with self.assertRaisesRegex(ValueError, "Expected a state with a summary"):
+      layer.merge_adapt_state({"summary": [1., 2.]})
+
   def test_multiple_adapts(self):
     first_adapt = [[1], [2], [3]]
     second_adapt = [[4], [5], [6]]
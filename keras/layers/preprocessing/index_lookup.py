@@ -39,6 +39,12 @@ TF_IDF = utils.TF_IDF
 _VOCAB_NAME = "vocab"
 _IDF_WEIGHTS_NAME = "idf_weights"
 
+# When `max_tokens` is set, the token counts of each shard of a sharded adapt
+# are pruned to their most frequent tokens whenever they hold more than
+# `max(_MIN_SHARD_CAPACITY, _SHARD_CAPACITY_FACTOR * max_tokens)` tokens.
+_MIN_SHARD_CAPACITY = 2**16
+_SHARD_CAPACITY_FACTOR = 16
+
 
 class NullInitializer(tf.lookup.KeyValueTensorInitializer):
   """A placeholder initializer for restoring this layer from a SavedModel."""
@@ -91,6 +97,18 @@ class VocabWeightHandler(base_layer_utils.TrackableWeightHandler):
     return [tokens]
 
 
+class _TokenCounts:
+  """The adapt state of one shard of an `IndexLookup` layer."""
+
+  def __init__(self, vocabulary_dtype, document_counts=False):
+    self.token_counts = tf.lookup.experimental.MutableHashTable(
+        key_dtype=vocabulary_dtype, value_dtype=tf.int64, default_value=0)
+    if document_counts:
+      self.token_document_counts = tf.lookup.experimental.MutableHashTable(
+          key_dtype=vocabulary_dtype, value_dtype=tf.int64, default_value=0)
+      self.num_documents = tf.Variable(0, dtype=tf.int64, trainable=False)
+
+
 class IndexLookup(base_preprocessing_layer.PreprocessingLayer):
   """Maps values from a vocabulary to integer indices.
 
@@ -522,12 +540,29 @@ class IndexLookup(base_preprocessing_layer.PreprocessingLayer):
       self.idf_weights.assign(weights)
       self.idf_weights_const = self.idf_weights.value()
 
+  def adapt(self, data, batch_size=None, steps=None, num_shards=None):
+    if num_shards is None:
+      super().adapt(data, batch_size=batch_size, steps=steps)
+    else:
+      self._adapt_in_shards(data, batch_size, steps, num_shards)
+
   def update_state(self, data):
+    self._check_adaptable()
+    # The layer holds the state of an unsharded adapt.
+    self._update_shard_state(self, data)
+
+  def _check_adaptable(self):
     if self._has_input_vocabulary:
       raise ValueError(
           "Cannot adapt {} layer after setting a static vocabulary via init "
           "argument or `set_vocabulary`.".format(self.__class__.__name__))
 
+  def _make_shard_state(self):
+    self._check_adaptable()
+    return _TokenCounts(
+        self.vocabulary_dtype, document_counts=self.output_mode == TF_IDF)
+
+  def _update_shard_state(self, shard, data):
     data = utils.ensure_tensor(data, dtype=self.vocabulary_dtype)
     if data.shape.rank == 0:
       data = tf.expand_dims(data, 0)
@@ -536,19 +571,58 @@ class IndexLookup(base_preprocessing_layer.PreprocessingLayer):
       data = tf.expand_dims(data, 0)
 
     tokens, counts = self._num_tokens(data)
-    self.token_counts.insert(tokens, counts + self.token_counts.lookup(tokens))
+    shard.token_counts.insert(tokens,
+                              counts + shard.token_counts.lookup(tokens))
 
     if self.output_mode == TF_IDF:
       # Dedupe each row of our dataset.
       deduped_doc_data = tf.map_fn(lambda x: tf.unique(x)[0], data)
       # Flatten and count tokens.
       tokens, doc_counts = self._num_tokens(deduped_doc_data)
-      self.token_document_counts.insert(
-          tokens, doc_counts + self.token_document_counts.lookup(tokens))
+      shard.token_document_counts.insert(
+          tokens, doc_counts + shard.token_document_counts.lookup(tokens))
       if tf_utils.is_ragged(data):
-        self.num_documents.assign_add(data.nrows())
+        shard.num_documents.assign_add(data.nrows())
       else:
-        self.num_documents.assign_add(tf.shape(data, out_type=tf.int64)[0])
+        shard.num_documents.assign_add(tf.shape(data, out_type=tf.int64)[0])
+
+    if shard is not self and self.max_tokens:
+      # Bound the memory of each shard by only keeping its most frequent
+      # tokens. Tokens pruned from a shard can still be counted by others, so
+      # only the counts of tokens close to the `max_tokens` cut-off can be
+      # underestimated.
+      capacity = max(_MIN_SHARD_CAPACITY,
+                     _SHARD_CAPACITY_FACTOR * self.max_tokens)
+      tf.cond(shard.token_counts.size() > capacity,
+              lambda: self._prune_shard(shard, capacity // 2),
+              lambda: tf.constant(False))
+
+  def _prune_shard(self, shard, num_tokens):
+    """Only keeps the counts of the `num_tokens` most frequent tokens."""
+    tokens, counts = shard.token_counts.export()
+    _, indices = tf.math.top_k(counts, k=num_tokens, sorted=False)
+    tokens = tf.gather(tokens, indices)
+    counts = tf.gather(counts, indices)
+    with tf.control_dependencies([shard.token_counts.remove(
+        shard.token_counts.export()[0])]):
+      inserted = shard.token_counts.insert(tokens, counts)
+    if self.output_mode == TF_IDF:
+      doc_counts = shard.token_document_counts.lookup(tokens)
+      with tf.control_dependencies([shard.token_document_counts.remove(
+          shard.token_document_counts.export()[0])]):
+        inserted = tf.group(
+            inserted, shard.token_document_counts.insert(tokens, doc_counts))
+    with tf.control_dependencies([inserted]):
+      return tf.constant(True)
+
+  def _merge_shard_state(self, shard):
+    tokens, counts = shard.token_counts.export()
+    self.token_counts.insert(tokens, counts + self.token_counts.lookup(tokens))
+    if self.output_mode == TF_IDF:
+      tokens, doc_counts = shard.token_document_counts.export()
+      self.token_document_counts.insert(
+          tokens, doc_counts + self.token_document_counts.lookup(tokens))
+      self.num_documents.assign_add(shard.num_documents)
 
   def finalize_state(self):
     if self._has_input_vocabulary or tf.equal(self.token_counts.size(), 0):
@@ -592,6 +592,59 @@ class CategoricalEncodingAdaptTest(
     expected_vocabulary = ["", "[OOV]", "michigan", "fire"]
     self.assertAllEqual(expected_vocabulary, layer.get_vocabulary())
 
+  def test_sharded_adapt(self):
+    rng = np.random.RandomState(1337)
+    # Documents of distinct tokens, with skewed token frequencies.
+    probabilities = 1 / np.arange(1, 51)
+    probabilities /= probabilities.sum()
+    vocab_data = np.array([
+        rng.choice(50, size=5, replace=False, p=probabilities)
+        for _ in range(400)
+    ]).astype(str)
+    vocab_dataset = tf.data.Dataset.from_tensor_slices(vocab_data).batch(16)
+
+    def adapt(num_shards=None):
+      layer = index_lookup.IndexLookup(
+          max_tokens=None,
+          num_oov_indices=1,
+          mask_token="",
+          oov_token="[OOV]",
+          vocabulary_dtype=tf.string,
+          output_mode="tf_idf")
+      layer.adapt(vocab_dataset, num_shards=num_shards)
+      return layer
+
+    expected_layer = adapt()
+    layer = adapt(num_shards=4)
+    self.assertAllEqual(expected_layer.get_vocabulary(), layer.get_vocabulary())
+    self.assertAllClose(expected_layer.idf_weights, layer.idf_weights)
+    self.assertTrue(layer.is_adapted)
+
+    with self.assertRaisesRegex(ValueError, "must be a positive integer"):
+      adapt(num_shards=0)
+
+  def test_sharded_adapt_with_pruning(self):
+    # Frequent tokens, drowned in many tokens seen once.
+    vocab_data = []
+    for i in range(5):
+      vocab_data += [str(i)] * (100 - 20 * i)
+    vocab_data += ["rare_%d" % i for i in range(2000)]
+    random.Random(1337).shuffle(vocab_data)
+    vocab_data = np.array(vocab_data).reshape((-1, 4))
+    vocab_dataset = tf.data.Dataset.from_tensor_slices(vocab_data).batch(25)
+
+    layer = index_lookup.IndexLookup(
+        max_tokens=7,
+        num_oov_indices=1,
+        mask_token="",
+        oov_token="[OOV]",
+        vocabulary_dtype=tf.string)
+    with tf.compat.v1.test.mock.patch.object(index_lookup,
+                                             "_MIN_SHARD_CAPACITY", 100):
+      layer.adapt(vocab_dataset, num_shards=2)
+    expected_vocabulary = ["", "[OOV]", "0", "1", "2", "3", "4"]
+    self.assertAllEqual(expected_vocabulary, layer.get_vocabulary())
+
   def test_sparse_int_input(self):
     vocab_data = np.array([10, 11, 12, 13], dtype=np.int64)
     input_array = tf.SparseTensor(
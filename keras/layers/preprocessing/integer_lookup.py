@@ -382,7 +382,7 @@ class IntegerLookup(index_lookup.IndexLookup):
     base_preprocessing_layer.keras_kpl_gauge.get_cell("IntegerLookup").set(True)
 
   # We override this method solely to generate a docstring.
-  def adapt(self, data, batch_size=None, steps=None):
+  def adapt(self, data, batch_size=None, steps=None, num_shards=None):
     """Computes a vocabulary of interger terms from tokens in a dataset.
 
     Calling `adapt()` on an `IntegerLookup` layer is an alternative to passing
@@ -428,5 +428,14 @@ class IntegerLookup(index_lookup.IndexLookup):
           the input dataset is exhausted. When passing an infinitely
           repeating dataset, you must specify the `steps` argument. This
           argument is not supported with array inputs.
+      num_shards: Integer or `None`. If set, the vocabulary is computed on
+          `num_shards` parallel threads, each counting the tokens of the
+          batches it reads into a shard of its own; the shards are merged
+          before the vocabulary is finalized. When `max_tokens` is also set,
+          the memory of each shard is bounded by pruning the least frequent
+          tokens from its counts, so tokens with counts close to the
+          `max_tokens` cut-off may be ranked differently than with
+          `num_shards=None`.
     """
-    super().adapt(data, batch_size=batch_size, steps=steps)
+    super().adapt(data, batch_size=batch_size, steps=steps,
+                  num_shards=num_shards)
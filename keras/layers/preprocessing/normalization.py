@@ -25,6 +25,15 @@ import tensorflow.compat.v2 as tf
 from tensorflow.python.util.tf_export import keras_export
 
 
+class _Moments:
+  """The adapt state of one shard of a `Normalization` layer."""
+
+  def __init__(self, shape, dtype):
+    self.adapt_mean = tf.Variable(tf.zeros(shape, dtype), trainable=False)
+    self.adapt_variance = tf.Variable(tf.ones(shape, dtype), trainable=False)
+    self.count = tf.Variable(0, dtype=tf.int64, trainable=False)
+
+
 @keras_export('keras.layers.Normalization',
               'keras.layers.experimental.preprocessing.Normalization')
 class Normalization(base_preprocessing_layer.PreprocessingLayer):
@@ -193,8 +202,7 @@ class Normalization(base_preprocessing_layer.PreprocessingLayer):
       self.mean = tf.cast(mean, self.compute_dtype)
       self.variance = tf.cast(variance, self.compute_dtype)
 
-  # We override this method solely to generate a docstring.
-  def adapt(self, data, batch_size=None, steps=None):
+  def adapt(self, data, batch_size=None, steps=None, num_shards=None):
     """Computes the mean and variance of values in a dataset.
 
     Calling `adapt()` on a `Normalization` layer is an alternative to passing in
@@ -238,10 +246,75 @@ class Normalization(base_preprocessing_layer.PreprocessingLayer):
           the input dataset is exhausted. When passing an infinitely
           repeating dataset, you must specify the `steps` argument. This
           argument is not supported with array inputs.
+      num_shards: Integer or `None`. If set, the mean and variance are
+          computed on `num_shards` parallel threads, each accumulating the
+          batches it reads into moments of its own, which are merged at the
+          end of `adapt()`.
+    """
+    if num_shards is None:
+      super().adapt(data, batch_size=batch_size, steps=steps)
+    else:
+      self._adapt_in_shards(data, batch_size, steps, num_shards)
+
+  def get_adapt_state(self):
+    """Returns the mean, variance and count accumulated by `adapt()`.
+
+    Together with `merge_adapt_state()`, this lets the data be adapted on in
+    parts, e.g. in separate processes, and the parts be combined afterwards:
+
+    >>> parts = [np.array([[1.], [2.]]), np.array([[3.], [4.], [5.]])]
+    >>> states = []
+    >>> for part in parts:
+    ...   layer = tf.keras.layers.Normalization(axis=None)
+    ...   layer.adapt(part)
+    ...   states.append(layer.get_adapt_state())
+    >>> layer = tf.keras.layers.Normalization(axis=None)
+    >>> layer.build((None, 1))
+    >>> for state in states:
+    ...   layer.merge_adapt_state(state)
+    >>> layer.finalize_state()
+    >>> layer(np.array([[3.]]))
+    <tf.Tensor: shape=(1, 1), dtype=float32, numpy=array([[0.]], dtype=float32)>
+
+    Returns:
+      A dict of NumPy arrays with keys `"mean"`, `"variance"` and `"count"`,
+      which can be pickled or saved with `np.savez`.
     """
-    super().adapt(data, batch_size=batch_size, steps=steps)
+    self._check_adaptable('get_adapt_state')
+    return {
+        'mean': self.adapt_mean.numpy(),
+        'variance': self.adapt_variance.numpy(),
+        'count': self.count.numpy(),
+    }
+
+  def merge_adapt_state(self, state):
+    """Merges a state returned by `get_adapt_state()` into the layer state.
+
+    The layer must be built. Call `finalize_state()` once all states are
+    merged to update the mean and variance used by the layer.
+
+    Args:
+      state: A dict returned by `get_adapt_state()`, on a layer with the same
+        `axis` and input shape.
+    """
+    self._check_adaptable('merge_adapt_state')
+    mean = tf.convert_to_tensor(state['mean'], self.adapt_mean.dtype)
+    variance = tf.convert_to_tensor(state['variance'], self.adapt_mean.dtype)
+    if (mean.shape != self.adapt_mean.shape or
+        variance.shape != self.adapt_variance.shape):
+      raise ValueError(
+          'Expected a state with mean and variance of shape {}, got mean of '
+          'shape {} and variance of shape {}.'.format(
+              self.adapt_mean.shape, mean.shape, variance.shape))
+    self._merge_moments(self, mean, variance,
+                        tf.convert_to_tensor(state['count'], tf.int64))
 
   def update_state(self, data):
+    self._check_adaptable('update_state')
+    # The layer holds the state of an unsharded adapt.
+    self._update_shard_state(self, data)
+
+  def _check_adaptable(self, method_name):
     if self.input_mean is not None:
       raise ValueError(
           'Cannot `adapt` a Normalization layer that is initialized with '
@@ -249,34 +322,47 @@ class Normalization(base_preprocessing_layer.PreprocessingLayer):
           .format(self.input_mean, self.input_variance))
 
     if not self.built:
-      raise RuntimeError('`build` must be called before `update_state`.')
+      raise RuntimeError(
+          '`build` must be called before `{}`.'.format(method_name))
 
+  def _make_shard_state(self):
+    self._check_adaptable('adapt')
+    return _Moments(self.adapt_mean.shape, self.adapt_mean.dtype)
+
+  def _update_shard_state(self, shard, data):
     data = self._standardize_inputs(data)
-    data = tf.cast(data, self.adapt_mean.dtype)
+    data = tf.cast(data, shard.adapt_mean.dtype)
     batch_mean, batch_variance = tf.nn.moments(data, axes=self._reduce_axis)
-    batch_shape = tf.shape(data, out_type=self.count.dtype)
+    batch_shape = tf.shape(data, out_type=shard.count.dtype)
     if self._reduce_axis:
       batch_reduce_shape = tf.gather(batch_shape, self._reduce_axis)
       batch_count = tf.reduce_prod(batch_reduce_shape)
     else:
       batch_count = 1
-
-    total_count = batch_count + self.count
-    batch_weight = (
-        tf.cast(batch_count, dtype=self.compute_dtype) /
+    self._merge_moments(shard, batch_mean, batch_variance, batch_count)
+
+  def _merge_shard_state(self, shard):
+    self._merge_moments(self, shard.adapt_mean, shard.adapt_variance,
+                        shard.count)
+
+  def _merge_moments(self, shard, mean, variance, count):
+    """Merges the moments of some data into the moments of a shard."""
+    total_count = count + shard.count
+    # Merging the moments of no data is a no-op.
+    batch_weight = tf.math.divide_no_nan(
+        tf.cast(count, dtype=self.compute_dtype),
         tf.cast(total_count, dtype=self.compute_dtype))
     existing_weight = 1. - batch_weight
 
-    total_mean = self.adapt_mean * existing_weight + batch_mean * batch_weight
+    total_mean = shard.adapt_mean * existing_weight + mean * batch_weight
     # The variance is computed using the lack-of-fit sum of squares
     # formula (see https://en.wikipedia.org/wiki/Lack-of-fit_sum_of_squares).
-    total_variance = ((self.adapt_variance +
-                       (self.adapt_mean - total_mean)**2) * existing_weight +
-                      (batch_variance +
-                       (batch_mean - total_mean)**2) * batch_weight)
-    self.adapt_mean.assign(total_mean)
-    self.adapt_variance.assign(total_variance)
-    self.count.assign(total_count)
+    total_variance = ((shard.adapt_variance +
+                       (shard.adapt_mean - total_mean)**2) * existing_weight +
+                      (variance + (mean - total_mean)**2) * batch_weight)
+    shard.adapt_mean.assign(total_mean)
+    shard.adapt_variance.assign(total_variance)
+    shard.count.assign(total_count)
 
   def reset_state(self):  # pylint: disable=method-hidden
     if self.input_mean is not None or not self.built:
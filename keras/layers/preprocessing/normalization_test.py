@@ -17,6 +17,7 @@
 import tensorflow.compat.v2 as tf
 
 import os
+import pickle
 
 from absl.testing import parameterized
 
@@ -285,6 +286,40 @@ class NormalizationAdaptTest(test_combinations.TestCase,
          keras.layers.Dense(1)])
     model.summary()
 
+  def test_sharded_adapt(self):
+    data = np.random.RandomState(1337).normal(3., 2., size=(1000, 4))
+    expected_layer = normalization.Normalization(axis=-1)
+    expected_layer.adapt(data, batch_size=32)
+
+    layer = normalization.Normalization(axis=-1)
+    layer.adapt(data, batch_size=32, num_shards=4)
+    self.assertTrue(layer.is_adapted)
+    self.assertAllClose(expected_layer.mean, layer.mean)
+    self.assertAllClose(expected_layer.variance, layer.variance)
+
+  def test_merge_adapt_state(self):
+    data = np.random.RandomState(1337).normal(3., 2., size=(1000, 4))
+    expected_layer = normalization.Normalization(axis=-1)
+    expected_layer.adapt(data)
+
+    states = []
+    for part in np.split(data, [100, 700]):
+      layer = normalization.Normalization(axis=-1)
+      layer.adapt(part)
+      states.append(pickle.loads(pickle.dumps(layer.get_adapt_state())))
+    layer = normalization.Normalization(axis=-1)
+    layer.build((None, 4))
+    for state in states:
+      layer.merge_adapt_state(state)
+    layer.finalize_state()
+    self.assertAllClose(expected_layer.mean, layer.mean)
+    self.assertAllClose(expected_layer.variance, layer.variance)
+
+    with self.assertRaisesRegex(ValueError, "Expected a state with mean"):
+      layer.merge_adapt_state({"mean": [0.], "variance": [1.], "count": 1})
+    with self.assertRaisesRegex(RuntimeError, "must be called before"):
+      normalization.Normalization(axis=-1).merge_adapt_state(states[0])
+
   def test_multiple_adapts(self):
     first_adapt = [[0], [2], [0], [2]]
     second_adapt = [[2], [4], [2], [4]]
@@ -346,7 +346,7 @@ class StringLookup(index_lookup.IndexLookup):
     return dict(list(base_config.items()) + list(config.items()))
 
   # We override this method solely to generate a docstring.
-  def adapt(self, data, batch_size=None, steps=None):
+  def adapt(self, data, batch_size=None, steps=None, num_shards=None):
     """Computes a vocabulary of string terms from tokens in a dataset.
 
     Calling `adapt()` on a `StringLookup` layer is an alternative to passing in
@@ -392,8 +392,17 @@ class StringLookup(index_lookup.IndexLookup):
           the input dataset is exhausted. When passing an infinitely
           repeating dataset, you must specify the `steps` argument. This
           argument is not supported with array inputs.
+      num_shards: Integer or `None`. If set, the vocabulary is computed on
+          `num_shards` parallel threads, each counting the tokens of the
+          batches it reads into a shard of its own; the shards are merged
+          before the vocabulary is finalized. When `max_tokens` is also set,
+          the memory of each shard is bounded by pruning the least frequent
+          tokens from its counts, so tokens with counts close to the
+          `max_tokens` cut-off may be ranked differently than with
+          `num_shards=None`.
     """
-    super().adapt(data, batch_size=batch_size, steps=steps)
+    super().adapt(data, batch_size=batch_size, steps=steps,
+                  num_shards=num_shards)
 
   # Overridden methods from IndexLookup.
   def _tensor_vocab_to_numpy(self, vocabulary):
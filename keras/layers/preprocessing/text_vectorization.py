@@ -377,8 +377,7 @@ class TextVectorization(base_preprocessing_layer.PreprocessingLayer):
                     else backend.floatx())
     return tf.TensorSpec(shape=output_shape, dtype=output_dtype)
 
-  # We override this method solely to generate a docstring.
-  def adapt(self, data, batch_size=None, steps=None):
+  def adapt(self, data, batch_size=None, steps=None, num_shards=None):
     """Computes a vocabulary of string terms from tokens in a dataset.
 
     Calling `adapt()` on a `TextVectorization` layer is an alternative to
@@ -424,8 +423,19 @@ class TextVectorization(base_preprocessing_layer.PreprocessingLayer):
           the input dataset is exhausted. When passing an infinitely
           repeating dataset, you must specify the `steps` argument. This
           argument is not supported with array inputs.
+      num_shards: Integer or `None`. If set, the vocabulary is computed on
+          `num_shards` parallel threads, each counting the tokens of the
+          batches it reads into a shard of its own; the shards are merged
+          before the vocabulary is finalized. When `max_tokens` is also set,
+          the memory of each shard is bounded by pruning the least frequent
+          tokens from its counts, so tokens with counts close to the
+          `max_tokens` cut-off may be ranked differently than with
+          `num_shards=None`.
     """
-    super().adapt(data, batch_size=batch_size, steps=steps)
+    if num_shards is None:
+      super().adapt(data, batch_size=batch_size, steps=steps)
+    else:
+      self._adapt_in_shards(data, batch_size, steps, num_shards)
 
   def update_state(self, data):
     self._lookup_layer.update_state(self._preprocess(data))
@@ -436,6 +446,17 @@ class TextVectorization(base_preprocessing_layer.PreprocessingLayer):
   def reset_state(self):  # pylint: disable=method-hidden
     self._lookup_layer.reset_state()
 
+  # pylint: disable=protected-access
+  def _make_shard_state(self):
+    return self._lookup_layer._make_shard_state()
+
+  def _update_shard_state(self, shard, data):
+    self._lookup_layer._update_shard_state(shard, self._preprocess(data))
+
+  def _merge_shard_state(self, shard):
+    self._lookup_layer._merge_shard_state(shard)
+  # pylint: enable=protected-access
+
   def get_vocabulary(self, include_special_tokens=True):
     """Returns the current vocabulary of the layer.
 
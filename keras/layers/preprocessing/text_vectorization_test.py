@@ -1556,6 +1556,15 @@ class TextVectorizationVocbularyTest(
     self.assertAllEqual(layer.get_vocabulary(),
                         ["", "[UNK]", "earth", "wind", "and", "fire"])
 
+  def test_get_vocabulary_sharded_adapt(self):
+    vocab = np.array([["Earth earth earth earth wind wind wind and and fire"],
+                      ["earth wind! and"], ["fire earth"]] * 10)
+
+    layer = text_vectorization.TextVectorization(max_tokens=5)
+    layer.adapt(vocab, batch_size=2, num_shards=3)
+    self.assertAllEqual(layer.get_vocabulary(),
+                        ["", "[UNK]", "earth", "wind", "and"])
+
   def test_get_vocabulary_no_special_tokens(self):
     vocab = ["earth", "wind", "and", "fire"]
 
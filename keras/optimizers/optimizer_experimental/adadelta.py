@@ -63,6 +63,7 @@ class Adadelta(optimizer.Optimizer):
       `optimizer_experimental.Optimizer`.
     jit_compile: see the `jit_compile` argument of
       `optimizer_experimental.Optimizer`.
+    fused: see the `fused` argument of `optimizer_experimental.Optimizer`.
     name: Optional name prefix for the operations created when applying
       gradients. Defaults to `"Adadelta"`.
     **kwargs: see the `**kwargs` argument of `optimizer_experimental.Optimizer`.
@@ -82,6 +83,7 @@ class Adadelta(optimizer.Optimizer):
                ema_momentum=0.99,
                ema_overwrite_frequency=None,
                jit_compile=False,
+               fused=False,
                name='Adadelta',
                **kwargs):
     super(Adadelta, self).__init__(
@@ -92,6 +94,7 @@ class Adadelta(optimizer.Optimizer):
         ema_momentum=ema_momentum,
         ema_overwrite_frequency=ema_overwrite_frequency,
         jit_compile=jit_compile,
+        fused=fused,
         name=name,
         **kwargs)
     self._learning_rate = self._build_learning_rate(learning_rate)
@@ -145,6 +148,28 @@ class Adadelta(optimizer.Optimizer):
                                    (1 - rho) * delta_var * delta_var)
     variable.assign_add(lr * delta_var)
 
+  def fused_update_step(self, gradients, variables):
+    """Update step given the dense gradients of a group of variables."""
+    indices = self._fused_variable_indices(variables)
+    lr = tf.cast(self.learning_rate, variables[0].dtype)
+    rho = self.rho
+    grad = self._concat_flat(gradients)
+
+    def rms(x):
+      return tf.sqrt(x + self.epsilon)
+
+    accumulated_grads = [self._accumulated_grads[i] for i in indices]
+    accumulated_delta_vars = [self._accumulated_delta_vars[i] for i in indices]
+    accumulated_grad = (rho * self._concat_flat(accumulated_grads) +
+                        (1 - rho) * grad * grad)
+    accumulated_delta_var = self._concat_flat(accumulated_delta_vars)
+    delta_var = -rms(accumulated_delta_var) * grad / rms(accumulated_grad)
+    self._assign_flat(accumulated_grads, accumulated_grad)
+    self._assign_flat(
+        accumulated_delta_vars,
+        rho * accumulated_delta_var + (1 - rho) * delta_var * delta_var)
+    self._assign_flat(variables, lr * delta_var, 'assign_add')
+
   def get_config(self):
     config = super(Adadelta, self).get_config()
 
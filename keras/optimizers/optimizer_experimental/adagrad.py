@@ -57,6 +57,7 @@ class Adagrad(optimizer.Optimizer):
       `optimizer_experimental.Optimizer`.
     jit_compile: see the `jit_compile` argument of
       `optimizer_experimental.Optimizer`.
+    fused: see the `fused` argument of `optimizer_experimental.Optimizer`.
     name: Optional name prefix for the operations created when applying
       gradients. Defaults to `"Adagrad"`.
     **kwargs: see the `**kwargs` argument of `optimizer_experimental.Optimizer`.
@@ -77,6 +78,7 @@ class Adagrad(optimizer.Optimizer):
                ema_momentum=0.99,
                ema_overwrite_frequency=None,
                jit_compile=False,
+               fused=False,
                name='Adagrad',
                **kwargs):
     super(Adagrad, self).__init__(
@@ -87,6 +89,7 @@ class Adagrad(optimizer.Optimizer):
         ema_momentum=ema_momentum,
         ema_overwrite_frequency=ema_overwrite_frequency,
         jit_compile=jit_compile,
+        fused=fused,
         name=name,
         **kwargs)
     self._learning_rate = self._build_learning_rate(learning_rate)
@@ -127,6 +130,19 @@ class Adagrad(optimizer.Optimizer):
       accumulator.assign_add(grad * grad)
     variable.assign_sub(lr * grad / tf.sqrt(accumulator + self.epsilon))
 
+  def fused_update_step(self, gradients, variables):
+    """Update step given the dense gradients of a group of variables."""
+    indices = self._fused_variable_indices(variables)
+    lr = tf.cast(self.learning_rate, variables[0].dtype)
+    grad = self._concat_flat(gradients)
+
+    accumulators = [self._accumulators[i] for i in indices]
+    accumulator = self._concat_flat(accumulators) + grad * grad
+    self._assign_flat(accumulators, accumulator)
+    self._assign_flat(
+        variables, lr * grad / tf.sqrt(accumulator + self.epsilon),
+        'assign_sub')
+
   def get_config(self):
     config = super(Adagrad, self).get_config()
 
@@ -66,6 +66,7 @@ class Adam(optimizer.Optimizer):
       `optimizer_experimental.Optimizer`.
     jit_compile: see the `jit_compile` argument of
       `optimizer_experimental.Optimizer`.
+    fused: see the `fused` argument of `optimizer_experimental.Optimizer`.
     name: Optional name prefix for the operations created when applying
       gradients. Defaults to `"Adam"`.
     **kwargs: see the `**kwargs` argument of `optimizer_experimental.Optimizer`.
@@ -107,6 +108,7 @@ class Adam(optimizer.Optimizer):
                ema_momentum=0.99,
                ema_overwrite_frequency=None,
                jit_compile=False,
+               fused=False,
                name='Adam',
                **kwargs):
     super(Adam, self).__init__(
@@ -118,6 +120,7 @@ class Adam(optimizer.Optimizer):
         ema_momentum=ema_momentum,
         ema_overwrite_frequency=ema_overwrite_frequency,
         jit_compile=jit_compile,
+        fused=fused,
         **kwargs)
     self._learning_rate = self._build_learning_rate(learning_rate)
     self.beta_1 = beta_1
@@ -199,6 +202,35 @@ class Adam(optimizer.Optimizer):
         v = v_hat
       variable.assign_sub((m * alpha) / (tf.sqrt(v) + self.epsilon))
 
+  def fused_update_step(self, gradients, variables):
+    """Update step given the dense gradients of a group of variables."""
+    indices = self._fused_variable_indices(variables)
+    dtype = variables[0].dtype
+    lr = tf.cast(self.learning_rate, dtype)
+    local_step = tf.cast(self.iterations + 1, dtype)
+    beta_1_power = tf.pow(tf.cast(self.beta_1, dtype), local_step)
+    beta_2_power = tf.pow(tf.cast(self.beta_2, dtype), local_step)
+    alpha = (lr * tf.sqrt(1 - beta_2_power) / (1 - beta_1_power))
+
+    momentums = [self._momentums[i] for i in indices]
+    velocities = [self._velocities[i] for i in indices]
+    gradient = self._concat_flat(gradients)
+    m = self._concat_flat(momentums)
+    v = self._concat_flat(velocities)
+
+    m_delta = (gradient - m) * (1 - self.beta_1)
+    v_delta = (tf.square(gradient) - v) * (1 - self.beta_2)
+    self._assign_flat(momentums, m_delta, 'assign_add')
+    self._assign_flat(velocities, v_delta, 'assign_add')
+    m += m_delta
+    v += v_delta
+    if self.amsgrad:
+      velocity_hats = [self._velocity_hats[i] for i in indices]
+      v = tf.maximum(self._concat_flat(velocity_hats), v)
+      self._assign_flat(velocity_hats, v)
+    self._assign_flat(variables, (m * alpha) / (tf.sqrt(v) + self.epsilon),
+                      'assign_sub')
+
   def get_config(self):
     config = super(Adam, self).get_config()
 
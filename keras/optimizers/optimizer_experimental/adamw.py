@@ -71,6 +71,7 @@ class AdamW(optimizer.Optimizer):
       `optimizer_experimental.Optimizer`.
     jit_compile: see the `jit_compile` argument of
       `optimizer_experimental.Optimizer`.
+    fused: see the `fused` argument of `optimizer_experimental.Optimizer`.
     name: Optional name prefix for the operations created when applying
       gradients. Defaults to `"Adam"`.
     **kwargs: see the `**kwargs` argument of `optimizer_experimental.Optimizer`.
@@ -114,6 +115,7 @@ class AdamW(optimizer.Optimizer):
                ema_momentum=0.99,
                ema_overwrite_frequency=None,
                jit_compile=False,
+               fused=False,
                name='AdamW',
                **kwargs):
     super(AdamW, self).__init__(
@@ -125,6 +127,7 @@ class AdamW(optimizer.Optimizer):
         ema_momentum=ema_momentum,
         ema_overwrite_frequency=ema_overwrite_frequency,
         jit_compile=jit_compile,
+        fused=fused,
         **kwargs)
     self._learning_rate = self._build_learning_rate(learning_rate)
     self.weight_decay = weight_decay
@@ -216,6 +219,42 @@ class AdamW(optimizer.Optimizer):
         v = v_hat
       variable.assign_sub((m * alpha) / (tf.sqrt(v) + self.epsilon))
 
+  def fused_update_step(self, gradients, variables):
+    """Update step given the dense gradients of a group of variables."""
+    indices = self._fused_variable_indices(variables)
+    dtype = variables[0].dtype
+    lr = tf.cast(self.learning_rate, dtype)
+    local_step = tf.cast(self.iterations + 1, dtype)
+    beta_1_power = tf.pow(tf.cast(self.beta_1, dtype), local_step)
+    beta_2_power = tf.pow(tf.cast(self.beta_2, dtype), local_step)
+    alpha = (lr * tf.sqrt(1 - beta_2_power) / (1 - beta_1_power))
+
+    # Apply step weight decay
+    if self.weight_decay != 0:
+      wd = tf.cast(self.weight_decay, dtype)
+      self._assign_flat(
+          variables, self._concat_flat(variables) * (1 - lr * wd),
+          'assign_sub')
+
+    momentums = [self._momentums[i] for i in indices]
+    velocities = [self._velocities[i] for i in indices]
+    gradient = self._concat_flat(gradients)
+    m = self._concat_flat(momentums)
+    v = self._concat_flat(velocities)
+
+    m_delta = (gradient - m) * (1 - self.beta_1)
+    v_delta = (tf.square(gradient) - v) * (1 - self.beta_2)
+    self._assign_flat(momentums, m_delta, 'assign_add')
+    self._assign_flat(velocities, v_delta, 'assign_add')
+    m += m_delta
+    v += v_delta
+    if self.amsgrad:
+      velocity_hats = [self._velocity_hats[i] for i in indices]
+      v = tf.maximum(self._concat_flat(velocity_hats), v)
+      self._assign_flat(velocity_hats, v)
+    self._assign_flat(variables, (m * alpha) / (tf.sqrt(v) + self.epsilon),
+                      'assign_sub')
+
   def get_config(self):
     config = super(AdamW, self).get_config()
 
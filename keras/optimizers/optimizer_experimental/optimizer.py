@@ -42,6 +42,7 @@ class _BaseOptimizer(tf.Module):
                ema_momentum=0.99,
                ema_overwrite_frequency=None,
                jit_compile=False,
+               fused=False,
                **kwargs):
     self._name = name
     self._clipnorm = clipnorm
@@ -49,6 +50,7 @@ class _BaseOptimizer(tf.Module):
     self._clipvalue = clipvalue
     self._use_ema = use_ema
     self._jit_compile = jit_compile
+    self._fused = fused
     if use_ema:
       # Verify the arguments related to EMA.
       if ema_momentum > 1 or ema_momentum < 0:
@@ -139,6 +141,67 @@ class _BaseOptimizer(tf.Module):
     else:
       self.update_step(gradient, variable)
 
+  def fused_update_step(self, gradients, variables):
+    """Function to update a group of variables with their dense gradients.
+
+    All `variables` share the same dtype. Optimizers supporting `fused=True`
+    override this method to apply their update rule once to the
+    concatenation of the flattened gradients and variables (see
+    `_concat_flat` and `_assign_flat`), instead of once per variable. The
+    default implementation falls back to `update_step` for each variable.
+
+    Args:
+      gradients: list of dense backpropagated gradients.
+      variables: list of variables whose values need to be updated.
+    """
+    for gradient, variable in zip(gradients, variables):
+      self.update_step(gradient, variable)
+
+  def _fused_apply_gradients(self, grads_and_vars):
+    """Applies `grads_and_vars` by groups of variables of the same dtype."""
+    groups = {}
+    for grad, var in grads_and_vars:
+      if (isinstance(grad, tf.IndexedSlices) or
+          not var.shape.is_fully_defined()):
+        # Sparse updates only touch a few rows, so they are not worth fusing.
+        self._update_step(grad, var)
+      else:
+        groups.setdefault(var.dtype, []).append((grad, var))
+    for group in groups.values():
+      grads, variables = zip(*group)
+      self.fused_update_step(list(grads), list(variables))
+
+  def _fused_variable_indices(self, variables):
+    """Returns the index of each variable of `variables` in `_index_dict`."""
+    indices = []
+    for variable in variables:
+      var_key = self._var_key(variable)
+      if var_key not in self._index_dict:
+        raise KeyError(f"Optimizer cannot recognize variable {variable.name}, "
+                       f"this usually means you are calling an optimizer "
+                       f"previously used on a different model. Please try "
+                       f"creating a new optimizer instance.")
+      indices.append(self._index_dict[var_key])
+    return indices
+
+  def _concat_flat(self, tensors):
+    """Concatenates the flattened `tensors` (or variables) into a 1-D tensor."""
+    return tf.concat([tf.reshape(t, [-1]) for t in tensors], axis=0)
+
+  def _assign_flat(self, variables, value, method="assign"):
+    """Splits the 1-D `value` back and applies it to each of `variables`.
+
+    Args:
+      variables: list of variables, in the order used by `_concat_flat`.
+      value: 1-D tensor, e.g. the result of an update computed on the output
+        of `_concat_flat`.
+      method: name of the variable method to apply, one of `"assign"`,
+        `"assign_add"` and `"assign_sub"`.
+    """
+    sizes = [variable.shape.num_elements() for variable in variables]
+    for variable, piece in zip(variables, tf.split(value, sizes)):
+      getattr(variable, method)(tf.reshape(piece, variable.shape))
+
   def compute_gradients(self, loss, var_list, tape=None):
     """Compute gradients of loss on trainable variables.
 
@@ -422,11 +485,19 @@ class _BaseOptimizer(tf.Module):
     Args:
       grads_and_vars: List of (gradient, variable) pairs.
     """
-    for grad, var in grads_and_vars:
-      self._update_step(grad, var)
+    if self._use_fused_updates():
+      self._fused_apply_gradients(grads_and_vars)
+    else:
+      for grad, var in grads_and_vars:
+        self._update_step(grad, var)
 
     self.iterations.assign_add(1)
 
+  def _use_fused_updates(self):
+    """Whether updates should go through `fused_update_step`."""
+    # XLA already fuses the per-variable updates.
+    return self._fused and not self._jit_compile
+
   def _update_model_variables_moving_average(self, var_list):
     """Update the stored moving average using the latest value."""
     if self._use_ema:
@@ -495,6 +566,7 @@ class _BaseOptimizer(tf.Module):
         "ema_momentum": self._ema_momentum,
         "ema_overwrite_frequency": self._ema_overwrite_frequency,
         "jit_compile": self._jit_compile,
+        "fused": self._fused,
     }
     return config
 
@@ -556,6 +628,12 @@ class Optimizer(_BaseOptimizer):
     jit_compile: bool, default to False. If True, the optimizer will use XLA
       acceleration. `jit_compile` can only be False when using Parameter
       Server Strategy.
+    fused: bool, default to False. If True, dense gradients are applied by
+      groups of variables sharing the same dtype: the optimizer update rule
+      runs once on the concatenation of all the variables of a group, instead
+      of once per variable. This removes most of the per-variable op dispatch
+      overhead for models with many small variables. It has no effect when
+      `jit_compile=True`, or when a `tf.distribute.Strategy` is in use.
     **kwargs: keyword arguments only used for backward compatibility with
       `optimizer_v2.OptimizerV2`. Any new code using
       `optimizer_experimental.Optimizer` should leave this parameter empty.
@@ -712,6 +790,8 @@ class Optimizer(_BaseOptimizer):
     - `build`: Create your optimizer-related variables, such as `momentums` in
       SGD optimizer.
     - `update_step`: Implement your optimizer's updating logic.
+    - `fused_update_step` (optional): Implement your optimizer's updating logic
+      on a group of variables at once, used when `fused=True`.
     - `get_config`: serialization of the optimizer, include all hyper
       parameters.
 
@@ -729,11 +809,12 @@ class Optimizer(_BaseOptimizer):
                ema_momentum=0.99,
                ema_overwrite_frequency=None,
                jit_compile=False,
+               fused=False,
                **kwargs):
     """Create a new Optimizer."""
 
     super().__init__(name, clipnorm, clipvalue, global_clipnorm, use_ema,
-                     ema_momentum, ema_overwrite_frequency, jit_compile,
+                     ema_momentum, ema_overwrite_frequency, jit_compile, fused,
                      **kwargs)
     self._distribution_strategy = tf.distribute.get_strategy()
 
@@ -843,9 +924,12 @@ class Optimizer(_BaseOptimizer):
     def apply_grad_to_update_var(var, grad):
       return self._update_step(grad, var)
 
-    for grad, var in grads_and_vars:
-      distribution.extended.update(
-          var, apply_grad_to_update_var, args=(grad,), group=False)
+    if self._use_fused_updates() and not tf.distribute.has_strategy():
+      self._fused_apply_gradients(grads_and_vars)
+    else:
+      for grad, var in grads_and_vars:
+        distribution.extended.update(
+            var, apply_grad_to_update_var, args=(grad,), group=False)
     self.iterations.assign_add(1)
 
     if self._use_ema:
@@ -228,11 +228,47 @@ class OptimizerFuntionalityTest(tf.test.TestCase, parameterized.TestCase):
             "ema_momentum": 0.5,
             "ema_overwrite_frequency": 50,
             "jit_compile": False,
+            "fused": False,
         })
     restored_optimizer = adam_new.Adam.from_config(config)
     self.assertDictEqual(restored_optimizer.get_config(),
                          optimizer.get_config())
 
+  @parameterized.product(
+      optimizer_cls=[
+          adadelta_new.Adadelta, adagrad_new.Adagrad, adam_new.Adam,
+          adamw_new.AdamW, rmsprop_new.RMSprop, sgd_new.SGD
+      ],
+      kwargs=[{}, {"amsgrad": True}, {"momentum": 0.9, "nesterov": True},
+              {"momentum": 0.9, "centered": True}])
+  def testFusedUpdate(self, optimizer_cls, kwargs):
+    if "amsgrad" in kwargs and optimizer_cls not in (adam_new.Adam,
+                                                     adamw_new.AdamW):
+      self.skipTest("`amsgrad` is only supported by Adam and AdamW.")
+    if "nesterov" in kwargs and optimizer_cls is not sgd_new.SGD:
+      self.skipTest("`nesterov` is only supported by SGD.")
+    if "centered" in kwargs and optimizer_cls is not rmsprop_new.RMSprop:
+      self.skipTest("`centered` is only supported by RMSprop.")
+    shapes = [(3, 2), (4,), (), (2, 2, 2)]
+    initial_values = [np.random.random(shape) for shape in shapes]
+    initial_values.append(np.random.rand(5, 2).astype("float32"))
+    grads = [tf.convert_to_tensor(np.random.random(v.shape), dtype=v.dtype)
+             for v in initial_values[:-1]]
+    # Sparse gradients are applied outside of the fused groups.
+    grads.append(
+        tf.IndexedSlices(
+            tf.ones((2, 2)), tf.constant([0, 3]), dense_shape=[5, 2]))
+
+    optimizer_1 = optimizer_cls(**kwargs)
+    optimizer_2 = optimizer_cls(fused=True, **kwargs)
+    vars_1 = [tf.Variable(v) for v in initial_values]
+    vars_2 = [tf.Variable(v) for v in initial_values]
+    for _ in range(3):
+      optimizer_1.apply_gradients(zip(grads, vars_1))
+      optimizer_2.apply_gradients(zip(grads, vars_2))
+      for var_1, var_2 in zip(vars_1, vars_2):
+        self.assertAllClose(var_1, var_2)
+
   def testCheckpointOptimizer(self):
     x = tf.Variable([[1.0, 2.0], [3.0, 4.0]], dtype=tf.float32)
     lr_schedule = learning_rate_schedule.ExponentialDecay(
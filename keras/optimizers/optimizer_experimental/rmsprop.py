@@ -62,6 +62,7 @@ class RMSprop(optimizer.Optimizer):
       `optimizer_experimental.Optimizer`.
     jit_compile: see the `jit_compile` argument of
       `optimizer_experimental.Optimizer`.
+    fused: see the `fused` argument of `optimizer_experimental.Optimizer`.
     name: Optional name prefix for the operations created when applying
       gradients. Defaults to `"RMSprop"`.
     **kwargs: see the `**kwargs` argument of `optimizer_experimental.Optimizer`.
@@ -94,6 +95,7 @@ class RMSprop(optimizer.Optimizer):
                ema_momentum=0.99,
                ema_overwrite_frequency=100,
                jit_compile=False,
+               fused=False,
                name='RMSprop',
                **kwargs):
     super(RMSprop, self).__init__(
@@ -104,6 +106,7 @@ class RMSprop(optimizer.Optimizer):
         ema_momentum=ema_momentum,
         ema_overwrite_frequency=ema_overwrite_frequency,
         jit_compile=jit_compile,
+        fused=fused,
         name=name,
         **kwargs)
     self._learning_rate = self._build_learning_rate(learning_rate)
@@ -193,6 +196,34 @@ class RMSprop(optimizer.Optimizer):
       else:
         variable.assign_add(-lr * transformed_grad)
 
+  def fused_update_step(self, gradients, variables):
+    """Update step given the dense gradients of a group of variables."""
+    indices = self._fused_variable_indices(variables)
+    lr = tf.cast(self.learning_rate, variables[0].dtype)
+    rho = self.rho
+    gradient = self._concat_flat(gradients)
+
+    velocities = [self._velocities[i] for i in indices]
+    velocity = (rho * self._concat_flat(velocities) +
+                (1 - rho) * tf.square(gradient))
+    if self.centered:
+      average_gradients = [self._average_gradients[i] for i in indices]
+      average_grad = (rho * self._concat_flat(average_gradients) +
+                      (1 - rho) * tf.square(gradient))
+      self._assign_flat(average_gradients, average_grad)
+      velocity += -tf.square(average_grad)
+    self._assign_flat(velocities, velocity)
+
+    transformed_grad = gradient / (tf.sqrt(velocity) + self.epsilon)
+    if self.momentum > 0:
+      momentums = [self._momentums[i] for i in indices]
+      momentum = (self.momentum * self._concat_flat(momentums) +
+                  transformed_grad)
+      self._assign_flat(momentums, momentum)
+      self._assign_flat(variables, -lr * momentum, 'assign_add')
+    else:
+      self._assign_flat(variables, -lr * transformed_grad, 'assign_add')
+
   def get_config(self):
     config = super(RMSprop, self).get_config()
 
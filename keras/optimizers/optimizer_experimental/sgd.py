@@ -70,6 +70,7 @@ class SGD(optimizer.Optimizer):
       `optimizer_experimental.Optimizer`.
     jit_compile: see the `jit_compile` argument of
       `optimizer_experimental.Optimizer`.
+    fused: see the `fused` argument of `optimizer_experimental.Optimizer`.
     name: Optional name prefix for the operations created when applying
       gradients. Defaults to `"SGD"`.
     **kwargs: see the `**kwargs` argument of `optimizer_experimental.Optimizer`.
@@ -116,6 +117,7 @@ class SGD(optimizer.Optimizer):
                ema_momentum=0.99,
                ema_overwrite_frequency=None,
                jit_compile=False,
+               fused=False,
                name='SGD',
                **kwargs):
     super(SGD, self).__init__(
@@ -127,6 +129,7 @@ class SGD(optimizer.Optimizer):
         ema_momentum=ema_momentum,
         ema_overwrite_frequency=ema_overwrite_frequency,
         jit_compile=jit_compile,
+        fused=fused,
         **kwargs)
     self._learning_rate = self._build_learning_rate(learning_rate)
     self.momentum = momentum
@@ -194,6 +197,25 @@ class SGD(optimizer.Optimizer):
       else:
         variable.assign_add(-gradient * lr)
 
+  def fused_update_step(self, gradients, variables):
+    """Update step given the dense gradients of a group of variables."""
+    indices = self._fused_variable_indices(variables)
+    lr = tf.cast(self.learning_rate, variables[0].dtype)
+    gradient = self._concat_flat(gradients)
+
+    if self.momentum != 0:
+      momentum = tf.cast(self.momentum, variables[0].dtype)
+      momentums = [self.momentums[i] for i in indices]
+      m = -gradient * lr + self._concat_flat(momentums) * momentum
+      self._assign_flat(momentums, m)
+      if self.nesterov:
+        self._assign_flat(variables, -gradient * lr + m * momentum,
+                          'assign_add')
+      else:
+        self._assign_flat(variables, m, 'assign_add')
+    else:
+      self._assign_flat(variables, -gradient * lr, 'assign_add')
+
   def get_config(self):
     config = super(SGD, self).get_config()
 
@@ -17,8 +17,10 @@
 import tensorflow.compat.v2 as tf
 # pylint: disable=g-classes-have-attributes
 
-import multiprocessing
+from concurrent import futures
+import json
 import os
+import time
 
 import numpy as np
 
@@ -29,7 +31,8 @@ def index_directory(directory,
                     class_names=None,
                     shuffle=True,
                     seed=None,
-                    follow_links=False):
+                    follow_links=False,
+                    index_cache_path=None):
   """Make list of all files in the subdirs of `directory`, with their labels.
 
   Args:
@@ -50,6 +53,8 @@ def index_directory(directory,
         If set to False, sorts the data in alphanumeric order.
     seed: Optional random seed for shuffling.
     follow_links: Whether to visits subdirectories pointed to by symlinks.
+    index_cache_path: Optional path of a file caching the listing of
+        `directory` across calls, see `walk_directories`.
 
   Returns:
     tuple (file_paths, labels, class_names).
@@ -79,17 +84,13 @@ def index_directory(directory,
 
   # Build an index of the files
   # in the different class subfolders.
-  pool = multiprocessing.pool.ThreadPool()
-  results = []
+  dirpaths = [os.path.join(directory, subdir) for subdir in subdirs]
+  walks = walk_directories(dirpaths, follow_links, index_cache_path)
   filenames = []
-
-  for dirpath in (os.path.join(directory, subdir) for subdir in subdirs):
-    results.append(
-        pool.apply_async(index_subdirectory,
-                         (dirpath, class_indices, follow_links, formats)))
   labels_list = []
-  for res in results:
-    partial_filenames, partial_labels = res.get()
+  for dirpath, walk in zip(dirpaths, walks):
+    partial_filenames, partial_labels = index_subdirectory(
+        dirpath, class_indices, follow_links, formats, walk=walk)
     labels_list.append(partial_labels)
     filenames += partial_filenames
   if labels not in ('inferred', None):
@@ -110,8 +111,6 @@ def index_directory(directory,
   else:
     print('Found %d files belonging to %d classes.' %
           (len(filenames), len(class_names)))
-  pool.close()
-  pool.join()
   file_paths = [os.path.join(directory, fname) for fname in filenames]
 
   if shuffle:
@@ -125,15 +124,152 @@ def index_directory(directory,
   return file_paths, labels, class_names
 
 
-def iter_valid_files(directory, follow_links, formats):
-  walk = os.walk(directory, followlinks=follow_links)
-  for root, _, files in sorted(walk, key=lambda x: x[0]):
-    for fname in sorted(files):
+# Version of the format of the files written by `walk_directories`.
+_INDEX_CACHE_VERSION = 1
+# Directories modified less than this many seconds before being listed are
+# not cached, as a later change might not update their modification time.
+_INDEX_CACHE_MIN_AGE = 2
+
+
+def _list_directory(path, cached=None):
+  """Lists the entries of the directory `path`.
+
+  Args:
+    path: string, the directory to list.
+    cached: Optional listing of `path` returned by a previous call, reused if
+      the directory was not modified since.
+
+  Returns:
+    list `[mtime_ns, files, subdirs, linked_subdirs]` of the modification
+      time of the directory and the sorted names of its files, of its
+      subdirectories and of the symlinks among those subdirectories. None if
+      the directory can't be listed.
+  """
+  try:
+    mtime_ns = os.stat(path).st_mtime_ns
+  except OSError:
+    return None
+  if cached is not None and cached[0] == mtime_ns:
+    return cached
+  files = []
+  subdirs = []
+  linked_subdirs = []
+  try:
+    with os.scandir(path) as entries:
+      for entry in entries:
+        try:
+          is_dir = entry.is_dir()
+        except OSError:
+          is_dir = False
+        if not is_dir:
+          files.append(entry.name)
+          continue
+        subdirs.append(entry.name)
+        if entry.is_symlink():
+          linked_subdirs.append(entry.name)
+  except OSError:
+    return None
+  return [mtime_ns, sorted(files), sorted(subdirs), sorted(linked_subdirs)]
+
+
+def _load_index_cache(path):
+  """Returns the directory listings cached in the file `path`, if any."""
+  try:
+    with open(path) as f:
+      cache = json.load(f)
+  except (OSError, ValueError):
+    return {}
+  if not isinstance(cache, dict) or (
+      cache.get('version') != _INDEX_CACHE_VERSION):
+    return {}
+  return cache.get('directories', {})
+
+
+def _save_index_cache(path, listings):
+  """Atomically writes the directory `listings` to the file `path`."""
+  tmp_path = '%s.tmp%d' % (path, os.getpid())
+  with open(tmp_path, 'w') as f:
+    json.dump({'version': _INDEX_CACHE_VERSION, 'directories': listings}, f)
+  os.replace(tmp_path, path)
+
+
+def walk_directories(directories, follow_links=False, index_cache_path=None):
+  """Recursively lists the files in `directories`, using a pool of threads.
+
+  Each directory is listed in its own thread, which on network filesystems
+  is much faster than a serial `os.walk`.
+
+  If `index_cache_path` is set, the listings are also saved to that file. On
+  later calls, a directory is only listed again if its modification time has
+  changed: only a `stat` per directory is needed when nothing changed.
+
+  Args:
+    directories: List of paths of the directories to walk.
+    follow_links: Whether to visit subdirectories pointed to by symlinks.
+    index_cache_path: Optional path of a file caching the listings of
+      `directories` across calls.
+
+  Returns:
+    A list with one walk per directory. A walk is a list of
+      `(root, filenames)` tuples sorted by `root`, with the filenames sorted,
+      as `sorted(os.walk(directory, followlinks=follow_links))`.
+  """
+  cache = _load_index_cache(index_cache_path) if index_cache_path else {}
+  listings = {}
+  walks = [[] for _ in directories]
+  pending = {}
+  with futures.ThreadPoolExecutor() as executor:
+
+    def submit(root, walk):
+      cached = cache.get(os.path.abspath(root))
+      pending[executor.submit(_list_directory, root, cached)] = (root, walk)
+
+    for directory, walk in zip(directories, walks):
+      submit(directory, walk)
+    while pending:
+      done, _ = futures.wait(pending, return_when=futures.FIRST_COMPLETED)
+      for future in done:
+        root, walk = pending.pop(future)
+        listing = future.result()
+        if listing is None:
+          continue
+        listings[os.path.abspath(root)] = listing
+        _, files, subdirs, linked_subdirs = listing
+        walk.append((root, files))
+        for subdir in subdirs:
+          if follow_links or subdir not in linked_subdirs:
+            submit(os.path.join(root, subdir), walk)
+
+  if index_cache_path:
+    # Keep the listings of other directories, drop the ones of directories
+    # that were removed or modified too recently.
+    roots = tuple(os.path.join(os.path.abspath(d), '') for d in directories)
+    new_cache = {
+        key: listing for key, listing in cache.items()
+        if not (key + os.sep).startswith(roots)
+    }
+    min_mtime_ns = time.time_ns() - _INDEX_CACHE_MIN_AGE * 10**9
+    new_cache.update((key, listing) for key, listing in listings.items()
+                     if listing[0] <= min_mtime_ns)
+    if new_cache != cache:
+      _save_index_cache(index_cache_path, new_cache)
+
+  for walk in walks:
+    walk.sort(key=lambda x: x[0])
+  return walks
+
+
+def iter_valid_files(directory, follow_links, formats, walk=None):
+  if walk is None:
+    walk = walk_directories([directory], follow_links)[0]
+  for root, files in walk:
+    for fname in files:
       if fname.lower().endswith(formats):
         yield root, fname
 
 
-def index_subdirectory(directory, class_indices, follow_links, formats):
+def index_subdirectory(directory, class_indices, follow_links, formats,
+                       walk=None):
   """Recursively walks directory and list image paths and their class index.
 
   Args:
@@ -142,6 +278,7 @@ def index_subdirectory(directory, class_indices, follow_links, formats):
     follow_links: boolean, whether to recursively follow subdirectories
       (if False, we only list top-level images in `directory`).
     formats: Allowlist of file extensions to index (e.g. ".jpg", ".txt").
+    walk: Optional walk of `directory` returned by `walk_directories`.
 
   Returns:
     tuple `(filenames, labels)`. `filenames` is a list of relative file
@@ -149,7 +286,7 @@ def index_subdirectory(directory, class_indices, follow_links, formats):
       files.
   """
   dirname = os.path.basename(directory)
-  valid_files = iter_valid_files(directory, follow_links, formats)
+  valid_files = iter_valid_files(directory, follow_links, formats, walk)
   labels = []
   filenames = []
   for root, fname in valid_files:
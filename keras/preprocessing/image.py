@@ -20,13 +20,13 @@
 
 import collections
 import io
-import multiprocessing
 import os
 import pathlib
 import threading
 import warnings
 
 from keras import backend
+from keras.preprocessing import dataset_utils
 from keras.preprocessing.image_dataset import image_dataset_from_directory  # pylint: disable=unused-import
 from keras.utils import data_utils
 import numpy as np
@@ -537,7 +537,7 @@ class Iterator(data_utils.Sequence):
     raise NotImplementedError
 
 
-def _iter_valid_files(directory, white_list_formats, follow_links):
+def _iter_valid_files(directory, white_list_formats, follow_links, walk=None):
   """Iterates on files with extension.
 
   Args:
@@ -546,16 +546,16 @@ def _iter_valid_files(directory, white_list_formats, follow_links):
       white_list_formats: Set of strings containing allowed extensions for
           the files to be counted.
       follow_links: Boolean, follow symbolic links to subdirectories.
+      walk: Optional walk of `directory` returned by
+          `dataset_utils.walk_directories`.
   Yields:
       Tuple of (root, filename) with extension in `white_list_formats`.
   """
+  if walk is None:
+    walk = dataset_utils.walk_directories([directory], follow_links)[0]
 
-  def _recursive_list(subpath):
-    return sorted(
-        os.walk(subpath, followlinks=follow_links), key=lambda x: x[0])
-
-  for root, _, files in _recursive_list(directory):
-    for fname in sorted(files):
+  for root, files in walk:
+    for fname in files:
       if fname.lower().endswith('.tiff'):
         warnings.warn('Using ".tiff" files with multiple bands '
                       'will cause distortion. Please verify your output.')
@@ -564,7 +564,7 @@ def _iter_valid_files(directory, white_list_formats, follow_links):
 
 
 def _list_valid_filenames_in_directory(directory, white_list_formats, split,
-                                       class_indices, follow_links):
+                                       class_indices, follow_links, walk=None):
   """Lists paths of files in `subdir` with extensions in `white_list_formats`.
 
   Args:
@@ -579,6 +579,8 @@ def _list_valid_filenames_in_directory(directory, white_list_formats, split,
           of images in each directory.
       class_indices: dictionary mapping a class name to its index.
       follow_links: boolean, follow symbolic links to subdirectories.
+      walk: Optional walk of `directory` returned by
+          `dataset_utils.walk_directories`.
 
   Returns:
        classes: a list of class indices
@@ -590,12 +592,13 @@ def _list_valid_filenames_in_directory(directory, white_list_formats, split,
   dirname = os.path.basename(directory)
   if split:
     all_files = list(
-        _iter_valid_files(directory, white_list_formats, follow_links))
+        _iter_valid_files(directory, white_list_formats, follow_links, walk))
     num_files = len(all_files)
     start, stop = int(split[0] * num_files), int(split[1] * num_files)
     valid_files = all_files[start:stop]
   else:
-    valid_files = _iter_valid_files(directory, white_list_formats, follow_links)
+    valid_files = _iter_valid_files(directory, white_list_formats, follow_links,
+                                    walk)
   classes = []
   filenames = []
   for root, fname in valid_files:
@@ -608,6 +611,15 @@ def _list_valid_filenames_in_directory(directory, white_list_formats, split,
   return classes, filenames
 
 
+def _random_transform_batch(image_data_generator, batch_x):
+  """Randomly transforms, then standardizes, a batch of images at once."""
+  params = [image_data_generator.get_random_transform(x.shape) for x in batch_x]
+  batch_x = image_data_generator.apply_transform_batch(batch_x, params)
+  for i, x in enumerate(batch_x):
+    batch_x[i] = image_data_generator.standardize(x)
+  return batch_x
+
+
 class BatchFromFilesMixin():
   """Adds methods related to getting batches from filenames.
 
@@ -697,6 +709,8 @@ class BatchFromFilesMixin():
         A batch of transformed samples.
     """
     batch_x = np.zeros((len(index_array),) + self.image_shape, dtype=self.dtype)
+    batch_transform = getattr(self.image_data_generator, 'batch_transform',
+                              False)
     # build batch of image data
     # self.filepaths is dynamic, is better to call it once outside the loop
     filepaths = self.filepaths
@@ -712,11 +726,13 @@ class BatchFromFilesMixin():
       # but not PIL images.
       if hasattr(img, 'close'):
         img.close()
-      if self.image_data_generator:
+      if self.image_data_generator and not batch_transform:
         params = self.image_data_generator.get_random_transform(x.shape)
         x = self.image_data_generator.apply_transform(x, params)
         x = self.image_data_generator.standardize(x)
       batch_x[i] = x
+    if batch_transform:
+      batch_x = _random_transform_batch(self.image_data_generator, batch_x)
     # optionally save augmented images to disk for debugging purposes
     if self.save_to_dir:
       for i, j in enumerate(index_array):
@@ -818,6 +834,9 @@ class DirectoryIterator(BatchFromFilesMixin, Iterator):
           without aspect ratio distortion. The image is cropped in the center
           with target aspect ratio before resizing.
       dtype: Dtype to use for generated arrays.
+      index_cache_path: Optional path of a file in which to cache the listing
+        of `directory` across runs. Subdirectories whose modification time has
+        not changed are not listed again.
   """
   allowed_class_modes = {'categorical', 'binary', 'sparse', 'input', None}
 
@@ -839,7 +858,8 @@ class DirectoryIterator(BatchFromFilesMixin, Iterator):
                subset=None,
                interpolation='nearest',
                keep_aspect_ratio=False,
-               dtype=None):
+               dtype=None,
+               index_cache_path=None):
     if data_format is None:
       data_format = backend.image_data_format()
     if dtype is None:
@@ -866,21 +886,18 @@ class DirectoryIterator(BatchFromFilesMixin, Iterator):
     self.num_classes = len(classes)
     self.class_indices = dict(zip(classes, range(len(classes))))
 
-    pool = multiprocessing.pool.ThreadPool()
-
     # Second, build an index of the images
     # in the different class subfolders.
-    results = []
     self.filenames = []
     i = 0
-    for dirpath in (os.path.join(directory, subdir) for subdir in classes):
-      results.append(
-          pool.apply_async(_list_valid_filenames_in_directory,
-                           (dirpath, self.white_list_formats, self.split,
-                            self.class_indices, follow_links)))
+    dirpaths = [os.path.join(directory, subdir) for subdir in classes]
+    walks = dataset_utils.walk_directories(dirpaths, follow_links,
+                                           index_cache_path)
     classes_list = []
-    for res in results:
-      classes, filenames = res.get()
+    for dirpath, walk in zip(dirpaths, walks):
+      classes, filenames = _list_valid_filenames_in_directory(
+          dirpath, self.white_list_formats, self.split, self.class_indices,
+          follow_links, walk=walk)
       classes_list.append(classes)
       self.filenames += filenames
     self.samples = len(self.filenames)
@@ -891,8 +908,6 @@ class DirectoryIterator(BatchFromFilesMixin, Iterator):
 
     print('Found %d images belonging to %d classes.' %
           (self.samples, self.num_classes))
-    pool.close()
-    pool.join()
     self._filepaths = [
         os.path.join(self.directory, fname) for fname in self.filenames
     ]
@@ -1046,15 +1061,19 @@ class NumpyArrayIterator(Iterator):
     super().__init__(x.shape[0], batch_size, shuffle, seed)
 
   def _get_batches_of_transformed_samples(self, index_array):
-    batch_x = np.zeros(
-        tuple([len(index_array)] + list(self.x.shape)[1:]), dtype=self.dtype)
-    for i, j in enumerate(index_array):
-      x = self.x[j]
-      params = self.image_data_generator.get_random_transform(x.shape)
-      x = self.image_data_generator.apply_transform(
-          x.astype(self.dtype), params)
-      x = self.image_data_generator.standardize(x)
-      batch_x[i] = x
+    if getattr(self.image_data_generator, 'batch_transform', False):
+      batch_x = _random_transform_batch(
+          self.image_data_generator, self.x[index_array].astype(self.dtype))
+    else:
+      batch_x = np.zeros(
+          tuple([len(index_array)] + list(self.x.shape)[1:]), dtype=self.dtype)
+      for i, j in enumerate(index_array):
+        x = self.x[j]
+        params = self.image_data_generator.get_random_transform(x.shape)
+        x = self.image_data_generator.apply_transform(
+            x.astype(self.dtype), params)
+        x = self.image_data_generator.standardize(x)
+        batch_x[i] = x
 
     if self.save_to_dir:
       for i, j in enumerate(index_array):
@@ -1426,12 +1445,19 @@ class ImageDataGenerator():
       validation_split: Float. Fraction of images reserved for validation
         (strictly between 0 and 1).
       dtype: Dtype to use for the generated arrays.
+      batch_transform: Boolean. Whether the iterators returned by `flow`,
+        `flow_from_directory` and `flow_from_dataframe` transform each batch
+        at once with `apply_transform_batch`, instead of one image at a time
+        with `apply_transform`. Requires `interpolation_order` 0 or 1. The
+        results can differ slightly along the image borders.
 
   Raises:
     ValueError: If the value of the argument, `data_format` is other than
           `"channels_last"` or `"channels_first"`.
     ValueError: If the value of the argument, `validation_split` > 1
           or `validation_split` < 0.
+    ValueError: If `batch_transform` is set with an `interpolation_order`
+          other than 0 or 1.
 
   Examples:
 
@@ -1554,11 +1580,16 @@ class ImageDataGenerator():
                data_format=None,
                validation_split=0.0,
                interpolation_order=1,
-               dtype=None):
+               dtype=None,
+               batch_transform=False):
     if data_format is None:
       data_format = backend.image_data_format()
     if dtype is None:
       dtype = backend.floatx()
+    if batch_transform and interpolation_order not in _BATCH_INTERPOLATIONS:
+      raise ValueError('`batch_transform` requires an `interpolation_order` '
+                       'of 0 or 1. Received: interpolation_order=%s' %
+                       (interpolation_order,))
 
     self.featurewise_center = featurewise_center
     self.samplewise_center = samplewise_center
@@ -1580,6 +1611,7 @@ class ImageDataGenerator():
     self.preprocessing_function = preprocessing_function
     self.dtype = dtype
     self.interpolation_order = interpolation_order
+    self.batch_transform = batch_transform
 
     if data_format not in {'channels_last', 'channels_first'}:
       raise ValueError('`data_format` should be `"channels_last"` '
@@ -1732,7 +1764,8 @@ class ImageDataGenerator():
                           follow_links=False,
                           subset=None,
                           interpolation='nearest',
-                          keep_aspect_ratio=False):
+                          keep_aspect_ratio=False,
+                          index_cache_path=None):
     """Takes the path to a directory & generates batches of augmented data.
 
     Args:
@@ -1793,6 +1826,9 @@ class ImageDataGenerator():
         keep_aspect_ratio: Boolean, whether to resize images to a target
           size without aspect ratio distortion. The image is cropped in
           the center with target aspect ratio before resizing.
+        index_cache_path: Optional path of a file in which to cache the
+          listing of `directory` across runs. Subdirectories whose
+          modification time has not changed are not listed again.
 
     Returns:
         A `DirectoryIterator` yielding tuples of `(x, y)`
@@ -1818,7 +1854,8 @@ class ImageDataGenerator():
         follow_links=follow_links,
         subset=subset,
         interpolation=interpolation,
-        dtype=self.dtype)
+        dtype=self.dtype,
+        index_cache_path=index_cache_path)
 
   def flow_from_dataframe(self,
                           dataframe,
@@ -2162,6 +2199,81 @@ class ImageDataGenerator():
 
     return x
 
+  def apply_transform_batch(self, x, transform_parameters):
+    """Applies transformations to a batch of images.
+
+    This is equivalent to calling `apply_transform` on each image, except that
+    the affine transformations of all the images are applied at once, with a
+    single vectorized warp. With an `interpolation_order` other than 0 or 1,
+    which the warp doesn't support, the images are transformed one at a time.
+
+    Args:
+        x: 4D tensor, batch of images.
+        transform_parameters: List of dictionaries describing the
+            transformation of each image, see `apply_transform`.
+
+    Returns:
+        A transformed version of the input (same shape).
+    """
+    if len(x) != len(transform_parameters):
+      raise ValueError('`transform_parameters` must have one entry per image. '
+                       'Received: %d images and %d transform_parameters.' %
+                       (len(x), len(transform_parameters)))
+    if self.interpolation_order not in _BATCH_INTERPOLATIONS:
+      return np.stack([self.apply_transform(xi, params)
+                       for xi, params in zip(x, transform_parameters)])
+
+    def get_params(name, default):
+      return np.array([params.get(name, default)
+                       for params in transform_parameters], dtype='float64')
+
+    transforms = _batch_affine_transforms(
+        get_params('theta', 0), get_params('tx', 0), get_params('ty', 0),
+        get_params('shear', 0), get_params('zx', 1), get_params('zy', 1),
+        x.shape[self.row_axis], x.shape[self.col_axis])
+    if transforms is not None:
+      if self.data_format == 'channels_first':
+        x = np.transpose(x, (0, 2, 3, 1))
+      x = tf.raw_ops.ImageProjectiveTransformV3(
+          images=tf.convert_to_tensor(x),
+          transforms=transforms,
+          output_shape=x.shape[1:3],
+          fill_value=tf.cast(self.cval, tf.float32),
+          fill_mode=self.fill_mode.upper(),
+          interpolation=_BATCH_INTERPOLATIONS[self.interpolation_order]).numpy()
+      if self.data_format == 'channels_first':
+        x = np.transpose(x, (0, 3, 1, 2))
+    else:
+      x = x.copy()
+
+    shifted = np.array([
+        params.get('channel_shift_intensity') is not None
+        for params in transform_parameters
+    ])
+    if shifted.any():
+      # Same as `apply_channel_shift`, with a batch axis.
+      intensities = np.array([
+          params['channel_shift_intensity']
+          for params, is_shifted in zip(transform_parameters, shifted)
+          if is_shifted
+      ]).reshape((-1, 1, 1, 1))
+      x_shifted = x[shifted]
+      min_x = np.min(x_shifted, axis=(1, 2, 3), keepdims=True)
+      max_x = np.max(x_shifted, axis=(1, 2, 3), keepdims=True)
+      x[shifted] = np.clip(x_shifted + intensities, min_x, max_x)
+
+    for name, axis in (('flip_horizontal', self.col_axis),
+                       ('flip_vertical', self.row_axis)):
+      flipped = np.array(
+          [bool(params.get(name, False)) for params in transform_parameters])
+      if flipped.any():
+        x[flipped] = np.flip(x[flipped], axis)
+
+    for i, params in enumerate(transform_parameters):
+      if params.get('brightness') is not None:
+        x[i] = apply_brightness_shift(x[i], params['brightness'], False)
+    return x
+
   def random_transform(self, x, seed=None):
     """Applies a random transformation to an image.
 
@@ -2175,7 +2287,7 @@ class ImageDataGenerator():
     params = self.get_random_transform(x.shape, seed)
     return self.apply_transform(x, params)
 
-  def fit(self, x, augment=False, rounds=1, seed=None):
+  def fit(self, x, augment=False, rounds=1, seed=None, steps=None):
     """Fits the data generator to some sample data.
 
     This computes the internal data stats related to the
@@ -2187,37 +2299,43 @@ class ImageDataGenerator():
     When `rescale` is set to a value, rescaling is applied to
     sample data before computing the internal data stats.
 
+    The sample data can also be streamed from a `keras.utils.Sequence`, a
+    generator or a `tf.data.Dataset` yielding batches of images, or tuples
+    whose first element is a batch of images. The stats are then accumulated
+    in a single pass over the batches, without holding the sample data in
+    memory. With `zca_whitening`, this accumulates the covariance matrix of
+    the flattened images, and the whitening matrix is computed from it.
+
     Args:
         x: Sample data. Should have rank 4.
          In case of grayscale data,
          the channels axis should have value 1, in case
          of RGB data, it should have value 3, and in case
          of RGBA data, it should have value 4.
+         Can also be a `Sequence`, a generator or a `tf.data.Dataset`
+         yielding batches of sample data.
         augment: Boolean (default: False).
             Whether to fit on randomly augmented samples.
         rounds: Int (default: 1).
             If using data augmentation (`augment=True`),
             this is how many augmentation passes over the data to use.
         seed: Int (default: None). Random seed.
+        steps: Int (default: None). When `x` is a `Sequence`, a generator
+            or a `tf.data.Dataset`, the number of batches to fit on. By
+            default, the data generator is fit on all the batches, which
+            requires `x` to be finite.
     """
-    x = np.asarray(x, dtype=self.dtype)
-    if x.ndim != 4:
-      raise ValueError('Input to `.fit()` should have rank 4. '
-                       'Got array with shape: ' + str(x.shape))
-    if x.shape[self.channel_axis] not in {1, 3, 4}:
-      warnings.warn('Expected input to be images (as Numpy array) '
-                    'following the data format convention "' +
-                    self.data_format + '" (channels on axis ' +
-                    str(self.channel_axis) + '), i.e. expected '
-                    'either 1, 3 or 4 channels on axis ' +
-                    str(self.channel_axis) + '. '
-                    'However, it was passed an array with shape ' +
-                    str(x.shape) + ' (' + str(x.shape[self.channel_axis]) +
-                    ' channels).')
-
     if seed is not None:
       np.random.seed(seed)
 
+    if (isinstance(x, (data_utils.Sequence, tf.data.Dataset)) or
+        hasattr(x, '__next__')):
+      self._fit_on_batches(x, augment, rounds, steps)
+      return
+
+    x = np.asarray(x, dtype=self.dtype)
+    self._check_fit_input(x)
+
     x = np.copy(x)
     if self.rescale:
       x *= self.rescale
@@ -2252,6 +2370,146 @@ class ImageDataGenerator():
       s_inv = np.sqrt(n) / (s + self.zca_epsilon)
       self.zca_whitening_matrix = (u * s_inv).dot(u.T)
 
+  def _check_fit_input(self, x):
+    if x.ndim != 4:
+      raise ValueError('Input to `.fit()` should have rank 4. '
+                       'Got array with shape: ' + str(x.shape))
+    if x.shape[self.channel_axis] not in {1, 3, 4}:
+      warnings.warn('Expected input to be images (as Numpy array) '
+                    'following the data format convention "' +
+                    self.data_format + '" (channels on axis ' +
+                    str(self.channel_axis) + '), i.e. expected '
+                    'either 1, 3 or 4 channels on axis ' +
+                    str(self.channel_axis) + '. '
+                    'However, it was passed an array with shape ' +
+                    str(x.shape) + ' (' + str(x.shape[self.channel_axis]) +
+                    ' channels).')
+
+  def _fit_on_batches(self, batches, augment, rounds, steps):
+    """Fits the data generator in one pass over a stream of batches."""
+    stats = _ImageStatistics(covariance=self.zca_whitening)
+    for x in _iter_image_batches(batches, steps):
+      x = np.asarray(x, dtype=self.dtype)
+      if not stats.count:
+        self._check_fit_input(x)
+      if self.rescale:
+        x = x * self.rescale
+      if not augment:
+        stats.update(x)
+        continue
+      for _ in range(rounds):
+        if self.batch_transform:
+          params = [self.get_random_transform(xi.shape) for xi in x]
+          stats.update(self.apply_transform_batch(x, params))
+        else:
+          stats.update(np.stack([self.random_transform(xi) for xi in x]))
+    if not stats.count:
+      raise ValueError('Input to `.fit()` did not yield any sample.')
+
+    # Per-channel stats, as if computed on the whole sample data.
+    image_axes = (self.row_axis - 1, self.col_axis - 1)
+    n = stats.count
+    mean = stats.mean
+    channel_mean = np.mean(mean, axis=image_axes, keepdims=True)
+    squared_deviations = stats.squared_deviations() + n * np.square(
+        mean - channel_mean)
+    channel_std = np.sqrt(
+        np.mean(squared_deviations, axis=image_axes, keepdims=True) / n)
+
+    if self.featurewise_center:
+      self.mean = channel_mean.astype(self.dtype)
+    if self.featurewise_std_normalization:
+      self.std = channel_std.astype(self.dtype)
+
+    if self.zca_whitening:
+      # `x.T @ x` of the flattened sample data, after the featurewise
+      # centering and normalization.
+      offset = mean - channel_mean if self.featurewise_center else mean
+      offset = offset.reshape((-1,))
+      gram = stats.comoments + n * np.outer(offset, offset)
+      if self.featurewise_std_normalization:
+        scale = np.broadcast_to(1 / (channel_std + 1e-6), mean.shape)
+        scale = scale.reshape((-1,))
+        gram *= np.outer(scale, scale)
+      # The left singular vectors of `x.T` are the eigenvectors of `x.T @ x`,
+      # and its singular values the square roots of its eigenvalues.
+      u, eigenvalues, _ = np.linalg.svd(gram, hermitian=True)
+      rank = min(n, len(eigenvalues))
+      u = u[:, :rank]
+      s = np.sqrt(np.maximum(eigenvalues[:rank], 0))
+      s_inv = np.sqrt(n) / (s + self.zca_epsilon)
+      self.zca_whitening_matrix = (u * s_inv).dot(u.T).astype(self.dtype)
+
+
+def _iter_image_batches(batches, steps=None):
+  """Yields the batches of images of a `Sequence`, generator or dataset."""
+  if isinstance(batches, data_utils.Sequence):
+    # `Iterator`s are infinite when iterated upon.
+    sequence = batches
+    batches = (sequence[i] for i in range(len(sequence)))
+  for step, batch in enumerate(batches):
+    if steps is not None and step >= steps:
+      break
+    if isinstance(batch, (tuple, list)):
+      batch = batch[0]
+    yield batch
+
+
+class _ImageStatistics():
+  """Featurewise statistics of images, accumulated batch by batch.
+
+  The batches are merged with the pairwise algorithm of Chan et al., in
+  float64, which is numerically stable.
+
+  Attributes:
+      count: Number of images seen.
+      mean: Mean image.
+      comoments: With `covariance=True`, the sum of the outer products of the
+        deviations of the flattened images from the mean.
+  """
+
+  def __init__(self, covariance=False):
+    self.covariance = covariance
+    self.count = 0
+    self.mean = None
+    self.comoments = None
+
+  def update(self, x):
+    """Adds a batch of images to the statistics."""
+    x = np.asarray(x, dtype='float64')
+    n = len(x)
+    if not n:
+      return
+    if self.count and x.shape[1:] != self.mean.shape:
+      raise ValueError('All the images should have the same shape. Received '
+                       'images of shape %s after images of shape %s.' %
+                       (x.shape[1:], self.mean.shape))
+    mean = np.mean(x, axis=0)
+    deviations = np.reshape(x - mean, (n, -1))
+    if self.covariance:
+      comoments = deviations.T.dot(deviations)
+    else:
+      comoments = np.sum(np.square(deviations), axis=0)
+
+    if not self.count:
+      self.count, self.mean, self.comoments = n, mean, comoments
+      return
+    total = self.count + n
+    delta = np.reshape(mean - self.mean, (-1,))
+    if self.covariance:
+      comoments += np.outer(delta, delta) * (self.count * n / total)
+    else:
+      comoments += np.square(delta) * (self.count * n / total)
+    self.comoments += comoments
+    self.mean += (mean - self.mean) * (n / total)
+    self.count = total
+
+  def squared_deviations(self):
+    """Returns the sum of the squared deviations from the mean image."""
+    if self.covariance:
+      return np.reshape(np.diagonal(self.comoments), self.mean.shape)
+    return np.reshape(self.comoments, self.mean.shape)
+
 
 @keras_export('keras.preprocessing.image.random_rotation')
 def random_rotation(x, rg, row_axis=1, col_axis=2, channel_axis=0,
@@ -2498,12 +2756,65 @@ def random_brightness(x, brightness_range, scale=True):
   return apply_brightness_shift(x, u, scale)
 
 
+# Interpolation of the vectorized warp of `apply_transform_batch`, by the
+# equivalent spline order of `apply_affine_transform`.
+_BATCH_INTERPOLATIONS = {0: 'NEAREST', 1: 'BILINEAR'}
+
+
+def _batch_affine_transforms(theta, tx, ty, shear, zx, zy, h, w):
+  """Returns the warp of each image of a batch, see `apply_affine_transform`.
+
+  Args:
+      theta: 1D array, rotation angle in degrees of each image.
+      tx: 1D array, width shift of each image.
+      ty: 1D array, height shift of each image.
+      shear: 1D array, shear angle in degrees of each image.
+      zx: 1D array, zoom in x direction of each image.
+      zy: 1D array, zoom in y direction of each image.
+      h: Height of the images.
+      w: Width of the images.
+
+  Returns:
+      Array of shape `(batch_size, 8)` holding the transforms of the images,
+      in the format of `tf.raw_ops.ImageProjectiveTransformV3`, or None if no
+      image is transformed.
+  """
+  batch_size = len(theta)
+  identity = np.broadcast_to(np.eye(3), (batch_size, 3, 3))
+  theta = np.deg2rad(theta)
+  shear = np.deg2rad(shear)
+
+  rotation = identity.copy()
+  rotation[:, 0, 0] = np.cos(theta)
+  rotation[:, 0, 1] = -np.sin(theta)
+  rotation[:, 1, 0] = np.sin(theta)
+  rotation[:, 1, 1] = np.cos(theta)
+  shift = identity.copy()
+  shift[:, 0, 2] = tx
+  shift[:, 1, 2] = ty
+  shear_matrix = identity.copy()
+  shear_matrix[:, 0, 1] = -np.sin(shear)
+  shear_matrix[:, 1, 1] = np.cos(shear)
+  zoom = identity.copy()
+  zoom[:, 0, 0] = zx
+  zoom[:, 1, 1] = zy
+  transforms = rotation @ shift @ shear_matrix @ zoom
+  if np.array_equal(transforms, identity):
+    return None
+
+  transforms = transform_matrix_offset_center(transforms, h, w)
+  # `apply_affine_transform` swaps the x and y axes of this matrix to warp
+  # (row, column) coordinates: the warp of (column, row) coordinates expected
+  # by `ImageProjectiveTransformV3` is the matrix itself.
+  return transforms.reshape((batch_size, 9))[:, :8].astype('float32')
+
+
 def transform_matrix_offset_center(matrix, x, y):
   o_x = float(x) / 2 - 0.5
   o_y = float(y) / 2 - 0.5
   offset_matrix = np.array([[1, 0, o_x], [0, 1, o_y], [0, 0, 1]])
   reset_matrix = np.array([[1, 0, -o_x], [0, 1, -o_y], [0, 0, 1]])
-  transform_matrix = np.dot(np.dot(offset_matrix, matrix), reset_matrix)
+  transform_matrix = offset_matrix @ matrix @ reset_matrix
   return transform_matrix
 
 
@@ -44,6 +44,7 @@ def image_dataset_from_directory(directory,
                                  interpolation='bilinear',
                                  follow_links=False,
                                  crop_to_aspect_ratio=False,
+                                 index_cache_path=None,
                                  **kwargs):
   """Generates a `tf.data.Dataset` from image files in a directory.
 
@@ -122,6 +123,9 @@ def image_dataset_from_directory(directory,
       possible window in the image (of size `image_size`) that matches
       the target aspect ratio. By default (`crop_to_aspect_ratio=False`),
       aspect ratio may not be preserved.
+    index_cache_path: Optional path of a file in which to cache the listing
+        of `directory` across runs. Subdirectories whose modification time
+        has not changed are not listed again. Defaults to None.
     **kwargs: Legacy keyword arguments.
 
   Returns:
@@ -197,7 +201,8 @@ def image_dataset_from_directory(directory,
       class_names=class_names,
       shuffle=shuffle,
       seed=seed,
-      follow_links=follow_links)
+      follow_links=follow_links,
+      index_cache_path=index_cache_path)
 
   if label_mode == 'binary' and len(class_names) != 2:
     raise ValueError(
@@ -2063,6 +2063,53 @@ class TestImageDataGenerator(test_combinations.TestCase):
     x = np.random.random((32, 1, 4, 4))
     generator.fit(x)
 
+  @parameterized.parameters(['channels_last', 'channels_first'])
+  def test_image_data_generator_fit_streaming(self, data_format):
+    def make_generator(zca_whitening=False):
+      return image.ImageDataGenerator(
+          featurewise_center=True,
+          featurewise_std_normalization=not zca_whitening,
+          zca_whitening=zca_whitening,
+          rescale=2.,
+          data_format=data_format)
+
+    shape = (4, 4, 3) if data_format == 'channels_last' else (3, 4, 4)
+    x = np.random.random((64,) + shape) + 1.
+    expected = make_generator()
+    expected.fit(x)
+    expected_zca = make_generator(zca_whitening=True)
+    expected_zca.fit(x)
+
+    dataset = tf.data.Dataset.from_tensor_slices((x, np.arange(64))).batch(10)
+    def inputs():
+      return [
+          (x[i:i + 8] for i in range(0, 64, 8)),
+          image.ImageDataGenerator().flow(x, batch_size=16),
+          dataset,
+      ]
+
+    for batches in inputs():
+      generator = make_generator()
+      generator.fit(batches)
+      self.assertAllClose(generator.mean, expected.mean, atol=1e-5)
+      self.assertAllClose(generator.std, expected.std, atol=1e-5)
+    for batches in inputs():
+      generator = make_generator(zca_whitening=True)
+      generator.fit(batches)
+      self.assertAllClose(generator.mean, expected_zca.mean, atol=1e-5)
+      self.assertAllClose(generator.zca_whitening_matrix,
+                          expected_zca.zca_whitening_matrix, atol=1e-3)
+
+    # Fits on the first steps of an infinite generator.
+    generator = make_generator()
+    generator.fit(iter(dataset.repeat()), steps=3, augment=True, rounds=2)
+    self.assertEqual(generator.mean.shape, expected.mean.shape)
+
+    with self.assertRaisesRegex(ValueError, 'did not yield any sample'):
+      make_generator().fit(iter([]))
+    with self.assertRaisesRegex(ValueError, 'should have rank 4'):
+      make_generator().fit(iter([x[0]]))
+
   def test_image_data_generator_flow(self):
     tmpdir = self.create_tempdir()
     all_test_images = _generate_test_images(include_rgba=True)
@@ -2234,6 +2281,63 @@ class TestImageDataGenerator(test_combinations.TestCase):
                           [[0., 0., 0.], [1., 1., 1.], [0., 0., 0.]]])
     self.assertAllClose(generator.apply_transform(x, {'theta': 45}), x_rotated)
 
+  @parameterized.parameters(['channels_last', 'channels_first'])
+  def test_apply_transform_batch(self, data_format):
+    generator = image.ImageDataGenerator(
+        rotation_range=20,
+        width_shift_range=2,
+        height_shift_range=2,
+        shear_range=10,
+        zoom_range=0.1,
+        channel_shift_range=0.1,
+        horizontal_flip=True,
+        vertical_flip=True,
+        fill_mode='nearest',
+        data_format=data_format)
+    # A smooth image, so that interpolation errors stay small.
+    rows, cols = np.meshgrid(np.linspace(0, 1, 32), np.linspace(0, 1, 32),
+                             indexing='ij')
+    x = np.stack([rows, cols, rows * cols], axis=-1)
+    if data_format == 'channels_first':
+      x = np.transpose(x, (2, 0, 1))
+    x = np.stack([x] * 8).astype('float32')
+
+    params = [generator.get_random_transform(x.shape[1:], seed=i)
+              for i in range(8)]
+    params[0] = {}
+    params[1] = {'flip_horizontal': True, 'channel_shift_intensity': 0.5}
+    expected = np.stack(
+        [generator.apply_transform(xi, p) for xi, p in zip(x, params)])
+    transformed = generator.apply_transform_batch(x, params)
+    self.assertEqual(transformed.shape, x.shape)
+    self.assertAllClose(transformed[:2], expected[:2])
+    # The warps only differ in the rounding of the sampled coordinates.
+    if data_format == 'channels_first':
+      transformed = np.transpose(transformed, (0, 2, 3, 1))
+      expected = np.transpose(expected, (0, 2, 3, 1))
+    self.assertAllClose(transformed[:, 4:-4, 4:-4], expected[:, 4:-4, 4:-4],
+                        atol=1e-2)
+
+    with self.assertRaisesRegex(ValueError, 'one entry per image'):
+      generator.apply_transform_batch(x, params[:2])
+
+  def test_batch_transform_flow(self):
+    generator = image.ImageDataGenerator(
+        rotation_range=90,
+        width_shift_range=0.1,
+        zoom_range=0.2,
+        horizontal_flip=True,
+        featurewise_center=True,
+        batch_transform=True)
+    x = np.random.random((10, 16, 16, 3))
+    generator.fit(x)
+    batch_x, batch_y = next(generator.flow(x, np.arange(10), batch_size=4))
+    self.assertEqual(batch_x.shape, (4, 16, 16, 3))
+    self.assertEqual(batch_y.shape, (4,))
+
+    with self.assertRaisesRegex(ValueError, '`interpolation_order` of 0 or 1'):
+      image.ImageDataGenerator(batch_transform=True, interpolation_order=2)
+
   def test_random_transforms(self):
     x = np.random.random((2, 28, 28))
     # Test get_random_transform with predefined seed
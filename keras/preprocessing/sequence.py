@@ -22,6 +22,7 @@ import random
 
 from keras.utils import data_utils
 import numpy as np
+import tensorflow.compat.v2 as tf
 
 from tensorflow.python.util.tf_export import keras_export
 
@@ -221,7 +222,8 @@ class TimeseriesGenerator(data_utils.Sequence):
 @keras_export('keras.utils.pad_sequences',
               'keras.preprocessing.sequence.pad_sequences')
 def pad_sequences(sequences, maxlen=None, dtype='int32',
-                  padding='pre', truncating='pre', value=0.):
+                  padding='pre', truncating='pre', value=0.,
+                  row_splits=None, out=None):
   """Pads sequences to the same length.
 
   This function transforms a list (of length `num_samples`)
@@ -262,8 +264,21 @@ def pad_sequences(sequences, maxlen=None, dtype='int32',
          [2, 3],
          [5, 6]], dtype=int32)
 
+  Sequences given as a `tf.RaggedTensor`, as a list of NumPy arrays sharing
+  the same dtype and sample shape, or as flat `values` with CSR-style
+  `row_splits` are padded with a single vectorized copy instead of one copy
+  per sequence:
+
+  >>> tf.keras.preprocessing.sequence.pad_sequences(
+  ...     [1, 2, 3, 4, 5, 6], row_splits=[0, 1, 3, 6])
+  array([[0, 0, 1],
+         [0, 2, 3],
+         [4, 5, 6]], dtype=int32)
+
   Args:
-      sequences: List of sequences (each sequence is a list of integers).
+      sequences: List of sequences (each sequence is a list of integers),
+          a `tf.RaggedTensor`, or, if `row_splits` is passed, the values of
+          all sequences concatenated along the first axis.
       maxlen: Optional Int, maximum length of all sequences. If not provided,
           sequences will be padded to the length of the longest individual
           sequence.
@@ -275,14 +290,33 @@ def pad_sequences(sequences, maxlen=None, dtype='int32',
           remove values from sequences larger than
           `maxlen`, either at the beginning or at the end of the sequences.
       value: Float or String, padding value. (Optional, defaults to 0.)
+      row_splits: Optional 1D array of integers. If provided, sequence `i` is
+          `sequences[row_splits[i]:row_splits[i + 1]]`.
+      out: Optional Numpy array to write the result into, e.g. to reuse the
+          same buffer across batches. It must have the shape and `dtype` of
+          the result. If `maxlen` is not provided, it defaults to
+          `out.shape[1]`.
 
   Returns:
       Numpy array with shape `(len(sequences), maxlen)`
 
   Raises:
       ValueError: In case of invalid values for `truncating` or `padding`,
-          or in case of invalid shape for a `sequences` entry.
+          in case of invalid shape for a `sequences` entry, or in case of
+          invalid `row_splits` or `out`.
   """
+  if out is not None and maxlen is None:
+    maxlen = out.shape[1]
+  if isinstance(sequences, tf.RaggedTensor) and sequences.ragged_rank > 1:
+    sequences = sequences.to_list()
+  flat = _as_flat_sequences(sequences, row_splits)
+  if flat is not None:
+    _check_value_dtype(value, dtype)
+    values, lengths = flat
+    return _pad_flat_sequences(values, lengths, maxlen=maxlen, dtype=dtype,
+                               padding=padding, truncating=truncating,
+                               value=value, out=out)
+
   if not hasattr(sequences, '__len__'):
     raise ValueError('`sequences` must be iterable.')
   num_samples = len(sequences)
@@ -307,15 +341,9 @@ def pad_sequences(sequences, maxlen=None, dtype='int32',
   if maxlen is None:
     maxlen = np.max(lengths)
 
-  is_dtype_str = np.issubdtype(dtype, np.str_) or np.issubdtype(
-      dtype, np.unicode_)
-  if isinstance(value, str) and dtype != object and not is_dtype_str:
-    raise ValueError(
-        "`dtype` {} is not compatible with `value`'s type: {}\n"
-        'You should set `dtype=object` for variable length strings.'.format(
-            dtype, type(value)))
+  _check_value_dtype(value, dtype)
 
-  x = np.full((num_samples, maxlen) + sample_shape, value, dtype=dtype)
+  x = _padded_output((num_samples, maxlen) + sample_shape, dtype, value, out)
   for idx, s in enumerate(sequences):
     if not len(s):  # pylint: disable=g-explicit-length-test
       continue  # empty list/array was found
@@ -342,6 +370,124 @@ def pad_sequences(sequences, maxlen=None, dtype='int32',
   return x
 
 
+def _check_value_dtype(value, dtype):
+  """Checks that the padding `value` can be stored with `dtype`."""
+  is_dtype_str = np.issubdtype(dtype, np.str_) or np.issubdtype(
+      dtype, np.unicode_)
+  if isinstance(value, str) and dtype != object and not is_dtype_str:
+    raise ValueError(
+        "`dtype` {} is not compatible with `value`'s type: {}\n"
+        'You should set `dtype=object` for variable length strings.'.format(
+            dtype, type(value)))
+
+
+def _padded_output(shape, dtype, value, out=None):
+  """Returns an array of `shape` filled with `value`, reusing `out` if set."""
+  if out is None:
+    return np.full(shape, value, dtype=dtype)
+  if (not isinstance(out, np.ndarray) or out.shape != shape or
+      out.dtype != np.dtype(dtype)):
+    raise ValueError(
+        f'`out` must be a Numpy array with shape {shape} and dtype '
+        f'{np.dtype(dtype)}. Received: out={out!r}')
+  out.fill(value)
+  return out
+
+
+def _as_flat_sequences(sequences, row_splits=None):
+  """Returns `sequences` as `(values, lengths)` when no copy loop is needed.
+
+  Args:
+      sequences: See `pad_sequences`.
+      row_splits: See `pad_sequences`.
+
+  Returns:
+      A tuple `(values, lengths)` where `values` holds all the sequences
+      concatenated along the first axis, or `None` if `sequences` has to be
+      padded one sequence at a time.
+
+  Raises:
+      ValueError: In case of invalid `row_splits`.
+  """
+  if row_splits is not None:
+    values = np.asarray(sequences)
+    row_splits = np.asarray(row_splits)
+    if (row_splits.ndim != 1 or not row_splits.size or
+        not np.issubdtype(row_splits.dtype, np.integer) or
+        row_splits[0] != 0 or row_splits[-1] != len(values) or
+        np.any(np.diff(row_splits) < 0)):
+      raise ValueError(
+          '`row_splits` must be a non-decreasing 1D array of integers '
+          'starting at 0 and ending at the number of values '
+          f'({len(values)}). Received: row_splits={row_splits}')
+    return values, np.diff(row_splits)
+
+  if isinstance(sequences, tf.RaggedTensor):
+    return sequences.values.numpy(), sequences.row_lengths().numpy()
+
+  if (isinstance(sequences, np.ndarray) and sequences.dtype != object and
+      sequences.ndim >= 2):
+    return (sequences.reshape((-1,) + sequences.shape[2:]),
+            np.full(len(sequences), sequences.shape[1]))
+
+  if (isinstance(sequences, (list, tuple)) and sequences and
+      all(isinstance(s, np.ndarray) and s.ndim for s in sequences)):
+    first = sequences[0]
+    if all(s.dtype == first.dtype and s.shape[1:] == first.shape[1:]
+           for s in sequences):
+      return np.concatenate(sequences), np.array([len(s) for s in sequences])
+  return None
+
+
+def _pad_flat_sequences(values, lengths, maxlen=None, dtype='int32',
+                        padding='pre', truncating='pre', value=0., out=None):
+  """Pads sequences stored back to back in a single array.
+
+  This is the vectorized counterpart of `pad_sequences` for sequences given as
+  the concatenation of their `values` and the `lengths` of each sequence: the
+  output is filled with a single scatter instead of one copy per sequence.
+
+  Args:
+      values: Numpy array of shape `(sum(lengths),) + sample_shape`.
+      lengths: 1D integer Numpy array, the length of each sequence.
+      maxlen: See `pad_sequences`.
+      dtype: See `pad_sequences`.
+      padding: See `pad_sequences`.
+      truncating: See `pad_sequences`.
+      value: See `pad_sequences`.
+      out: See `pad_sequences`.
+
+  Returns:
+      Numpy array with shape `(len(lengths), maxlen) + sample_shape`.
+
+  Raises:
+      ValueError: In case of invalid values for `truncating` or `padding`,
+          or in case of invalid `out`.
+  """
+  if truncating not in ('pre', 'post'):
+    raise ValueError('Truncating type "%s" not understood' % truncating)
+  if padding not in ('pre', 'post'):
+    raise ValueError('Padding type "%s" not understood' % padding)
+  lengths = np.asarray(lengths, dtype=np.int64)
+  if maxlen is None:
+    maxlen = int(lengths.max()) if len(lengths) else 0
+
+  x = _padded_output((len(lengths), maxlen) + values.shape[1:], dtype, value,
+                     out)
+  kept = np.minimum(lengths, maxlen)
+  ends = np.cumsum(lengths)
+  src_start = ends - lengths if truncating == 'post' else ends - kept
+  dst_start = np.zeros_like(kept) if padding == 'post' else maxlen - kept
+
+  # Position of each kept element within its (truncated) sequence.
+  kept_offsets = np.cumsum(kept) - kept
+  positions = np.arange(kept.sum()) - np.repeat(kept_offsets, kept)
+  rows = np.repeat(np.arange(len(lengths)), kept)
+  x[rows, np.repeat(dst_start, kept) + positions] = values[
+      np.repeat(src_start, kept) + positions]
+  return x
+
+
 @keras_export('keras.preprocessing.sequence.make_sampling_table')
 def make_sampling_table(size, sampling_factor=1e-5):
   """Generates a word rank-based probabilistic sampling table.
@@ -92,6 +92,47 @@ class TestSequence(tf.test.TestCase):
     self.assertAllClose(b, [[[1, 1], [1, 1], [1, 1]], [[1, 1], [2, 1], [2, 2]],
                             [[3, 1], [3, 2], [3, 3]]])
 
+  def test_pad_sequences_flat_inputs(self):
+    a = [[1], [], [1, 2], [1, 2, 3, 4]]
+    flat_inputs = [
+        ([np.array(s, dtype='int64') for s in a], {}),
+        (tf.ragged.constant(a, dtype='int64'), {}),
+        (np.array([1, 1, 2, 1, 2, 3, 4]), {'row_splits': [0, 1, 1, 3, 7]}),
+    ]
+
+    for kwargs in [{}, {'maxlen': 2}, {'maxlen': 5, 'padding': 'post'},
+                   {'maxlen': 3, 'truncating': 'post', 'value': -1}]:
+      expected = sequence.pad_sequences(a, **kwargs)
+      for inputs, flat_kwargs in flat_inputs:
+        b = sequence.pad_sequences(inputs, **kwargs, **flat_kwargs)
+        self.assertAllEqual(b, expected)
+        self.assertEqual(b.dtype, expected.dtype)
+
+    b = sequence.pad_sequences(np.array([[1, 2, 3], [4, 5, 6]]), maxlen=2)
+    self.assertAllEqual(b, [[2, 3], [5, 6]])
+
+    b = sequence.pad_sequences(
+        np.array([[1, 1], [2, 1], [2, 2]]), row_splits=[0, 1, 3],
+        padding='post')
+    self.assertAllEqual(b, [[[1, 1], [0, 0]], [[2, 1], [2, 2]]])
+
+    with self.assertRaisesRegex(ValueError, '`row_splits` must be'):
+      sequence.pad_sequences([1, 2, 3], row_splits=[0, 2])
+    with self.assertRaisesRegex(ValueError, 'Padding type "mid"'):
+      sequence.pad_sequences(flat_inputs[0][0], padding='mid')
+
+  def test_pad_sequences_out(self):
+    out = np.ones((3, 4), dtype='int32')
+    for a in [[[1], [1, 2], [1, 2, 3]], tf.ragged.constant([[1], [2, 3], []])]:
+      b = sequence.pad_sequences(a, out=out)
+      self.assertIs(b, out)
+      self.assertAllEqual(b, sequence.pad_sequences(a, maxlen=4))
+
+    with self.assertRaisesRegex(ValueError, '`out` must be a Numpy array'):
+      sequence.pad_sequences([[1], [1, 2]], out=out)
+    with self.assertRaisesRegex(ValueError, '`out` must be a Numpy array'):
+      sequence.pad_sequences([[1], [1, 2], [3]], dtype='float32', out=out)
+
   def test_make_sampling_table(self):
     a = sequence.make_sampling_table(3)
     self.assertAllClose(
@@ -18,14 +18,23 @@
 # pylint: disable=g-direct-tensorflow-import
 
 import collections
+import functools
 import hashlib
+import itertools
 import json
+import multiprocessing
 import warnings
 
+from keras.preprocessing import sequence
 from keras.preprocessing.text_dataset import text_dataset_from_directory  # pylint: disable=unused-import
 import numpy as np
 from tensorflow.python.util.tf_export import keras_export
 
+try:
+  import scipy.sparse as scipy_sparse  # pylint: disable=g-import-not-at-top
+except ImportError:
+  scipy_sparse = None
+
 
 @keras_export('keras.preprocessing.text.text_to_word_sequence')
 def text_to_word_sequence(input_text,
@@ -215,7 +224,7 @@ class Tokenizer(object):
     self.index_word = {}
     self.analyzer = analyzer
 
-  def fit_on_texts(self, texts):
+  def fit_on_texts(self, texts, workers=1, chunk_size=10000):
     """Updates internal vocabulary based on a list of texts.
 
     In the case where texts contains lists,
@@ -223,34 +232,28 @@ class Tokenizer(object):
 
     Required before using `texts_to_sequences` or `texts_to_matrix`.
 
+    Texts are processed in chunks of `chunk_size` texts. With `workers > 1`,
+    the chunks are tokenized and counted in a pool of `workers` processes,
+    and the per-chunk counts are merged in order, so the resulting vocabulary
+    is identical to the one obtained with `workers=1`. Note that a custom
+    `analyzer` must then be picklable (e.g. not a lambda).
+
     Args:
         texts: can be a list of strings,
             a generator of strings (for memory-efficiency),
             or a list of list of strings.
+        workers: Integer. Number of processes used to count the words.
+        chunk_size: Integer. Number of texts counted at once by each worker.
     """
-    for text in texts:
-      self.document_count += 1
-      if self.char_level or isinstance(text, list):
-        if self.lower:
-          if isinstance(text, list):
-            text = [text_elem.lower() for text_elem in text]
-          else:
-            text = text.lower()
-        seq = text
-      else:
-        if self.analyzer is None:
-          seq = text_to_word_sequence(
-              text, filters=self.filters, lower=self.lower, split=self.split)
-        else:
-          seq = self.analyzer(text)
-      for w in seq:
-        if w in self.word_counts:
-          self.word_counts[w] += 1
-        else:
-          self.word_counts[w] = 1
-      for w in set(seq):
-        # In how many documents each word occurs
-        self.word_docs[w] += 1
+    count_chunk = functools.partial(_count_words, **self._tokenize_kwargs())
+    chunks = _chunks(texts, chunk_size)
+    if workers > 1:
+      with multiprocessing.Pool(workers) as pool:
+        for counts in pool.imap(count_chunk, chunks):
+          self._merge_counts(*counts)
+    else:
+      for chunk in chunks:
+        self._merge_counts(*count_chunk(chunk))
 
     wcounts = list(self.word_counts.items())
     wcounts.sort(key=lambda x: x[1], reverse=True)
@@ -269,6 +272,23 @@ class Tokenizer(object):
     for w, c in list(self.word_docs.items()):
       self.index_docs[self.word_index[w]] = c
 
+  def _tokenize_kwargs(self):
+    return dict(
+        filters=self.filters,
+        lower=self.lower,
+        split=self.split,
+        char_level=self.char_level,
+        analyzer=self.analyzer)
+
+  def _merge_counts(self, document_count, word_counts, word_docs):
+    """Merges the counts of a chunk of texts into the vocabulary tables."""
+    self.document_count += document_count
+    for w, c in word_counts.items():
+      self.word_counts[w] = self.word_counts.get(w, 0) + c
+    for w, c in word_docs.items():
+      # In how many documents each word occurs
+      self.word_docs[w] += c
+
   def fit_on_sequences(self, sequences):
     """Updates internal vocabulary based on a list of sequences.
 
@@ -316,20 +336,9 @@ class Tokenizer(object):
     """
     num_words = self.num_words
     oov_token_index = self.word_index.get(self.oov_token)
+    tokenize_kwargs = self._tokenize_kwargs()
     for text in texts:
-      if self.char_level or isinstance(text, list):
-        if self.lower:
-          if isinstance(text, list):
-            text = [text_elem.lower() for text_elem in text]
-          else:
-            text = text.lower()
-        seq = text
-      else:
-        if self.analyzer is None:
-          seq = text_to_word_sequence(
-              text, filters=self.filters, lower=self.lower, split=self.split)
-        else:
-          seq = self.analyzer(text)
+      seq = _tokenize(text, **tokenize_kwargs)
       vect = []
       for w in seq:
         i = self.word_index.get(w)
@@ -343,6 +352,46 @@ class Tokenizer(object):
           vect.append(oov_token_index)
       yield vect
 
+  def texts_to_padded_sequences(self,
+                                texts,
+                                maxlen=None,
+                                dtype='int32',
+                                padding='pre',
+                                truncating='pre',
+                                value=0.):
+    """Transforms texts to a padded Numpy array of integer sequences.
+
+    This is equivalent to, but faster than,
+    `pad_sequences(tokenizer.texts_to_sequences(texts), ...)`: the encoded
+    words of all texts are gathered in a single flat array, and the padded
+    output is filled with one vectorized scatter.
+
+    Args:
+        texts: A list of texts (strings), or of lists of tokens.
+        maxlen: See `tf.keras.utils.pad_sequences`.
+        dtype: See `tf.keras.utils.pad_sequences`.
+        padding: See `tf.keras.utils.pad_sequences`.
+        truncating: See `tf.keras.utils.pad_sequences`.
+        value: See `tf.keras.utils.pad_sequences`.
+
+    Returns:
+        Numpy array with shape `(len(texts), maxlen)`.
+    """
+    values, lengths = self._encode_flat(texts)
+    return sequence._pad_flat_sequences(  # pylint: disable=protected-access
+        values, lengths, maxlen=maxlen, dtype=dtype, padding=padding,
+        truncating=truncating, value=value)
+
+  def _encode_flat(self, texts):
+    """Returns the concatenated encoded `texts` and the length of each one."""
+    lengths = []
+    values = []
+    for vect in self.texts_to_sequences_generator(texts):
+      lengths.append(len(vect))
+      values.extend(vect)
+    return (np.array(values, dtype=np.int64),
+            np.array(lengths, dtype=np.int64))
+
   def sequences_to_texts(self, sequences):
     """Transforms each sequence into a list of text.
 
@@ -389,34 +438,47 @@ class Tokenizer(object):
       vect = ' '.join(vect)
       yield vect
 
-  def texts_to_matrix(self, texts, mode='binary'):
+  def texts_to_matrix(self, texts, mode='binary', sparse=False):
     """Convert a list of texts to a Numpy matrix.
 
     Args:
         texts: list of strings.
         mode: one of "binary", "count", "tfidf", "freq".
+        sparse: boolean. Whether to return a `scipy.sparse.csr_matrix`
+            instead of a dense Numpy matrix.
 
     Returns:
-        A Numpy matrix.
+        A Numpy matrix, or a `scipy.sparse.csr_matrix` if `sparse=True`.
     """
-    sequences = self.texts_to_sequences(texts)
-    return self.sequences_to_matrix(sequences, mode=mode)
+    values, lengths = self._encode_flat(texts)
+    return self._flat_sequences_to_matrix(values, lengths, mode, sparse)
 
-  def sequences_to_matrix(self, sequences, mode='binary'):
+  def sequences_to_matrix(self, sequences, mode='binary', sparse=False):
     """Converts a list of sequences into a Numpy matrix.
 
     Args:
         sequences: list of sequences
             (a sequence is a list of integer word indices).
         mode: one of "binary", "count", "tfidf", "freq"
+        sparse: boolean. Whether to return a `scipy.sparse.csr_matrix`
+            instead of a dense Numpy matrix.
 
     Returns:
-        A Numpy matrix.
+        A Numpy matrix, or a `scipy.sparse.csr_matrix` if `sparse=True`.
 
     Raises:
         ValueError: In case of invalid `mode` argument,
             or if the Tokenizer requires to be fit to sample data.
     """
+    lengths = np.array([len(seq) for seq in sequences], dtype=np.int64)
+    values = np.fromiter(
+        itertools.chain.from_iterable(sequences),
+        dtype=np.int64,
+        count=int(lengths.sum()))
+    return self._flat_sequences_to_matrix(values, lengths, mode, sparse)
+
+  def _flat_sequences_to_matrix(self, values, lengths, mode, sparse):
+    """Vectorized `sequences_to_matrix` on concatenated sequences."""
     if not self.num_words:
       if self.word_index:
         num_words = len(self.word_index) + 1
@@ -430,31 +492,37 @@ class Tokenizer(object):
       raise ValueError('Fit the Tokenizer on some data '
                        'before using tfidf mode.')
 
-    x = np.zeros((len(sequences), num_words))
-    for i, seq in enumerate(sequences):
-      if not seq:
-        continue
-      counts = collections.defaultdict(int)
-      for j in seq:
-        if j >= num_words:
-          continue
-        counts[j] += 1
-      for j, c in list(counts.items()):
-        if mode == 'count':
-          x[i][j] = c
-        elif mode == 'freq':
-          x[i][j] = c / len(seq)
-        elif mode == 'binary':
-          x[i][j] = 1
-        elif mode == 'tfidf':
-          # Use weighting scheme 2 in
-          # https://en.wikipedia.org/wiki/Tf%E2%80%93idf
-          tf = 1 + np.log(c)
-          idf = np.log(1 + self.document_count /
-                       (1 + self.index_docs.get(j, 0)))
-          x[i][j] = tf * idf
-        else:
-          raise ValueError('Unknown vectorization mode:', mode)
+    if mode not in ('count', 'freq', 'binary', 'tfidf'):
+      raise ValueError('Unknown vectorization mode:', mode)
+    if sparse and scipy_sparse is None:
+      raise ImportError('`sparse=True` requires scipy.')
+
+    # Count each distinct (sequence, word index) pair at once.
+    rows = np.repeat(np.arange(len(lengths)), lengths)
+    in_vocabulary = values < num_words
+    keys = rows[in_vocabulary] * num_words + values[in_vocabulary]
+    keys, counts = np.unique(keys, return_counts=True)
+    rows, cols = np.divmod(keys, num_words)
+
+    if mode == 'count':
+      data = counts.astype('float64')
+    elif mode == 'freq':
+      data = counts / lengths[rows]
+    elif mode == 'binary':
+      data = np.ones(len(counts))
+    else:
+      # Use weighting scheme 2 in
+      # https://en.wikipedia.org/wiki/Tf%E2%80%93idf
+      tf = 1 + np.log(counts)
+      index_docs = np.array([self.index_docs.get(j, 0) for j in cols])
+      idf = np.log(1 + self.document_count / (1 + index_docs))
+      data = tf * idf
+
+    shape = (len(lengths), num_words)
+    if sparse:
+      return scipy_sparse.csr_matrix((data, (rows, cols)), shape=shape)
+    x = np.zeros(shape)
+    x[rows, cols] = data
     return x
 
   def get_config(self):
@@ -506,6 +574,53 @@ class Tokenizer(object):
     return json.dumps(tokenizer_config, **kwargs)
 
 
+def _tokenize(text, filters, lower, split, char_level, analyzer):
+  """Splits a text (or list of tokens) as configured in a `Tokenizer`."""
+  if char_level or isinstance(text, list):
+    if lower:
+      if isinstance(text, list):
+        text = [text_elem.lower() for text_elem in text]
+      else:
+        text = text.lower()
+    return text
+  if analyzer is None:
+    return text_to_word_sequence(
+        text, filters=filters, lower=lower, split=split)
+  return analyzer(text)
+
+
+def _count_words(texts, **tokenize_kwargs):
+  """Counts words in `texts`, for `Tokenizer.fit_on_texts`.
+
+  This function is run in worker processes, so it must remain a picklable,
+  module level function.
+
+  Args:
+      texts: A list of texts.
+      **tokenize_kwargs: Keyword arguments passed to `_tokenize`.
+
+  Returns:
+      A tuple `(document_count, word_counts, word_docs)`. `word_counts` is
+      ordered by first occurrence of each word in `texts`.
+  """
+  word_counts = collections.Counter()
+  word_docs = collections.Counter()
+  for text in texts:
+    seq = _tokenize(text, **tokenize_kwargs)
+    word_counts.update(seq)
+    word_docs.update(set(seq))
+  return len(texts), word_counts, word_docs
+
+
+def _chunks(iterable, chunk_size):
+  """Yields successive lists of `chunk_size` elements of `iterable`."""
+  iterator = iter(iterable)
+  chunk = list(itertools.islice(iterator, chunk_size))
+  while chunk:
+    yield chunk
+    chunk = list(itertools.islice(iterator, chunk_size))
+
+
 @keras_export('keras.preprocessing.text.tokenizer_from_json')
 def tokenizer_from_json(json_string):
   """Parses a JSON tokenizer configuration and returns a tokenizer instance.
@@ -34,7 +34,8 @@ def text_dataset_from_directory(directory,
                                 seed=None,
                                 validation_split=None,
                                 subset=None,
-                                follow_links=False):
+                                follow_links=False,
+                                index_cache_path=None):
   """Generates a `tf.data.Dataset` from text files in a directory.
 
   If your directory structure is:
@@ -97,6 +98,9 @@ def text_dataset_from_directory(directory,
         Only used if `validation_split` is set.
     follow_links: Whether to visits subdirectories pointed to by symlinks.
         Defaults to False.
+    index_cache_path: Optional path of a file in which to cache the listing
+        of `directory` across runs. Subdirectories whose modification time
+        has not changed are not listed again. Defaults to None.
 
   Returns:
     A `tf.data.Dataset` object.
@@ -147,7 +151,8 @@ def text_dataset_from_directory(directory,
       class_names=class_names,
       shuffle=shuffle,
       seed=seed,
-      follow_links=follow_links)
+      follow_links=follow_links,
+      index_cache_path=index_cache_path)
 
   if label_mode == 'binary' and len(class_names) != 2:
     raise ValueError(
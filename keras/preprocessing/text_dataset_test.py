@@ -20,6 +20,7 @@ import os
 import random
 import shutil
 import string
+import time
 from keras.testing_infra import test_combinations
 from keras.testing_infra import test_utils
 from keras.preprocessing import text_dataset
@@ -195,6 +196,40 @@ class TextDatasetFromDirectoryTest(test_combinations.TestCase):
       sample_count += batch.shape[0]
     self.assertEqual(sample_count, 25)
 
+  def test_text_dataset_from_directory_index_cache(self):
+    directory = self._prepare_directory(num_classes=2, count=25,
+                                        nested_dirs=True)
+    index_cache_path = os.path.join(self.get_temp_dir(), 'index_cache.json')
+    self.addCleanup(os.remove, index_cache_path)
+    # Directories modified in the last seconds are not cached.
+    old_time = time.time() - 60
+    for root, _, _ in os.walk(directory):
+      os.utime(root, (old_time, old_time))
+
+    def sample_count():
+      dataset = text_dataset.text_dataset_from_directory(
+          directory, batch_size=8, label_mode=None,
+          index_cache_path=index_cache_path)
+      return sum(batch.shape[0] for batch in dataset)
+
+    self.assertEqual(sample_count(), 25)
+    self.assertTrue(os.path.exists(index_cache_path))
+    self.assertEqual(sample_count(), 25)
+
+    # Modified directories are listed again.
+    subdirectory = os.path.join(directory, 'class_0', 'subfolder_1')
+    with open(os.path.join(subdirectory, 'text_new.txt'), 'w') as f:
+      f.write('new')
+    self.assertEqual(sample_count(), 26)
+
+    # The cached listing is used as long as the directory mtime is unchanged.
+    os.utime(subdirectory, (old_time, old_time))
+    self.assertEqual(sample_count(), 26)
+    with open(os.path.join(subdirectory, 'text_new_2.txt'), 'w') as f:
+      f.write('new')
+    os.utime(subdirectory, (old_time, old_time))
+    self.assertEqual(sample_count(), 26)
+
   def test_text_dataset_from_directory_no_files(self):
     directory = self._prepare_directory(num_classes=2, count=0)
     with self.assertRaisesRegex(ValueError, 'No text files found'):
@@ -17,6 +17,7 @@
 
 import collections
 
+from keras.preprocessing import sequence
 from keras.preprocessing import text
 import numpy as np
 import tensorflow.compat.v2 as tf
@@ -132,6 +133,65 @@ class TestText(tf.test.TestCase):
     tokenizer.texts_to_matrix(texts)
     tokenizer.texts_to_matrix(word_sequences)
 
+  def test_fit_on_texts_workers(self):
+    texts = [
+        'The cat sat on the mat.', 'The dog sat on the log.',
+        'Dogs and cats living together.', 'A cat and a dog.'
+    ] * 5
+    tokenizer = text.Tokenizer()
+    tokenizer.fit_on_texts(texts)
+    sharded_tokenizer = text.Tokenizer()
+    sharded_tokenizer.fit_on_texts(iter(texts), workers=2, chunk_size=3)
+
+    self.assertEqual(tokenizer.document_count, sharded_tokenizer.document_count)
+    self.assertEqual(list(tokenizer.word_counts.items()),
+                     list(sharded_tokenizer.word_counts.items()))
+    self.assertEqual(tokenizer.word_docs, sharded_tokenizer.word_docs)
+    self.assertEqual(tokenizer.word_index, sharded_tokenizer.word_index)
+    self.assertEqual(tokenizer.index_docs, sharded_tokenizer.index_docs)
+
+  def test_texts_to_padded_sequences(self):
+    texts = ['The cat sat on the mat.', '', 'The dog sat on the log, again.']
+    tokenizer = text.Tokenizer(num_words=6, oov_token='<unk>')
+    tokenizer.fit_on_texts(texts)
+    sequences = tokenizer.texts_to_sequences(texts)
+
+    for kwargs in [{}, {'maxlen': 4}, {'maxlen': 10, 'padding': 'post'},
+                   {'maxlen': 3, 'truncating': 'post', 'value': -1}]:
+      self.assertAllEqual(
+          tokenizer.texts_to_padded_sequences(texts, **kwargs),
+          sequence.pad_sequences(sequences, **kwargs))
+
+  def test_texts_to_matrix_matches_sequences_to_matrix(self):
+    texts = ['The cat sat on the mat.', '', 'The dog sat on the log.']
+    tokenizer = text.Tokenizer(num_words=5)
+    tokenizer.fit_on_texts(texts)
+    sequences = tokenizer.texts_to_sequences(texts)
+
+    for mode in ['binary', 'count', 'tfidf', 'freq']:
+      matrix = tokenizer.texts_to_matrix(texts, mode)
+      expected = np.zeros((len(sequences), 5))
+      for i, seq in enumerate(sequences):
+        for j in set(seq):
+          c = seq.count(j)
+          if mode == 'count':
+            expected[i, j] = c
+          elif mode == 'freq':
+            expected[i, j] = c / len(seq)
+          elif mode == 'binary':
+            expected[i, j] = 1
+          else:
+            expected[i, j] = (1 + np.log(c)) * np.log(
+                1 + tokenizer.document_count /
+                (1 + tokenizer.index_docs.get(j, 0)))
+      self.assertAllClose(matrix, expected)
+      self.assertAllClose(
+          tokenizer.texts_to_matrix(texts, mode, sparse=True).toarray(),
+          expected)
+
+    with self.assertRaisesRegex(ValueError, 'Unknown vectorization mode'):
+      tokenizer.sequences_to_matrix(sequences, mode='invalid')
+
   def test_text_to_word_sequence(self):
     sample_text = 'hello! ? world!'
     self.assertEqual(
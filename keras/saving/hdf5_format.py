@@ -17,6 +17,10 @@
 
 import tensorflow.compat.v2 as tf
 
+import collections
+import concurrent.futures
+import heapq
+import itertools
 import json
 import os
 
@@ -41,6 +45,13 @@ except ImportError:
   h5py = None
 # pylint: enable=g-import-not-at-top
 
+# Number of threads reading layer weights ahead of the layer being assigned
+# when loading weights. At most twice as many layers are held in memory.
+_LOAD_NUM_THREADS = 4
+
+# Number of threads writing weight shards when saving sharded weights.
+_SAVE_NUM_THREADS = 4
+
 # TODO(b/134426265): Switch back to single-quotes to match the rest of the file
 # once the issue with copybara is fixed.
 # pylint:disable=g-inconsistent-quotes
@@ -626,47 +637,159 @@ def load_optimizer_weights_from_hdf5_group(hdf5_group):
   return [weights_group[weight_name] for weight_name in optimizer_weight_names]
 
 
-def save_subset_weights_to_hdf5_group(f, weights):
+def _create_weight_dataset(f, name, val, chunks=None, compression=None):
+  """Creates a dataset named `name` in the HDF5 group `f` holding `val`."""
+  if not val.shape:
+    # scalar
+    param_dset = f.create_dataset(name, val.shape, dtype=val.dtype)
+    param_dset[()] = val
+  elif not val.size:
+    # Empty datasets can be neither chunked nor compressed.
+    f.create_dataset(name, val.shape, dtype=val.dtype)
+  else:
+    param_dset = f.create_dataset(
+        name, val.shape, dtype=val.dtype, chunks=chunks,
+        compression=compression)
+    param_dset[:] = val
+
+
+def save_subset_weights_to_hdf5_group(f, weights, chunks=None,
+                                      compression=None):
   """Save top-level weights of a model to a HDF5 group.
 
   Args:
       f: HDF5 group.
       weights: List of weight variables.
+      chunks: Optional chunk shape of the datasets, or `True` to let h5py
+          pick one. Defaults to contiguous storage.
+      compression: Optional name of the h5py compression filter used for the
+          datasets, e.g. `'gzip'` or `'lzf'`.
   """
   weight_values = backend.batch_get_value(weights)
   weight_names = [w.name.encode('utf8') for w in weights]
   save_attributes_to_hdf5_group(f, 'weight_names', weight_names)
   for name, val in zip(weight_names, weight_values):
-    param_dset = f.create_dataset(name, val.shape, dtype=val.dtype)
-    if not val.shape:
-      # scalar
-      param_dset[()] = val
-    else:
-      param_dset[:] = val
-
+    _create_weight_dataset(f, name, val, chunks, compression)
 
-def save_weights_to_hdf5_group(f, model):
-  """Saves the weights of a list of layers to a HDF5 group.
 
-  Args:
-      f: HDF5 group.
-      model: Model instance.
-  """
+def _save_model_attributes_to_hdf5_group(f, model):
   from keras import __version__ as keras_version  # pylint: disable=g-import-not-at-top
   save_attributes_to_hdf5_group(
       f, 'layer_names', [layer.name.encode('utf8') for layer in model.layers])
   f.attrs['backend'] = backend.backend().encode('utf8')
   f.attrs['keras_version'] = str(keras_version).encode('utf8')
 
+
+def _weight_groups(model):
+  """Returns the `(group name, weights)` pairs saved for `model`."""
   # Sort model layers by layer name to ensure that group names are strictly
   # growing to avoid prefix issues.
-  for layer in sorted(model.layers, key=lambda x: x.name):
-    g = f.create_group(layer.name)
-    weights = _legacy_weights(layer)
-    save_subset_weights_to_hdf5_group(g, weights)
-  weights = model._trainable_weights + model._non_trainable_weights
-  g = f.create_group('top_level_model_weights')
-  save_subset_weights_to_hdf5_group(g, weights)
+  groups = [(layer.name, _legacy_weights(layer))
+            for layer in sorted(model.layers, key=lambda x: x.name)]
+  groups.append(('top_level_model_weights',
+                 model._trainable_weights + model._non_trainable_weights))
+  return groups
+
+
+def save_weights_to_hdf5_group(f, model, chunks=None, compression=None):
+  """Saves the weights of a list of layers to a HDF5 group.
+
+  Args:
+      f: HDF5 group.
+      model: Model instance.
+      chunks: Optional chunk shape of the datasets, or `True` to let h5py
+          pick one. Defaults to contiguous storage.
+      compression: Optional name of the h5py compression filter used for the
+          datasets, e.g. `'gzip'` or `'lzf'`.
+  """
+  _save_model_attributes_to_hdf5_group(f, model)
+  for group_name, weights in _weight_groups(model):
+    g = f.create_group(group_name)
+    save_subset_weights_to_hdf5_group(
+        g, weights, chunks=chunks, compression=compression)
+
+
+def save_weights_to_sharded_hdf5(filepath, model, num_shards, chunks=None,
+                                 compression=None):
+  """Saves the weights of a model across several HDF5 files.
+
+  The weight values are spread over `num_shards` files named
+  `<root>-<index>-of-<num_shards><ext>` next to `filepath`, balancing their
+  size, and the shards are written concurrently. The index file written at
+  `filepath` has the layout of `save_weights_to_hdf5_group`, except that every
+  weight is an external link to its dataset in a shard. It can therefore be
+  loaded by `load_weights_from_hdf5_group` and
+  `load_weights_from_hdf5_group_by_name` like any other weights file, as long
+  as the shards are kept in the same directory.
+
+  Args:
+      filepath: Path of the index file.
+      model: Model instance.
+      num_shards: Number of files to spread the weight values over.
+      chunks: Optional chunk shape of the datasets, or `True` to let h5py
+          pick one. Defaults to contiguous storage.
+      compression: Optional name of the h5py compression filter used for the
+          datasets, e.g. `'gzip'` or `'lzf'`.
+
+  Raises:
+      ValueError: if `num_shards` is not a positive integer.
+  """
+  if not isinstance(num_shards, int) or num_shards < 1:
+    raise ValueError('`num_shards` must be a positive integer. '
+                     f'Received: num_shards={num_shards}')
+  root, ext = os.path.splitext(filepath)
+  shard_paths = [f'{root}-{i:05d}-of-{num_shards:05d}{ext}'
+                 for i in range(num_shards)]
+  groups = _weight_groups(model)
+
+  # Assign the largest weights first, each to the smallest shard so far.
+  entries = [(group_name, weight) for group_name, weights in groups
+             for weight in weights]
+  entries.sort(key=lambda entry: -_weight_size_in_bytes(entry[1]))
+  shard_entries = [[] for _ in range(num_shards)]
+  shard_sizes = [(0, i) for i in range(num_shards)]
+  shard_of = {}
+  for group_name, weight in entries:
+    size, i = heapq.heappop(shard_sizes)
+    shard_entries[i].append((group_name, weight))
+    shard_of[(group_name, weight.name)] = i
+    heapq.heappush(shard_sizes, (size + _weight_size_in_bytes(weight), i))
+
+  def write_shard(shard_path, entries, values):
+    with h5py.File(shard_path, 'w') as shard:
+      for (group_name, weight), val in zip(entries, values):
+        _create_weight_dataset(
+            shard, f'{group_name}/{weight.name}', val, chunks, compression)
+
+  # Variable values are read on this thread while earlier shards are being
+  # written, holding at most `_SAVE_NUM_THREADS` shards in memory.
+  with concurrent.futures.ThreadPoolExecutor(_SAVE_NUM_THREADS) as executor:
+    pending = collections.deque()
+    for shard_path, entries in zip(shard_paths, shard_entries):
+      if len(pending) == _SAVE_NUM_THREADS:
+        pending.popleft().result()
+      values = backend.batch_get_value([weight for _, weight in entries])
+      pending.append(
+          executor.submit(write_shard, shard_path, entries, values))
+    for future in pending:
+      future.result()
+
+  # The index is written last, so that it never refers to missing shards.
+  with h5py.File(filepath, 'w') as f:
+    _save_model_attributes_to_hdf5_group(f, model)
+    f.attrs['num_shards'] = num_shards
+    for group_name, weights in groups:
+      g = f.create_group(group_name)
+      save_attributes_to_hdf5_group(
+          g, 'weight_names', [w.name.encode('utf8') for w in weights])
+      for weight in weights:
+        shard_path = shard_paths[shard_of[(group_name, weight.name)]]
+        g[weight.name] = h5py.ExternalLink(
+            os.path.basename(shard_path), f'/{group_name}/{weight.name}')
+
+
+def _weight_size_in_bytes(weight):
+  return (weight.shape.num_elements() or 0) * weight.dtype.size
 
 
 def load_subset_weights_from_hdf5_group(f):
@@ -683,12 +806,69 @@ def load_subset_weights_from_hdf5_group(f):
           and weights file.
   """
   weight_names = load_attributes_from_hdf5_group(f, 'weight_names')
-  return [np.asarray(f[weight_name]) for weight_name in weight_names]
+  return [_read_dataset(f[weight_name]) for weight_name in weight_names]
+
+
+def _read_dataset(dataset):
+  """Reads a dataset, memory-mapping it when it is stored contiguously.
+
+  Uncompressed, contiguous datasets of a read-only file on local disk are
+  mapped rather than read, so their pages are only loaded when the values are
+  assigned and can be reclaimed afterwards.
+
+  Args:
+      dataset: A `h5py.Dataset`.
+
+  Returns:
+      A NumPy array (or `np.memmap`) of the dataset values.
+  """
+  # Files open for writing may hold values that have not been flushed yet.
+  if (dataset.file.driver == 'sec2' and dataset.file.mode == 'r' and
+      dataset.chunks is None and dataset.compression is None and
+      dataset.shape and dataset.size and dataset.dtype.kind in 'biufc'):
+    offset = dataset.id.get_offset()
+    if offset is not None:
+      return np.memmap(
+          dataset.file.filename,
+          dtype=dataset.dtype,
+          mode='r',
+          offset=offset,
+          shape=dataset.shape)
+  return np.asarray(dataset)
+
+
+def _read_ahead(read_fn, items):
+  """Yields `read_fn(item)` for `items` in order, reading ahead in threads.
+
+  At most `2 * _LOAD_NUM_THREADS` results are read and not yet consumed at
+  any time, which bounds the memory held by the reader.
+
+  Args:
+      read_fn: Function reading the weights of one item.
+      items: Iterable of items to read.
+
+  Yields:
+      The result of `read_fn` for each item, in the order of `items`.
+  """
+  items = iter(items)
+  with concurrent.futures.ThreadPoolExecutor(_LOAD_NUM_THREADS) as executor:
+    pending = collections.deque(
+        executor.submit(read_fn, item)
+        for item in itertools.islice(items, 2 * _LOAD_NUM_THREADS))
+    while pending:
+      result = pending.popleft().result()
+      for item in itertools.islice(items, 1):
+        pending.append(executor.submit(read_fn, item))
+      yield result
 
 
 def load_weights_from_hdf5_group(f, model):
   """Implements topological (order-based) weight loading.
 
+  Layer weights are read in background threads and assigned as they arrive,
+  so that only a few layers are held in host memory at a time. If loading
+  fails, the layers preceding the failing one keep their loaded weights.
+
   Args:
       f: A pointer to a HDF5 group.
       model: Model instance.
@@ -730,14 +910,16 @@ def load_weights_from_hdf5_group(f, model):
         f'Model expected {len(filtered_layers)} layers, found '
         f'{len(layer_names)} saved layers.')
 
-  # We batch weight value assignments in a single backend call
-  # which provides a speedup in TensorFlow.
-  weight_value_tuples = []
-  for k, name in enumerate(layer_names):
-    g = f[name]
+  def read_layer_weights(name):
+    return load_subset_weights_from_hdf5_group(f[name])
+
+  # Each layer's weights are assigned in a single backend call, which
+  # provides a speedup in TensorFlow.
+  for k, weight_values in enumerate(
+      _read_ahead(read_layer_weights, layer_names)):
+    name = layer_names[k]
     layer = filtered_layers[k]
     symbolic_weights = _legacy_weights(layer)
-    weight_values = load_subset_weights_from_hdf5_group(g)
     weight_values = preprocess_weights_for_loading(layer, weight_values,
                                                    original_keras_version,
                                                    original_backend)
@@ -747,7 +929,7 @@ def load_weights_from_hdf5_group(f, model):
           f'current model, {name} in the save file). '
           f'Layer expects {len(symbolic_weights)} weight(s). Received '
           f'{len(weight_values)} saved weight(s)')
-    weight_value_tuples += zip(symbolic_weights, weight_values)
+    backend.batch_set_value(list(zip(symbolic_weights, weight_values)))
 
   if 'top_level_model_weights' in f:
     symbolic_weights = model._trainable_weights + model._non_trainable_weights
@@ -759,8 +941,7 @@ def load_weights_from_hdf5_group(f, model):
           f'from file. '
           f'Model expects {len(symbolic_weights)} top-level weight(s). '
           f'Received {len(weight_values)} saved top-level weight(s)')
-    weight_value_tuples += zip(symbolic_weights, weight_values)
-  backend.batch_set_value(weight_value_tuples)
+    backend.batch_set_value(list(zip(symbolic_weights, weight_values)))
 
   # Perform any layer defined finalization of the layer state.
   for layer in model._flatten_layers():
@@ -770,7 +951,9 @@ def load_weights_from_hdf5_group(f, model):
 def load_weights_from_hdf5_group_by_name(f, model, skip_mismatch=False):
   """Implements name-based weight loading (instead of topological loading).
 
-  Layers that have no matching name are skipped.
+  Layers that have no matching name are skipped. As with
+  `load_weights_from_hdf5_group`, layer weights are read in background threads
+  and assigned as they arrive.
 
   Args:
       f: A pointer to a HDF5 group.
@@ -805,13 +988,20 @@ def load_weights_from_hdf5_group_by_name(f, model, skip_mismatch=False):
     if layer.name:
       index.setdefault(layer.name, []).append(layer)
 
-  # We batch weight value assignments in a single backend call
-  # which provides a speedup in TensorFlow.
-  weight_value_tuples = []
-  for k, name in enumerate(layer_names):
-    g = f[name]
-    weight_values = load_subset_weights_from_hdf5_group(g)
-    for layer in index.get(name, []):
+  def read_layer_weights(item):
+    _, name = item
+    return load_subset_weights_from_hdf5_group(f[name])
+
+  # Only the saved layers matching a layer of the model are read.
+  matched_layer_names = [(k, name) for k, name in enumerate(layer_names)
+                         if name in index]
+  for (k, name), weight_values in zip(
+      matched_layer_names,
+      _read_ahead(read_layer_weights, matched_layer_names)):
+    # The weights of all layers sharing this name are assigned in a single
+    # backend call, which provides a speedup in TensorFlow.
+    weight_value_tuples = []
+    for layer in index[name]:
       symbolic_weights = _legacy_weights(layer)
       weight_values = preprocess_weights_for_loading(
           layer, weight_values, original_keras_version, original_backend)
@@ -847,11 +1037,13 @@ def load_weights_from_hdf5_group_by_name(f, model, skip_mismatch=False):
               f'with shape {received_shape}')
         else:
           weight_value_tuples.append((symbolic_weights[i], weight_values[i]))
+    backend.batch_set_value(weight_value_tuples)
 
   if 'top_level_model_weights' in f:
     symbolic_weights = model._trainable_weights + model._non_trainable_weights
     weight_values = load_subset_weights_from_hdf5_group(
         f['top_level_model_weights'])
+    weight_value_tuples = []
 
     if len(weight_values) != len(symbolic_weights):
       if skip_mismatch:
@@ -884,8 +1076,7 @@ def load_weights_from_hdf5_group_by_name(f, model, skip_mismatch=False):
                 f'with shape {received_shape}')
         else:
           weight_value_tuples.append((symbolic_weights[i], weight_values[i]))
-
-  backend.batch_set_value(weight_value_tuples)
+    backend.batch_set_value(weight_value_tuples)
 
   # Perform any layer defined finalization of the layer state.
   for layer in model._flatten_layers():
@@ -346,6 +346,99 @@ class TestWeightSavingAndLoading(tf.test.TestCase, parameterized.TestCase):
       self.assertAllClose([3.5] * num_classes,
                           keras.backend.get_value(model.layers[1].bias))
 
+  def test_read_dataset_memory_maps_contiguous_datasets(self):
+    if h5py is None:
+      return
+
+    h5_path = self._save_model_dir('test.h5')
+    values = np.random.random((4, 3)).astype('float32')
+    with h5py.File(h5_path, 'w') as f:
+      f.create_dataset('contiguous', data=values)
+      f.create_dataset('compressed', data=values, compression='gzip')
+      f.create_dataset('scalar', data=1.5)
+
+    with h5py.File(h5_path, 'r') as f:
+      contiguous = hdf5_format._read_dataset(f['contiguous'])
+      compressed = hdf5_format._read_dataset(f['compressed'])
+      scalar = hdf5_format._read_dataset(f['scalar'])
+    self.assertIsInstance(contiguous, np.memmap)
+    self.assertNotIsInstance(compressed, np.memmap)
+    self.assertNotIsInstance(scalar, np.memmap)
+    self.assertAllEqual(values, contiguous)
+    self.assertAllEqual(values, compressed)
+    self.assertEqual(1.5, scalar)
+
+    # Values of files open for writing are read through h5py.
+    with h5py.File(h5_path, 'r+') as f:
+      self.assertNotIsInstance(
+          hdf5_format._read_dataset(f['contiguous']), np.memmap)
+
+  @parameterized.named_parameters(('topological', False), ('by_name', True))
+  def test_weight_loading_reads_ahead(self, by_name):
+    if h5py is None:
+      return
+
+    h5_path = self._save_model_dir('test.h5')
+
+    def make_model():
+      return keras.models.Sequential(
+          [keras.layers.Dense(4, input_dim=3, name='d0')] +
+          [keras.layers.Dense(4, name='d%d' % i) for i in range(1, 8)])
+
+    ref_model = make_model()
+    ref_model.save_weights(h5_path)
+    model = make_model()
+    # Read fewer layers ahead than the model has.
+    with tf.compat.v1.test.mock.patch.object(
+        hdf5_format, '_LOAD_NUM_THREADS', 2):
+      model.load_weights(h5_path, by_name=by_name)
+    self.assertAllClose(ref_model.get_weights(), model.get_weights())
+
+  @parameterized.named_parameters(
+      ('topological', False, None),
+      ('by_name', True, None),
+      ('compressed', False, 'gzip'))
+  def test_sharded_weight_saving_and_loading(self, by_name, compression):
+    if h5py is None:
+      return
+
+    h5_path = self._save_model_dir('weights.h5')
+
+    def make_model():
+      inputs = keras.layers.Input(shape=(3,))
+      x = keras.layers.Embedding(100, 8, name='embedding')(inputs)
+      x = keras.layers.Flatten()(x)
+      x = keras.layers.Dense(4, name='d1')(x)
+      outputs = keras.layers.Dense(2, name='d2')(x)
+      return keras.models.Model(inputs, outputs)
+
+    ref_model = make_model()
+    ref_model.save_weights(h5_path, num_shards=3, compression=compression)
+    shard_paths = [
+        self._save_model_dir('weights-%05d-of-00003.h5' % i) for i in range(3)
+    ]
+    for shard_path in shard_paths:
+      self.assertTrue(os.path.exists(shard_path))
+    # The embedding table is the largest weight, so it gets a shard of its own.
+    with h5py.File(shard_paths[0], 'r') as f:
+      self.assertEqual(['embedding'], list(f.keys()))
+      if compression:
+        self.assertEqual(
+            compression, f['embedding/embedding/embeddings:0'].compression)
+
+    model = make_model()
+    model.load_weights(h5_path, by_name=by_name)
+    self.assertAllClose(ref_model.get_weights(), model.get_weights())
+
+  def test_sharded_weight_saving_invalid_arguments(self):
+    model = keras.models.Sequential([keras.layers.Dense(2, input_dim=3)])
+    with self.assertRaisesRegex(ValueError, 'only supported when saving'):
+      model.save_weights(self._save_model_dir('weights'), num_shards=2)
+    if h5py is None:
+      return
+    with self.assertRaisesRegex(ValueError, 'must be a positive integer'):
+      model.save_weights(self._save_model_dir('weights.h5'), num_shards=0)
+
   @test_combinations.run_with_all_saved_model_formats(
       exclude_formats=['tf_no_traces'])
   @test_combinations.run_with_all_model_types
@@ -44,6 +44,11 @@ from keras.utils.generic_utils import Progbar
 from keras.utils import io_utils
 from tensorflow.python.util.tf_export import keras_export
 
+try:
+  from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+  shared_memory = None
+
 # Required to support google internal urlretrieve
 if True:  # This gets transformed to `if sys.version_info[0] == 2:` in OSS.  # pylint: disable=using-constant-test
 
@@ -492,6 +497,48 @@ class Sequence:
       yield item
 
 
+@keras_export('keras.utils.experimental.GeneratorFactory', v1=[])
+class GeneratorFactory:
+  """Object that creates Python generators of batches upon invoking.
+
+  `tf.keras.utils.experimental.GeneratorFactory` is a supported type for `x`,
+  the input, in `Model.fit`, `Model.evaluate` and `Model.predict`. Unlike a
+  single generator, which produces all the batches on one thread, the factory
+  is called to create `workers` generators, whose batches are interleaved by a
+  `tf.data` pipeline that runs each of them on its own thread.
+
+  ```python
+  def generator_fn(index):
+    # Each generator reads its own files.
+    for path in file_paths[index::4]:
+      x, y = load_batch(path)
+      yield x, y
+
+  model.fit(tf.keras.utils.experimental.GeneratorFactory(generator_fn),
+            workers=4, epochs=1)
+  ```
+
+  The batches of the different generators are interleaved in no particular
+  order.
+
+  Args:
+    generator_fn: A callable that takes the index of the generator to create,
+      in `range(workers)`, and returns a generator (or any iterable) of
+      batches, which have the same format as the ones of the generators
+      supported by `Model.fit`.
+  """
+
+  def __init__(self, generator_fn):
+    if not callable(generator_fn):
+      raise TypeError(
+          '`generator_fn` for `GeneratorFactory` must be a `callable`. '
+          f'Received: {generator_fn}')
+    self.generator_fn = generator_fn
+
+  def __call__(self, index):
+    return iter(self.generator_fn(index))
+
+
 def iter_sequence_infinite(seq):
   """Iterates indefinitely over a Sequence.
 
@@ -571,6 +618,80 @@ def get_index(uid, i):
   return _SHARED_SEQUENCES[uid][i]
 
 
+# Shared memory blocks attached by the current process, by name.
+_SHARED_MEMORY_BLOCKS = {}
+# Alignment, in bytes, of the arrays written to shared memory blocks.
+_SHARED_MEMORY_ALIGNMENT = 64
+
+
+class _SharedArray:
+  """Location of a NumPy array written to a shared memory block."""
+
+  def __init__(self, offset, dtype, shape):
+    self.offset = offset
+    self.dtype = dtype
+    self.shape = shape
+
+
+def _attach_shared_memory(name):
+  """Returns the shared memory block `name`, attaching to it once per process.
+  """
+  block = _SHARED_MEMORY_BLOCKS.get(name)
+  if block is None:
+    block = shared_memory.SharedMemory(name=name)
+    _SHARED_MEMORY_BLOCKS[name] = block
+  return block
+
+
+def _write_to_shared_memory(batch, name):
+  """Writes the NumPy arrays of `batch` to the shared memory block `name`.
+
+  Arrays are replaced by `_SharedArray` placeholders. Other values, and arrays
+  that do not fit in the block, are left in place and pickled as usual.
+
+  Args:
+      batch: A (nested structure of) batch values.
+      name: Name of the shared memory block to write to.
+
+  Returns:
+      `batch` with the arrays written to the block replaced by their location.
+  """
+  block = _attach_shared_memory(name)
+  end = 0
+
+  def write(x):
+    nonlocal end
+    if not isinstance(x, np.ndarray) or x.dtype.hasobject:
+      return x
+    offset = -(-end // _SHARED_MEMORY_ALIGNMENT) * _SHARED_MEMORY_ALIGNMENT
+    if offset + x.nbytes > block.size:
+      return x
+    np.ndarray(x.shape, x.dtype, buffer=block.buf, offset=offset)[...] = x
+    end = offset + x.nbytes
+    return _SharedArray(offset, x.dtype, x.shape)
+
+  return tf.nest.map_structure(write, batch)
+
+
+def get_index_with_stats(uid, i, shared_memory_name=None):
+  """Gets the value at index `i` along with the time spent computing it.
+
+  Args:
+      uid: int, Sequence identifier
+      i: index
+      shared_memory_name: Optional name of a shared memory block to write
+          the NumPy arrays of the value to, see `_write_to_shared_memory`.
+
+  Returns:
+      A tuple `(value, busy_time, shared_memory_name)`.
+  """
+  start_time = time.perf_counter()
+  value = _SHARED_SEQUENCES[uid][i]
+  if shared_memory_name is not None:
+    value = _write_to_shared_memory(value, shared_memory_name)
+  return value, time.perf_counter() - start_time, shared_memory_name
+
+
 @keras_export('keras.utils.SequenceEnqueuer')
 class SequenceEnqueuer:
   """Base class to enqueue inputs.
@@ -704,15 +825,129 @@ class SequenceEnqueuer:
 class OrderedEnqueuer(SequenceEnqueuer):
   """Builds a Enqueuer from a Sequence.
 
+  With `use_multiprocessing=True`, batches are pickled by the worker processes
+  and unpickled by the consumer. Setting `shared_memory_size` instead has the
+  workers write the NumPy arrays of each batch to a ring of shared memory
+  blocks, and `get()` yields views of these blocks. A view is only valid until
+  the next batch is requested: copy it to keep it longer.
+
   Args:
       sequence: A `tf.keras.utils.data_utils.Sequence` object.
       use_multiprocessing: use multiprocessing if True, otherwise threading
       shuffle: whether to shuffle the data at the beginning of each epoch
+      shared_memory_size: Optional size in bytes of each shared memory block,
+          which should fit all the arrays of one batch. Arrays that do not
+          fit are pickled as usual. Only used with `use_multiprocessing=True`.
   """
 
-  def __init__(self, sequence, use_multiprocessing=False, shuffle=False):
+  def __init__(self, sequence, use_multiprocessing=False, shuffle=False,
+               shared_memory_size=None):
     super(OrderedEnqueuer, self).__init__(sequence, use_multiprocessing)
     self.shuffle = shuffle
+    if shared_memory_size is not None:
+      if shared_memory is None:
+        raise ValueError('`shared_memory_size` requires Python 3.8 or later.')
+      if shared_memory_size <= 0:
+        raise ValueError('`shared_memory_size` must be a positive integer. '
+                         f'Received: shared_memory_size={shared_memory_size}')
+    self.shared_memory_size = shared_memory_size
+    self._shared_memory_blocks = {}
+    self._free_shared_memory_blocks = None
+    self._reset_stats()
+
+  def start(self, workers=1, max_queue_size=10):
+    """Starts the handler's workers.
+
+    Args:
+        workers: Number of workers.
+        max_queue_size: queue size
+            (when full, workers could block on `put()`)
+    """
+    self._close_shared_memory()
+    if self.use_multiprocessing and self.shared_memory_size:
+      # One block per queued batch, plus the one held by the consumer.
+      self._free_shared_memory_blocks = queue.Queue()
+      for _ in range(max(max_queue_size, 1) + 1):
+        block = shared_memory.SharedMemory(
+            create=True, size=self.shared_memory_size)
+        self._shared_memory_blocks[block.name] = block
+        self._free_shared_memory_blocks.put(block.name)
+    self._reset_stats()
+    super(OrderedEnqueuer, self).start(workers, max_queue_size)
+
+  def stop(self, timeout=None):
+    """Stops running threads and wait for them to exit, if necessary.
+
+    Should be called by the same thread which called `start()`.
+
+    Args:
+        timeout: maximum time to wait on `thread.join()`
+    """
+    super(OrderedEnqueuer, self).stop(timeout)
+    self._close_shared_memory()
+
+  def get_stats(self):
+    """Returns statistics about the queue and its workers since `start()`.
+
+    Returns:
+        A dict with the following entries:
+        - `batches`: Number of batches returned by `get()`.
+        - `queue_depth`: Number of batches currently ready in the queue.
+        - `mean_queue_depth`: Mean number of batches ready in the queue when
+          `get()` requested a batch. A value close to 0 means that the
+          workers are the bottleneck.
+        - `consumer_wait_time`: Total time, in seconds, `get()` spent waiting
+          for the workers.
+        - `worker_busy_time`: Total time, in seconds, the workers spent
+          producing the batches returned by `get()`.
+        - `worker_idle_fraction`: Fraction of the workers' time since `start()`
+          not spent producing batches.
+    """
+    stats = self._stats
+    elapsed = time.perf_counter() - stats['start_time']
+    batches = stats['batches']
+    capacity = self.workers * elapsed
+    return {
+        'batches': batches,
+        'queue_depth': self._queue_depth(),
+        'mean_queue_depth': (
+            stats['total_queue_depth'] / batches if batches else 0.),
+        'consumer_wait_time': stats['consumer_wait_time'],
+        'worker_busy_time': stats['worker_busy_time'],
+        'worker_idle_fraction': (
+            max(0., 1. - stats['worker_busy_time'] / capacity)
+            if capacity else 0.),
+    }
+
+  def _queue_depth(self):
+    """Returns the number of batches ready in the queue."""
+    if self.queue is None:
+      return 0
+    with self.queue.mutex:
+      return sum(result.ready() for result in self.queue.queue)
+
+  def _reset_stats(self):
+    self._stats = {
+        'start_time': time.perf_counter(),
+        'batches': 0,
+        'total_queue_depth': 0,
+        'consumer_wait_time': 0.,
+        'worker_busy_time': 0.,
+    }
+
+  def _close_shared_memory(self):
+    """Releases the shared memory blocks of this enqueuer."""
+    for name, block in self._shared_memory_blocks.items():
+      attached = _SHARED_MEMORY_BLOCKS.pop(name, None)
+      if attached is not None:  # Attached by a thread pool worker.
+        attached.close()
+      try:
+        block.close()
+      except BufferError:
+        pass  # The consumer still holds views of the last batch.
+      block.unlink()
+    self._shared_memory_blocks = {}
+    self._free_shared_memory_blocks = None
 
   def _get_executor_init(self, workers):
     """Gets the Pool initializer for multiprocessing.
@@ -739,6 +974,16 @@ class OrderedEnqueuer(SequenceEnqueuer):
       if self.queue.unfinished_tasks == 0 or self.stop_signal.is_set():
         return
 
+  def _get_free_shared_memory_block(self):
+    """Waits for a free shared memory block, or returns None on `stop()`."""
+    free_blocks = self._free_shared_memory_blocks
+    while not self.stop_signal.is_set():
+      try:
+        return free_blocks.get(block=True, timeout=0.1)
+      except queue.Empty:
+        pass
+    return None
+
   def _run(self):
     """Submits request to the executor and queue the `Future` objects."""
     sequence = list(range(len(self.sequence)))
@@ -752,8 +997,15 @@ class OrderedEnqueuer(SequenceEnqueuer):
           if self.stop_signal.is_set():
             return
 
+          block_name = None
+          if self._free_shared_memory_blocks is not None:
+            block_name = self._get_free_shared_memory_block()
+            if block_name is None:
+              return
           self.queue.put(
-              executor.apply_async(get_index, (self.uid, i)), block=True)
+              executor.apply_async(get_index_with_stats,
+                                   (self.uid, i, block_name)),
+              block=True)
 
         # Done with the current epoch, waiting for the final batches
         self._wait_queue()
@@ -766,6 +1018,17 @@ class OrderedEnqueuer(SequenceEnqueuer):
       self.sequence.on_epoch_end()
       self._send_sequence()  # Update the pool
 
+  def _read_from_shared_memory(self, batch, name):
+    """Replaces the `_SharedArray` placeholders of `batch` by views."""
+    buffer = self._shared_memory_blocks[name].buf
+
+    def read(x):
+      if isinstance(x, _SharedArray):
+        return np.ndarray(x.shape, x.dtype, buffer=buffer, offset=x.offset)
+      return x
+
+    return tf.nest.map_structure(read, batch)
+
   def get(self):
     """Creates a generator to extract data from the queue.
 
@@ -776,15 +1039,30 @@ class OrderedEnqueuer(SequenceEnqueuer):
         `(inputs, targets)` or
         `(inputs, targets, sample_weights)`.
     """
+    stats = self._stats
+    block_name = None
     while self.is_running():
+      if block_name in self._shared_memory_blocks:
+        # The previous batch is no longer used: recycle its block.
+        self._free_shared_memory_blocks.put(block_name)
+        block_name = None
+      queue_depth = self._queue_depth()
+      wait_start = time.perf_counter()
       try:
-        inputs = self.queue.get(block=True, timeout=5).get()
+        inputs, busy_time, block_name = self.queue.get(
+            block=True, timeout=5).get()
+        stats['consumer_wait_time'] += time.perf_counter() - wait_start
+        stats['worker_busy_time'] += busy_time
         if self.is_running():
           self.queue.task_done()
+        if block_name is not None:
+          inputs = self._read_from_shared_memory(inputs, block_name)
         if inputs is not None:
+          stats['batches'] += 1
+          stats['total_queue_depth'] += queue_depth
           yield inputs
       except queue.Empty:
-        pass
+        stats['consumer_wait_time'] += time.perf_counter() - wait_start
       except Exception as e:  # pylint: disable=broad-except
         self.stop()
         raise e
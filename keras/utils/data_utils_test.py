@@ -233,6 +233,57 @@ class TestEnqueuers(tf.test.TestCase):
     self.assertEqual(acc, list(range(100)))
     enqueuer.stop()
 
+  @data_utils.dont_use_multiprocessing_pool
+  def test_ordered_enqueuer_shared_memory(self):
+    enqueuer = keras.utils.data_utils.OrderedEnqueuer(
+        TestSequence([3, 200, 200, 3]), use_multiprocessing=True,
+        shared_memory_size=3 * 200 * 200 * 3 * 8)
+    enqueuer.start(3, 10)
+    gen_output = enqueuer.get()
+    acc = []
+    for _ in range(200):
+      batch = next(gen_output)
+      self.assertEqual(batch.shape, (3, 200, 200, 3))
+      self.assertEqual(batch.dtype, np.float64)
+      # A view of a shared memory block rather than the worker's array.
+      self.assertFalse(batch.flags.owndata)
+      acc.append(batch[0, 0, 0, 0])
+    self.assertEqual(acc[:100], list(range(100)))
+    self.assertEqual(acc[100:], list([k * 5 for k in range(100)]))
+
+    stats = enqueuer.get_stats()
+    self.assertEqual(stats['batches'], 200)
+    self.assertGreater(stats['worker_busy_time'], 0)
+    self.assertBetween(stats['worker_idle_fraction'], 0, 1)
+    self.assertBetween(stats['mean_queue_depth'], 0, 10)
+    enqueuer.stop()
+
+  @data_utils.dont_use_multiprocessing_pool
+  def test_ordered_enqueuer_shared_memory_structure(self):
+
+    class StructureSequence(keras.utils.data_utils.Sequence):
+
+      def __getitem__(self, item):
+        return ({'a': np.full((2,), item), 'b': np.arange(8.)},
+                np.full((16,), item, dtype=np.int8), 'label')
+
+      def __len__(self):
+        return 10
+
+    # Leaves room for 'a' and 'b' only: the other values are pickled.
+    enqueuer = keras.utils.data_utils.OrderedEnqueuer(
+        StructureSequence(), use_multiprocessing=True,
+        shared_memory_size=128)
+    enqueuer.start(2, 2)
+    gen_output = enqueuer.get()
+    for i in range(10):
+      x, y, label = next(gen_output)
+      self.assertAllEqual(x['a'], [i, i])
+      self.assertAllEqual(x['b'], np.arange(8.))
+      self.assertAllEqual(y, np.full((16,), i, dtype=np.int8))
+      self.assertEqual(label, 'label')
+    enqueuer.stop()
+
   def test_ordered_enqueuer_fail_threads(self):
     enqueuer = keras.utils.data_utils.OrderedEnqueuer(
         FaultSequence(), use_multiprocessing=False)
@@ -312,6 +363,17 @@ class TestEnqueuers(tf.test.TestCase):
     enqueuer.stop()
 
 
+class TestGeneratorFactory(tf.test.TestCase):
+
+  def test_generator_factory(self):
+    factory = data_utils.GeneratorFactory(lambda index: range(index, 3))
+    self.assertEqual(list(factory(1)), [1, 2])
+
+  def test_generator_factory_not_callable(self):
+    with self.assertRaisesRegex(TypeError, 'must be a `callable`'):
+      data_utils.GeneratorFactory(range(3))
+
+
 if __name__ == '__main__':
   # Bazel sets these environment variables to very long paths.
   # Tempfile uses them to create long paths, and in turn multiprocessing
@@ -19,6 +19,7 @@ import tensorflow.compat.v2 as tf
 import binascii
 import codecs
 import importlib
+import json
 import marshal
 import os
 import re
@@ -607,6 +608,28 @@ def class_and_config_for_serialized_keras_object(
   return (cls, cls_config)
 
 
+# Caches whether the `from_config` of a class takes `custom_objects`, since
+# inspecting its signature dominates the cost of deserializing small objects
+# such as layers of large models.
+_FROM_CONFIG_TAKES_CUSTOM_OBJECTS = weakref.WeakKeyDictionary()
+
+
+def _from_config_takes_custom_objects(cls):
+  """Returns whether `cls.from_config` takes a `custom_objects` argument."""
+  try:
+    return _FROM_CONFIG_TAKES_CUSTOM_OBJECTS[cls]
+  except (KeyError, TypeError):
+    pass
+  takes_custom_objects = (
+      'custom_objects' in tf_inspect.getfullargspec(cls.from_config).args)
+  try:
+    _FROM_CONFIG_TAKES_CUSTOM_OBJECTS[cls] = takes_custom_objects
+  except TypeError:
+    # `cls` can't be weakly referenced, e.g. it is not a class.
+    pass
+  return takes_custom_objects
+
+
 @keras_export('keras.utils.deserialize_keras_object')
 def deserialize_keras_object(identifier,
                              module_objects=None,
@@ -672,10 +695,9 @@ def deserialize_keras_object(identifier,
       return shared_object
 
     if hasattr(cls, 'from_config'):
-      arg_spec = tf_inspect.getfullargspec(cls.from_config)
       custom_objects = custom_objects or {}
 
-      if 'custom_objects' in arg_spec.args:
+      if _from_config_takes_custom_objects(cls):
         deserialized_obj = cls.from_config(
             cls_config,
             custom_objects=dict(
@@ -826,8 +848,17 @@ class Progbar:
       stateful_metrics: Iterable of string names of metrics that should *not* be
         averaged over time. Metrics in this list will be displayed as-is. All
         others will be averaged by the progbar before display.
-      interval: Minimum visual progress update interval (in seconds).
+      interval: Minimum visual progress update interval (in seconds). In
+        non-interactive logs, a larger value (e.g. `30`) avoids writing one
+        line per step.
       unit_name: Display name for step counts (usually "step" or "sample").
+      output_format: One of `"text"` or `"json"`. With `"json"`, each update
+        is written as a single JSON object per line (with the keys `step`,
+        `target`, `unit`, `elapsed`, `time_per_unit`, `eta`, `metrics` and
+        `final`), which is easier to consume for log pipelines.
+
+  Raises:
+      ValueError: In case of invalid `output_format`.
   """
 
   def __init__(self,
@@ -836,12 +867,18 @@ class Progbar:
                verbose=1,
                interval=0.05,
                stateful_metrics=None,
-               unit_name='step'):
+               unit_name='step',
+               output_format='text'):
+    if output_format not in ('text', 'json'):
+      raise ValueError(
+          f'Unknown `output_format`: {output_format}. '
+          'Expected values are ["text", "json"]')
     self.target = target
     self.width = width
     self.verbose = verbose
     self.interval = interval
     self.unit_name = unit_name
+    self.output_format = output_format
     if stateful_metrics:
       self.stateful_metrics = set(stateful_metrics)
     else:
@@ -858,6 +895,9 @@ class Progbar:
     # issues found in OrderedDict
     self._values = {}
     self._values_order = []
+    # The last ` - name: value` string of each value, keyed by the value as
+    # it is displayed.
+    self._formatted_values = {}
     self._start = time.time()
     self._last_update = 0
     self._time_at_epoch_start = self._start
@@ -883,7 +923,7 @@ class Progbar:
 
     values = values or []
     for k, v in values:
-      if k not in self._values_order:
+      if k not in self._values:
         self._values_order.append(k)
       if k not in self.stateful_metrics:
         # In the case that progress bar doesn't have a target value in the first
@@ -908,8 +948,14 @@ class Progbar:
     info = ' - %.0fs' % (now - self._start)
     if current == self.target:
       self._time_at_epoch_end = now
-    if self.verbose == 1:
-      if now - self._last_update < self.interval and not finalize:
+    if self.output_format == 'json':
+      if self._should_render(finalize, now):
+        io_utils.print_msg(
+            json.dumps(self._json_record(current, now, finalize)))
+      elif self.verbose == 1:
+        return
+    elif self.verbose == 1:
+      if not self._should_render(finalize, now):
         return
 
       prev_total_width = self._total_width
@@ -955,15 +1001,7 @@ class Progbar:
         info = ' - ETA: %s' % eta_format
 
       for k in self._values_order:
-        info += ' - %s:' % k
-        if isinstance(self._values[k], list):
-          avg = np.mean(self._values[k][0] / max(1, self._values[k][1]))
-          if abs(avg) > 1e-3:
-            info += ' %.4f' % avg
-          else:
-            info += ' %.4e' % avg
-        else:
-          info += ' %s' % self._values[k]
+        info += self._format_value(k)
 
       self._total_width += len(info)
       if prev_total_width > self._total_width:
@@ -1005,6 +1043,67 @@ class Progbar:
   def add(self, n, values=None):
     self.update(self._seen_so_far + n, values)
 
+  def _should_render(self, finalize=False, now=None):
+    """Returns whether an update at time `now` would be written out."""
+    if finalize:
+      return self.verbose in (1, 2)
+    if self.verbose != 1:
+      return False
+    if now is None:
+      now = time.time()
+    return now - self._last_update >= self.interval
+
+  def _value(self, k):
+    value = self._values[k]
+    if isinstance(value, list):
+      return np.mean(value[0] / max(1, value[1]))
+    return value
+
+  def _format_value(self, k):
+    """Returns the ` - name: value` string of `k`, cached while unchanged."""
+    value = self._values[k]
+    if not isinstance(value, list):
+      return ' - %s: %s' % (k, value)
+    avg = self._value(k)
+    if abs(avg) > 1e-3:
+      # `%.4f` displays the same string for values that round the same.
+      display_key = ('f', round(float(avg), 4))
+    else:
+      display_key = ('e', float(avg))
+    cached = self._formatted_values.get(k)
+    if cached is not None and cached[0] == display_key:
+      return cached[1]
+    if display_key[0] == 'f':
+      formatted = ' - %s: %.4f' % (k, avg)
+    else:
+      formatted = ' - %s: %.4e' % (k, avg)
+    self._formatted_values[k] = (display_key, formatted)
+    return formatted
+
+  def _json_record(self, current, now, finalize):
+    """Returns the JSON-serializable record written in `"json"` mode."""
+    time_per_unit = self._estimate_step_duration(current, now)
+    eta = None
+    if self.target is not None and not finalize:
+      eta = time_per_unit * (self.target - current)
+    metrics = {}
+    for k in self._values_order:
+      value = self._value(k)
+      try:
+        metrics[k] = float(value)
+      except (TypeError, ValueError):
+        metrics[k] = str(value)
+    return {
+        'step': current,
+        'target': self.target,
+        'unit': self.unit_name,
+        'elapsed': now - self._start,
+        'time_per_unit': time_per_unit,
+        'eta': eta,
+        'metrics': metrics,
+        'final': bool(finalize),
+    }
+
   def _format_time(self, time_per_unit, unit_name):
     """format a given duration to display to the user.
 
@@ -16,6 +16,7 @@
 
 
 from functools import partial
+import json
 import os
 import sys
 
@@ -388,6 +389,58 @@ class SerializeKerasObjectTest(tf.test.TestCase):
     self.assertIsInstance(restored, CustomLayer)
 
 
+class ProgbarTest(tf.test.TestCase):
+
+  def test_interval_limits_rendering(self):
+    progbar = generic_utils.Progbar(target=10, interval=3600)
+    with self.captureWritesToStream(sys.stdout) as printed:
+      for step in range(1, 10):
+        progbar.update(step, [('loss', 1.)])
+      progbar.update(10, [('loss', 1.)], finalize=True)
+    output = printed.contents()
+    # Only the first update and the final one are rendered.
+    self.assertIn(' 1/10 [', output)
+    self.assertNotIn(' 5/10 [', output)
+    self.assertIn('10/10 [', output)
+    self.assertIn('loss: 1.0000', output)
+
+  def test_formatted_values_are_cached(self):
+    progbar = generic_utils.Progbar(
+        target=10, stateful_metrics=['acc'], interval=0)
+    with self.captureWritesToStream(sys.stdout) as printed:
+      progbar.update(1, [('acc', 0.5)])
+      formatted = progbar._formatted_values['acc'][1]
+      # The displayed value does not change.
+      progbar.update(2, [('acc', 0.50001)])
+      self.assertIs(progbar._formatted_values['acc'][1], formatted)
+      progbar.update(3, [('acc', 0.75)])
+    self.assertEqual(progbar._formatted_values['acc'][1], ' - acc: 0.7500')
+    self.assertIn('acc: 0.5000', printed.contents())
+    self.assertIn('acc: 0.7500', printed.contents())
+
+  def test_json_output(self):
+    progbar = generic_utils.Progbar(
+        target=3, stateful_metrics=['acc'], output_format='json')
+    with self.captureWritesToStream(sys.stdout) as printed:
+      progbar.update(1, [('loss', 1.), ('acc', 0.5)])
+      progbar.update(3, [('loss', 3.), ('acc', 0.75)])
+    records = [json.loads(line) for line in printed.contents().splitlines()]
+    self.assertLen(records, 2)
+    self.assertEqual(records[0]['step'], 1)
+    self.assertEqual(records[0]['target'], 3)
+    self.assertEqual(records[0]['unit'], 'step')
+    self.assertFalse(records[0]['final'])
+    self.assertIsNotNone(records[0]['eta'])
+    # `loss` is averaged over steps, `acc` is displayed as-is.
+    self.assertAllClose(records[1]['metrics'], {'loss': 7. / 3, 'acc': 0.75})
+    self.assertTrue(records[1]['final'])
+    self.assertIsNone(records[1]['eta'])
+
+  def test_invalid_output_format(self):
+    with self.assertRaisesRegex(ValueError, 'Unknown `output_format`'):
+      generic_utils.Progbar(target=3, output_format='xml')
+
+
 class SliceArraysTest(tf.test.TestCase):
 
   def test_slice_arrays(self):